@@ -0,0 +1,76 @@
+"""
+Compare the radius and nearest neighbor queries of the spatial hash with a brute force scan over all organisms.
+
+Run from the repository root with:
+    python -m benchmarks.spatial_hash
+"""
+
+from __future__ import annotations
+
+import heapq
+import random
+import timeit
+
+from src.terrain.spatial_hash import SpatialHash
+
+ROWS: int = 500
+COLS: int = 500
+POPULATIONS: list[int] = [1_000, 10_000, 100_000]
+RADIUS: float = 8
+K: int = 8
+QUERIES: int = 200
+
+
+def scan_radius(positions: dict[int, tuple[int, int]], row: int, col: int) -> list:
+    squared_radius = RADIUS * RADIUS
+    return [
+        item
+        for item, (item_row, item_col) in positions.items()
+        if (item_row - row) ** 2 + (item_col - col) ** 2 <= squared_radius
+    ]
+
+
+def scan_nearest(positions: dict[int, tuple[int, int]], row: int, col: int) -> list:
+    return heapq.nsmallest(
+        K,
+        positions,
+        key=lambda item: (positions[item][0] - row) ** 2
+        + (positions[item][1] - col) ** 2,
+    )
+
+
+def main() -> None:
+    print(f"{ROWS}x{COLS} tiles, radius {RADIUS}, k {K}, {QUERIES} queries")
+    for population in POPULATIONS:
+        spatial_hash = SpatialHash()
+        positions = {}
+        for item in range(population):
+            position = (random.randrange(ROWS), random.randrange(COLS))
+            spatial_hash.insert(item, *position)
+            positions[item] = position
+        queries = [
+            (random.randrange(ROWS), random.randrange(COLS)) for _ in range(QUERIES)
+        ]
+
+        timings = {
+            "radius hash": lambda: [
+                spatial_hash.query_radius(row, col, RADIUS) for row, col in queries
+            ],
+            "radius scan": lambda: [
+                scan_radius(positions, *query) for query in queries
+            ],
+            "nearest hash": lambda: [
+                spatial_hash.query_nearest(row, col, K) for row, col in queries
+            ],
+            "nearest scan": lambda: [
+                scan_nearest(positions, *query) for query in queries
+            ],
+        }
+        print(f"{population} organisms:")
+        for name, run in timings.items():
+            seconds = timeit.timeit(run, number=1)
+            print(f"    {name:<14}{seconds / QUERIES * 1e6:12.1f} us per query")
+
+
+if __name__ == "__main__":
+    main()
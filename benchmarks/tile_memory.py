@@ -0,0 +1,83 @@
+"""
+Report the memory used per tile by the terrain grid for the screen settings.
+
+Run from the repository root with:
+    python -m benchmarks.tile_memory
+"""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+
+from src.settings import screen
+from src.terrain.grid import Grid
+from src.terrain.tile import Tile
+
+SETTINGS: dict[str, tuple[int, int, int]] = {
+    "laptop": screen.JEREMY_LAPTOP_SETTINGS,
+    "big screen": screen.JEREMY_BIG_SCREEN_SETTINGS,
+}
+
+
+def measure(width: int, height: int, tile_size: int) -> dict[str, float]:
+    """
+    Measure the memory allocated by a grid covering a screen of the given size.
+
+    Parameters:
+        width (int): The width of the screen in pixels.
+        height (int): The height of the screen in pixels.
+        tile_size (int): The size of a tile in pixels.
+
+    Returns:
+        dict[str, float]: The number of tiles and the bytes per tile of the arrays, the tile objects, the neighbor table and in total.
+    """
+    rows, cols = height // tile_size, width // tile_size
+    Tile.get_biome_table()
+
+    tracemalloc.start()
+    grid = Grid(rows, cols, tile_size)
+    total = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tiles = rows * cols
+    arrays = sum(
+        array.nbytes
+        for array in (
+            grid.height,
+            grid.moisture,
+            grid.biome_id,
+            grid.plant_growth,
+            grid.has_water,
+            grid.is_coast,
+            grid.is_border,
+            grid.times_visited,
+            grid.animal_id,
+            grid.plant_id,
+        )
+    )
+    indices, valid = grid.get_neighbor_table()
+    tile_objects = sys.getsizeof(grid.tiles) + sum(
+        sys.getsizeof(tile) for tile in grid.tiles
+    )
+    return {
+        "tiles": tiles,
+        "arrays": arrays / tiles,
+        "tile objects": tile_objects / tiles,
+        "neighbor table": (indices.nbytes + valid.nbytes) / tiles,
+        "total": total / tiles,
+    }
+
+
+def main() -> None:
+    for name, (width, height, tile_size) in SETTINGS.items():
+        result = measure(width, height, tile_size)
+        print(
+            f"{name} ({width}x{height}, tile size {tile_size}): {result['tiles']} tiles"
+        )
+        for key in ["arrays", "tile objects", "neighbor table", "total"]:
+            print(f"    {key:<15}{result[key]:8.1f} bytes per tile")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,10 @@
+import sys
+
+from src.settings import terrain
 from src.simulation import Simulation
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # Start on a terrain snapshot created with "Save Terrain"
+        terrain.update_terrain_snapshot_filename(sys.argv[1])
     Simulation().mainlopp()
@@ -1 +1 @@
-__all__ = ["organism", "plant", "animal"]
+__all__ = ["organism", "organism_store", "plant", "animal", "surface_cache"]
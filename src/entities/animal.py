@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 import random
+from typing import TYPE_CHECKING
 
 import pygame
 
 from ..settings import database, simulation
 from ..terrain.tile import Tile
 from .organism import Organism
+from .organism_store import OrganismStore
 from .properties.dna import DNA
 
+if TYPE_CHECKING:
+    from ..terrain.grid import Grid
+
 
 class Animal(Organism):
     # region class settings
@@ -101,6 +106,10 @@ class Animal(Organism):
 
     # endregion
     # region class properties
+    @property
+    def KIND(self) -> int:
+        return OrganismStore.ANIMAL
+
     @property
     def MAX_HEALTH(self) -> float:
         return Animal._MAX_HEALTH
@@ -200,6 +209,28 @@ class Animal(Organism):
 
         self.parent: Animal | None = parent
 
+    # region population phases
+    @staticmethod
+    def update_population(grid: Grid) -> None:
+        """
+        Use the maintenance energy, age and drown all living animals at once.
+
+        Parameters:
+            grid (Grid): The grid the animals live on.
+
+        Returns:
+            None
+        """
+        Organism._update_population(
+            grid,
+            OrganismStore.ANIMAL,
+            Animal._BASE_ENERGY_MAINTENANCE,
+            Animal._MAX_ENERGY,
+            Animal._MAX_HEALTH,
+        )
+
+    # endregion
+
     # region main methods
     def think(self):
         """
@@ -207,7 +238,7 @@ class Animal(Organism):
 
         The animal evaluates its surroundings to determine the best course of action.
         If the current tile has a plant, it checks the health of the plant and sets it as the best growth.
-        If there is no plant on the current tile, it selects a random neighboring tile as the initial destination.
+        If there is no plant on the current tile, it follows the food field of the world one step towards the nearest plant, or selects a random neighboring tile if no plant can be reached.
         The animal then iterates through all neighboring tiles to find the tile with the highest plant health.
         If a neighboring tile has a higher plant health than the current best growth, it updates the best growth and sets that tile as the destination for movement.
 
@@ -215,21 +246,21 @@ class Animal(Organism):
         """
         super().think()
         if self.tile.has_plant():
-            best_growth = self.tile.plant.sprite.health
+            best_growth = self.tile.plant.health
             destination = None
         else:
             best_growth = 0
-            destination = self.tile.get_random_neigbor()
+            destination = self.tile.get_food_tile() or self.tile.get_random_neigbor()
 
         ns = self.tile.get_neighboring_tiles()
         for n in ns:
             if n.has_animal():
-                if self.attack_power < n.animal.sprite.defense:
+                if self.attack_power < n.animal.defense:
                     continue
             if not n.has_plant():
                 continue
-            if n.plant.sprite.health > best_growth:
-                best_growth = n.plant.sprite.health
+            if n.plant.health > best_growth:
+                best_growth = n.plant.health
                 destination = n
 
         self.desired_tile_movement = destination
@@ -247,10 +278,10 @@ class Animal(Organism):
         if self.desired_tile_movement:
             if self.desired_tile_movement is not self.tile:
                 if self.desired_tile_movement.has_animal():
-                    self.attack(self.desired_tile_movement.animal.sprite)
+                    self.attack(self.desired_tile_movement.animal)
 
         if self.tile.has_plant() and self.wants_to_eat():
-            self.attack(self.tile.plant.sprite)
+            self.attack(self.tile.plant)
 
     def handle_movement(self):
         """
@@ -273,22 +304,25 @@ class Animal(Organism):
 
     # region tiles
     def enter_tile(self, tile: Tile):
-        super().enter_tile(tile)
         if tile.has_animal():
             raise ValueError("Animal trying to enter a tile that is already occupied.")
         else:
+            super().enter_tile(tile)
             if self.tile:
-                self.tile.animal.remove(self)
+                self.leave_tile()
 
             self.tile = tile
             tile.add_animal(self)
 
             self.check_tile_assignment()
 
+    def leave_tile(self):
+        self.tile.remove_animal(self)
+
     def check_tile_assignment(self):
         if not self.tile:
             raise ValueError("Animal does not have a tile!")
-        if not self.tile.animal.has(self):
+        if self.tile.animal is not self:
             raise ValueError("Animal-Tile assignment not equal.")
 
     # endregion
@@ -299,11 +333,12 @@ class Animal(Organism):
         Animal.animals_died += 1
 
         if self.tile.has_plant():
-            self.tile.plant.sprite.energy += self.health * 0.5
+            self.tile.plant.energy += self.health * 0.5
 
         if database.save_csv and database.save_animals_csv:
             self.save_to_csv()
 
+        self.leave_tile()
         self.kill()
 
     def get_energy_maintenance(self) -> float:
@@ -4,20 +4,64 @@ import csv
 import os
 import random
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
+import numpy as np
 import pygame
 
 from ..gui.stat_panel import StatPanel
-from ..settings import database
+from ..settings import database, simulation
 from ..terrain.tile import Tile
+from .organism_store import OrganismStore, StoreColumn
 from .properties.dna import DNA
+from .surface_cache import SurfaceCache
+
+if TYPE_CHECKING:
+    from ..terrain.grid import Grid
 
 
 class Organism(ABC, pygame.sprite.Sprite):
+    """
+    Class representing an organism in the simulation.
+
+    An organism is a handle of a slot in the organism store, its health, energy, age, position, the attributes derived from its DNA and its counters are stored in the columns of the store.
+    The organism itself only holds the objects that can not be stored in an array, like its tile, DNA and parent.
+    It does not own a surface either, its image is taken from a cache of surfaces shared by all organisms of the same size, color and alpha.
+    When the organism dies its slot is freed and its last values are kept in a snapshot, so its stats can still be read.
+    """
+
     SELECTED_ORGANISM_COLOR: pygame.Color = pygame.Color("white")
     SELECTED_ORGANISM_RECT_WIDTH: float = 1
+    SURFACE_CACHE: SurfaceCache = SurfaceCache()
+
+    # region store columns
+    _health = StoreColumn("health")
+    _energy = StoreColumn("energy")
+    tick_age = StoreColumn()
+    row = StoreColumn()
+    col = StoreColumn()
+    attack_power = StoreColumn()
+    defense = StoreColumn()
+    moisture_preference = StoreColumn()
+    height_preference = StoreColumn()
+    min_reproduction_health = StoreColumn()
+    min_reproduction_energy = StoreColumn()
+    reproduction_chance = StoreColumn()
+    energy_to_offspring_ratio = StoreColumn()
+    animals_killed = StoreColumn()
+    plants_killed = StoreColumn()
+    organisms_attacked = StoreColumn()
+    total_energy_gained = StoreColumn()
+    tiles_visited = StoreColumn()
+    num_offspring = StoreColumn()
+    # endregion
 
     # region class properties
+    @property
+    @abstractmethod
+    def KIND(self) -> int:
+        pass
+
     @property
     @abstractmethod
     def MAX_HEALTH(self) -> float:
@@ -68,6 +112,10 @@ class Organism(ABC, pygame.sprite.Sprite):
     ) -> None:
         pygame.sprite.Sprite.__init__(self)
 
+        self.store: OrganismStore = simulation.store
+        self.slot: int | None = self.store.add(self, self.KIND)
+        self.snapshot: dict[str, float | int] | None = None
+
         # region stats
         self.stat_panel: StatPanel = None
         self.animals_killed: int = 0
@@ -84,7 +132,6 @@ class Organism(ABC, pygame.sprite.Sprite):
         # endregion
 
         self.rect: pygame.Rect = rect
-        self.image: pygame.Surface = pygame.Surface(self.rect.size)
 
         self.id = Organism.next_organism_id
         Organism.next_organism_id += 1
@@ -97,19 +144,24 @@ class Organism(ABC, pygame.sprite.Sprite):
         self.tile: Tile = None
 
         self.color: pygame.Color = None
-        self.attack_power: float = None
-        self.moisture_preference: float = None
-        self.height_preference: float = None
-        self.min_reproduction_health: float = None
-        self.min_reproduction_energy: float = None
-        self.reproduction_chance: float = None
-        self.energy_to_offspring_ratio: float = None
-        self.defense: float = None
 
         self._set_attributes_from_dna()
         self.enter_tile(tile)
 
     # region properties
+    @property
+    def image(self) -> pygame.Surface:
+        return Organism.SURFACE_CACHE.get(self.rect.size, self.color, self.get_alpha())
+
+    def get_alpha(self) -> int | None:
+        """
+        Get the alpha value the organism is drawn with.
+
+        Returns:
+            int | None: The alpha value, None if the organism is drawn opaque.
+        """
+        return None
+
     @property
     def health(self) -> float:
         return self._health
@@ -144,7 +196,6 @@ class Organism(ABC, pygame.sprite.Sprite):
             raise ValueError("Trying to set attributes from DNA despite DNA being None")
 
         self.color: pygame.Color = self.dna.color
-        self.image.fill(self.color)
 
         self.attack_power: float = self.dna.attack_power_gene.value
         self.moisture_preference: float = self.dna.prefered_moisture_gene.value
@@ -161,21 +212,58 @@ class Organism(ABC, pygame.sprite.Sprite):
 
     # endregion
 
-    # region main methods
-    def update(self):
+    # region population phases
+    @staticmethod
+    def _update_population(
+        grid: Grid,
+        kind: int,
+        energy_maintenance: float,
+        max_energy: float,
+        max_health: float,
+    ) -> None:
         """
-        Updates the organism by performing various actions and behaviors.
+        Use the maintenance energy, age and drown all living organisms of one kind at once.
 
-        This method is called during each update cycle to update the state of the organism. It performs the following actions in order:
+        These phases do not depend on other organisms, so they are applied to the columns of the organism store with array operations instead of per organism:
 
-        1. Use Maintenance Energy: Decreases the energy of the organism by the maintenance energy cost.
-        2. Handle Aging: Increments the age of the organism by one tick.
-        3. Handle Reproduction: Checks if the organism is able to reproduce based on its health and energy levels. If the criteria for reproduction are met and a random chance is satisfied, the organism reproduces.
-        4. Handle Drowning: Handles the drowning process of the organism.
-        5. Think: Performs any thinking or decision-making processes for the organism.
-        6. Handle Attack: Handles the attack process of the organism.
-        7. Handle Movement: Handles the movement process of the organism.
-        8. Post Update: Performs any post-update actions, such as checking if the organism is still alive and triggering its death if necessary.
+        1. Use Maintenance Energy: Decreases the energy of every organism by the maintenance energy cost, missing energy is taken from its health.
+        2. Handle Aging: Increments the age of every organism by one tick.
+        3. Handle Drowning: Decreases the health of every organism on a water tile.
+
+        Organisms dying in these phases are removed by Organism.remove_dead.
+
+        Parameters:
+            grid (Grid): The grid the organisms live on.
+            kind (int): The kind of the organisms, OrganismStore.ANIMAL or OrganismStore.PLANT.
+            energy_maintenance (float): The energy every organism uses per tick.
+            max_energy (float): The maximum energy of the organisms.
+            max_health (float): The maximum health of the organisms.
+
+        Returns:
+            None
+        """
+        store = simulation.store
+        slots = store.get_slots(kind)
+        if len(slots) == 0:
+            return
+
+        if energy_maintenance:
+            store.add_energy(
+                slots, np.full(len(slots), -energy_maintenance), max_energy, max_health
+            )
+
+        store.tick_age[slots] += 1
+
+        drowning = slots[grid.has_water[store.row[slots], store.col[slots]]]
+        store.health[drowning] -= 10  # TODO update drowning logic
+
+    @staticmethod
+    def remove_dead() -> None:
+        """
+        Let all living organisms without health die.
+
+        The organisms are found with one pass over the health column of the organism store, only they are visited.
+        The health is checked again right before an organism dies, as the death of another organism can change it.
 
         Parameters:
             None
@@ -183,23 +271,28 @@ class Organism(ABC, pygame.sprite.Sprite):
         Returns:
             None
         """
-        self.use_maintanance_energy()
-        self.handle_aging()
-        self.handle_reproduction()
-        self.handle_drowning()
-        self.think()
-        self.handle_attack()
-        self.handle_movement()
-        self._post_update()
+        store = simulation.store
+        dead = np.flatnonzero(store.alive & (store.health <= 0))
+        for organism in [store.handles[slot] for slot in dead.tolist()]:
+            if not organism.is_alive():
+                organism.die()
 
-    def use_maintanance_energy(self):
-        self.energy -= self.get_energy_maintenance()
+    # endregion
 
-    def handle_aging(self):
+    # region main methods
+    def update(self):
         """
-        Handles the aging process of an organism.
+        Updates the organism by performing various actions and behaviors.
+
+        This method is called during each update cycle to update the state of the organism. It performs the following actions in order:
+
+        1. Handle Reproduction: Checks if the organism is able to reproduce based on its health and energy levels. If the criteria for reproduction are met and a random chance is satisfied, the organism reproduces.
+        2. Think: Performs any thinking or decision-making processes for the organism.
+        3. Handle Attack: Handles the attack process of the organism.
+        4. Handle Movement: Handles the movement process of the organism.
+        5. Post Update: Performs any post-update actions, such as checking if the organism is still alive and triggering its death if necessary.
 
-        This method is called during each update cycle to increment the age of the organism by one tick. The 'tick_age' attribute keeps track of the number of ticks the organism has lived.
+        Using maintenance energy, aging and drowning are not part of it, they are applied to the whole population at once before the organisms are updated, see Organism._update_population.
 
         Parameters:
             None
@@ -207,7 +300,11 @@ class Organism(ABC, pygame.sprite.Sprite):
         Returns:
             None
         """
-        self.tick_age += 1
+        self.handle_reproduction()
+        self.think()
+        self.handle_attack()
+        self.handle_movement()
+        self._post_update()
 
     def handle_reproduction(self):
         """
@@ -224,10 +321,6 @@ class Organism(ABC, pygame.sprite.Sprite):
         if self.can_reproduce() and random.random() <= self.reproduction_chance:
             self.reproduce()
 
-    def handle_drowning(self):
-        if self.tile.has_water:
-            self.health -= 10  # TODO update drowning logic
-
     def think(self):
         pass
 
@@ -258,8 +351,14 @@ class Organism(ABC, pygame.sprite.Sprite):
     @abstractmethod
     def enter_tile(self, tile: Tile):
         self.rect.topleft = tile.rect.topleft
+        self.row = tile.row
+        self.col = tile.col
         self.tiles_visited += 1
 
+    @abstractmethod
+    def leave_tile(self):
+        pass
+
     @abstractmethod
     def check_tile_assignment(self):
         pass
@@ -290,6 +389,9 @@ class Organism(ABC, pygame.sprite.Sprite):
             raise ValueError("Organism tries to die despite not being dead.")
         Organism.organisms_died += 1
         self.death_time = pygame.time.get_ticks()
+        if self.slot is not None:
+            self.snapshot = self.store.remove(self.slot)
+            self.slot = None
 
     @abstractmethod
     def get_energy_maintenance(self) -> float:
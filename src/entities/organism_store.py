@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+from collections.abc import Hashable
+
+import numpy as np
+
+
+class OrganismStore:
+    """
+    Class storing the state of all living organisms in typed NumPy columns.
+
+    Every organism occupies one slot, the row of the columns holding its values, the organism objects only hold their slot and read and write through to the columns.
+    This allows updating whole populations with array operations instead of calling a method per organism.
+    Slots of dead organisms are reused by new ones, the columns grow by doubling when all slots are taken.
+
+    Attributes:
+        ANIMAL (int): The kind of animals.
+        PLANT (int): The kind of plants.
+        COLUMNS (dict[str, type]): The name and type of every column.
+        DEFAULT_CAPACITY (int): The default number of slots allocated at first.
+        capacity (int): The number of slots allocated.
+        alive (np.ndarray): Mask of the slots holding a living organism.
+        kind (np.ndarray): The kind of the organism in every slot.
+        handles (list): The organism object of every slot, None for free slots, organisms need a slot and a snapshot attribute.
+
+    Methods:
+        add(handle, kind) -> int: Allocate a slot for an organism.
+        remove(slot) -> dict[str, float | int]: Free the slot of an organism and get its values.
+        get_slots(kind=None) -> np.ndarray: Get the slots of all living organisms.
+        add_energy(slots, amounts, max_energy, max_health) -> None: Add energy to organisms, moving what does not fit into their health.
+        clear() -> None: Remove all organisms and detach them from their slots.
+    """
+
+    ANIMAL: int = 0
+    PLANT: int = 1
+
+    COLUMNS: dict[str, type] = {
+        "health": np.float64,
+        "energy": np.float64,
+        "tick_age": np.int64,
+        "row": np.int32,
+        "col": np.int32,
+        "attack_power": np.float64,
+        "defense": np.float64,
+        "moisture_preference": np.float64,
+        "height_preference": np.float64,
+        "min_reproduction_health": np.float64,
+        "min_reproduction_energy": np.float64,
+        "reproduction_chance": np.float64,
+        "energy_to_offspring_ratio": np.float64,
+        "animals_killed": np.int64,
+        "plants_killed": np.int64,
+        "organisms_attacked": np.int64,
+        "total_energy_gained": np.float64,
+        "tiles_visited": np.int64,
+        "num_offspring": np.int64,
+    }
+    DEFAULT_CAPACITY: int = 1024
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """
+        Initialize an empty OrganismStore.
+
+        Parameters:
+            capacity (int): The number of slots allocated at first. Default is OrganismStore.DEFAULT_CAPACITY.
+
+        Raises:
+            ValueError: If the capacity is smaller than 1.
+
+        Returns:
+            None
+        """
+        if capacity < 1:
+            raise ValueError(f"Capacity {capacity} has to be at least 1.")
+
+        self.capacity: int = capacity
+        self.alive: np.ndarray = np.zeros(capacity, dtype=bool)
+        self.kind: np.ndarray = np.zeros(capacity, dtype=np.int8)
+        for name, dtype in OrganismStore.COLUMNS.items():
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+        self.handles: list[Hashable | None] = [None] * capacity
+
+        self._free_slots: list[int] = list(range(capacity - 1, -1, -1))
+        self._size: int = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, handle: Hashable, kind: int) -> int:
+        """
+        Allocate a slot for an organism with all of its values set to 0.
+
+        Parameters:
+            handle (Hashable): The organism object.
+            kind (int): The kind of the organism, OrganismStore.ANIMAL or OrganismStore.PLANT.
+
+        Returns:
+            int: The slot of the organism.
+        """
+        if not self._free_slots:
+            self._grow()
+        slot = self._free_slots.pop()
+
+        self.alive[slot] = True
+        self.kind[slot] = kind
+        for name in OrganismStore.COLUMNS:
+            getattr(self, name)[slot] = 0
+        self.handles[slot] = handle
+        self._size += 1
+        return slot
+
+    def remove(self, slot: int) -> dict[str, float | int]:
+        """
+        Free the slot of an organism, so it can be reused.
+
+        Parameters:
+            slot (int): The slot of the organism.
+
+        Raises:
+            ValueError: If the slot does not hold a living organism.
+
+        Returns:
+            dict[str, float | int]: The values of the organism at the time it was removed.
+        """
+        if not self.alive[slot]:
+            raise ValueError(f"Slot {slot} does not hold an organism.")
+
+        values = {
+            name: getattr(self, name).item(slot) for name in OrganismStore.COLUMNS
+        }
+        self.alive[slot] = False
+        self.handles[slot] = None
+        self._free_slots.append(slot)
+        self._size -= 1
+        return values
+
+    def get_slots(self, kind: int | None = None) -> np.ndarray:
+        """
+        Get the slots of all living organisms, optionally only of one kind.
+
+        Parameters:
+            kind (int | None): The kind of the organisms, if None organisms of all kinds are included. Default is None.
+
+        Returns:
+            np.ndarray: The slots in ascending order.
+        """
+        if kind is None:
+            return np.flatnonzero(self.alive)
+        return np.flatnonzero(self.alive & (self.kind == kind))
+
+    def add_energy(
+        self,
+        slots: np.ndarray,
+        amounts: np.ndarray,
+        max_energy: float,
+        max_health: float,
+    ) -> None:
+        """
+        Add energy to organisms the way the energy setter of an organism does.
+
+        Energy above the maximum energy is added to the health instead, negative energy is subtracted from the health, the health is capped at the maximum health.
+
+        Parameters:
+            slots (np.ndarray): The slots of the organisms, each slot at most once.
+            amounts (np.ndarray): The energy added to every organism, negative amounts remove energy.
+            max_energy (float): The maximum energy of the organisms.
+            max_health (float): The maximum health of the organisms.
+
+        Returns:
+            None
+        """
+        energy = self.energy[slots] + amounts
+        overflow = np.where(energy > max_energy, energy - max_energy, 0)
+        overflow = np.where(energy < 0, energy, overflow)
+
+        self.energy[slots] = np.clip(energy, 0, max_energy)
+        self.health[slots] = np.minimum(self.health[slots] + overflow, max_health)
+
+    def clear(self) -> None:
+        """
+        Remove all organisms.
+
+        Every organism is detached from its slot the way a dying organism is, its slot is set to None and its last values are kept in its snapshot.
+        Otherwise organisms still holding their slot would read and write the columns of the organisms reusing it.
+
+        Returns:
+            None
+        """
+        for slot in self.get_slots().tolist():
+            handle = self.handles[slot]
+            handle.snapshot = self.remove(slot)
+            handle.slot = None
+        self.alive[:] = False
+        self.handles = [None] * self.capacity
+        self._free_slots = list(range(self.capacity - 1, -1, -1))
+        self._size = 0
+
+    def _grow(self) -> None:
+        """
+        Double the number of slots.
+
+        Returns:
+            None
+        """
+        old_capacity = self.capacity
+        self.capacity *= 2
+        for name in ["alive", "kind", *OrganismStore.COLUMNS]:
+            column = getattr(self, name)
+            grown = np.zeros(self.capacity, dtype=column.dtype)
+            grown[:old_capacity] = column
+            setattr(self, name, grown)
+        self.handles += [None] * old_capacity
+        self._free_slots += list(range(self.capacity - 1, old_capacity - 1, -1))
+
+
+class StoreColumn:
+    """
+    Class representing an attribute of an organism that is stored in a column of the organism store.
+
+    Reading and writing the attribute reads and writes the value in the slot of the organism.
+    Once the organism has been removed from the store its last values are read from its snapshot instead.
+    """
+
+    def __init__(self, column: str | None = None) -> None:
+        """
+        Initialize a StoreColumn.
+
+        Parameters:
+            column (str | None): The name of the column, if None it is the name of the attribute. Default is None.
+
+        Returns:
+            None
+        """
+        self.name: str | None = column
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        if self.name is None:
+            self.name = name
+
+    def __get__(self, organism, owner: type | None = None):
+        if organism is None:
+            return self
+        if organism.slot is None:
+            return organism.snapshot[self.name]
+        return getattr(organism.store, self.name).item(organism.slot)
+
+    def __set__(self, organism, value) -> None:
+        if organism.slot is None:
+            organism.snapshot[self.name] = value
+        else:
+            getattr(organism.store, self.name)[organism.slot] = value
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
 import random
+from typing import TYPE_CHECKING
 
+import numpy as np
 import pygame
 
 from ..settings import database, simulation
 from ..terrain.tile import Tile
 from .organism import Organism
+from .organism_store import OrganismStore
 from .properties.dna import DNA
 
+if TYPE_CHECKING:
+    from ..terrain.grid import Grid
+
 
 class Plant(Organism):
     # region class settings
@@ -102,6 +108,10 @@ class Plant(Organism):
 
     # endregion
     # region class properties
+    @property
+    def KIND(self) -> int:
+        return OrganismStore.PLANT
+
     @property
     def MAX_HEALTH(self) -> float:
         return Plant._MAX_HEALTH
@@ -122,6 +132,9 @@ class Plant(Organism):
     def MIN_ALPHA(self) -> float:
         return Plant._MIN_ALPHA
 
+    def get_alpha(self) -> int | None:
+        return int(Plant._MAX_ALPHA)
+
     # endregion
     # region stats
     plants_birthed: int = 0
@@ -192,23 +205,41 @@ class Plant(Organism):
             energy,
             dna,
         )
-        self.image.set_alpha(100)
         self.parent: Plant | None = parent
 
-    # region main methods
-    def update(self):
-        super().update()
-        self.photosynthesise()
+    # region population phases
+    @staticmethod
+    def update_population(grid: Grid) -> None:
+        """
+        Use the maintenance energy, age and drown all living plants at once.
+
+        Parameters:
+            grid (Grid): The grid the plants live on.
 
-    def photosynthesise(self):
+        Returns:
+            None
         """
-        Calculate the energy gained through photosynthesis.
+        Organism._update_population(
+            grid,
+            OrganismStore.PLANT,
+            Plant._BASE_ENERGY_MAINTENANCE,
+            Plant._MAX_ENERGY,
+            Plant._MAX_HEALTH,
+        )
 
-        This method calculates the energy gained by the plant through photosynthesis. It performs the following steps:
+    # endregion
+
+    # region main methods
+    @staticmethod
+    def photosynthesise(grid: Grid) -> None:
+        """
+        Add the energy gained through photosynthesis to all living plants at once.
+
+        The energy is calculated for all plants in one pass over the columns of the organism store, it performs the following steps:
 
         1. Base photosynthesis energy calculation:
-        - Generate a random number between 0 and 1.
-        - Multiply it by the plant's growth potential and the energy multiplier for photosynthesis.
+        - Generate a random number between 0 and 1 for every plant.
+        - Multiply it by the plant growth potential of the tile of the plant and the energy multiplier for photosynthesis.
 
         2. Calculate the preference match:
         - Calculate the difference between the tile's height and the plant's height preference.
@@ -218,21 +249,36 @@ class Plant(Organism):
         3. Adjust the base energy gain:
         - Multiply the base energy by the average of the height preference match and moisture preference match.
 
-        4. Add the adjusted energy gain to the plant's energy.
+        4. Add the adjusted energy gain to the plant's energy, energy above the maximum energy is added to its health.
+
+        This method is called by the world once per update after the organisms have been updated.
+
+        Parameters:
+            grid (Grid): The grid the plants live on.
 
-        This method is called during the plant's update process to simulate photosynthesis and increase its energy level.
+        Returns:
+            None
         """
+        store = simulation.store
+        slots = store.get_slots(OrganismStore.PLANT)
+        if len(slots) == 0:
+            return
+        rows = store.row[slots]
+        cols = store.col[slots]
+
         # Base photosynthesis energy calculation
         base_energy = (
-            random.random()
-            * self.tile.plant_growth_potential
+            np.random.random(len(slots))
+            * grid.plant_growth[rows, cols]
             * Plant._PHOTOSYNTHESIS_ENERGY_MULTIPLIER
         )
 
         # Calculate the preference match
-        height_preference_match = 1 - abs(self.tile.height - self.height_preference)
-        moisture_preference_match = 1 - abs(
-            self.tile.moisture - self.moisture_preference
+        height_preference_match = 1 - np.abs(
+            grid.height[rows, cols] - store.height_preference[slots]
+        )
+        moisture_preference_match = 1 - np.abs(
+            grid.moisture[rows, cols] - store.moisture_preference[slots]
         )
 
         # Combine the matches to adjust the base energy gain
@@ -240,7 +286,9 @@ class Plant(Organism):
             base_energy * (height_preference_match + moisture_preference_match) / 2
         )
 
-        self.energy += adjusted_energy_gain
+        store.add_energy(
+            slots, adjusted_energy_gain, Plant._MAX_ENERGY, Plant._MAX_HEALTH
+        )
 
     # endregion
 
@@ -249,17 +297,20 @@ class Plant(Organism):
         super().enter_tile(tile)
 
         if self.tile:
-            self.tile.plant.remove(self)
+            self.leave_tile()
 
         self.tile = tile
         tile.add_plant(self)
 
         self.check_tile_assignment()
 
+    def leave_tile(self):
+        self.tile.remove_plant(self)
+
     def check_tile_assignment(self):
         if not self.tile:
             raise ValueError("Plant does not have a tile!")
-        if not self.tile.plant.has(self):
+        if self.tile.plant is not self:
             raise ValueError("Plant-Tile assignment not equal.")
 
     # endregion
@@ -273,6 +324,7 @@ class Plant(Organism):
             if database.save_plants_csv:
                 self.save_to_csv()
 
+        self.leave_tile()
         self.kill()
 
     def get_energy_maintenance(self) -> float:
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import pygame
+
+
+class SurfaceCache:
+    """
+    Class representing a cache of single colored surfaces shared by all organisms drawn with the same size, color and alpha.
+
+    Organisms do not own a surface, they get theirs from the cache when they are drawn, so births and deaths do not allocate any pixel buffers.
+    As colors mutate over the generations the cache is bounded, the least recently used surface is dropped once it is full.
+
+    Attributes:
+        DEFAULT_MAX_SIZE (int): The default maximum number of cached surfaces.
+        max_size (int): The maximum number of cached surfaces.
+
+    Methods:
+        get(size, color, alpha=None) -> pygame.Surface: Get the surface of a size filled with a color.
+        clear() -> None: Drop all cached surfaces.
+    """
+
+    DEFAULT_MAX_SIZE: int = 4096
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """
+        Initialize an empty SurfaceCache.
+
+        Parameters:
+            max_size (int): The maximum number of cached surfaces. Default is SurfaceCache.DEFAULT_MAX_SIZE.
+
+        Raises:
+            ValueError: If the maximum size is smaller than 1.
+
+        Returns:
+            None
+        """
+        if max_size < 1:
+            raise ValueError(f"Maximum size {max_size} has to be at least 1.")
+
+        self.max_size: int = max_size
+        self._surfaces: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def get(
+        self,
+        size: tuple[int, int],
+        color: pygame.Color,
+        alpha: int | None = None,
+    ) -> pygame.Surface:
+        """
+        Get the surface of a size filled with a color, it is created on the first request.
+
+        The returned surface is shared and must not be drawn on.
+
+        Parameters:
+            size (tuple[int, int]): The width and height of the surface.
+            color (pygame.Color): The color the surface is filled with.
+            alpha (int | None): The alpha value of the whole surface, if None the surface is opaque. Default is None.
+
+        Returns:
+            pygame.Surface: The surface.
+        """
+        key = (size[0], size[1], color[0], color[1], color[2], alpha)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+
+        surface = pygame.Surface(size)
+        surface.fill(color)
+        if alpha is not None:
+            surface.set_alpha(alpha)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        """
+        Drop all cached surfaces.
+
+        Returns:
+            None
+        """
+        self._surfaces.clear()
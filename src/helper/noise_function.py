@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-import math
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 
+import numpy as np
 import opensimplex
-import pygame
 import pygame_menu
 
+from .noise_kernel import NoiseKernel
 from .setting import BoundedSetting, Setting
 
 
@@ -24,6 +29,8 @@ class NoiseFunction:
         FUDGE_MAX (float): The maximum value for fudge settings.
         FUNCTION_ID (int): The ID assigned to each NoiseFunction instance.
         DEFAULT_WEIGHT (int): The default weight value.
+        _process_pool (ProcessPoolExecutor): The process pool shared by all parallel noise evaluations, created on first use and shut down at exit.
+        _process_pool_lock (threading.Lock): The lock guarding the creation and shutdown of the process pool.
 
     Methods:
         __init__(self, *args, factor_x=1, factor_y=1, offset_x=0, offset_y=0, pow_x=1, pow_y=1, pow=1, fudge=1.2) -> None:
@@ -32,17 +39,28 @@ class NoiseFunction:
             Calculate the transformed coordinates based on the input x and y values.
         noise(self, x: float, y: float) -> float:
             Calculate the noise value at the given coordinates using Perlin noise.
+        function_array(self, xs: np.ndarray, ys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+            Calculate the transformed coordinates for arrays of x and y values.
+        noise_array(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+            Calculate the noise values for every combination of the given x and y coordinates.
+        get_kernel(self) -> NoiseKernel:
+            Return the kernel compiled from the current settings, compiling it again if a setting changed.
         add_submenu(self, menu: pygame_menu.Menu, add_randomiser=False) -> pygame_menu.Menu:
             Add a submenu to the specified menu for the NoiseFunction instance.
         randomise(self) -> None:
             Randomise the values of all settings in the NoiseFunction instance using a Gaussian distribution.
-        _normalise(cls, value) -> float:
-            Normalize the input value to the range [0, 1] using a linear transformation.
+        get_parameters(self) -> tuple[float, ...]:
+            Return the current values of all settings of the NoiseFunction instance.
+        set_parameters(self, parameters: tuple[float, ...]) -> None:
+            Restore the values of all settings of the NoiseFunction instance without calling their post update methods.
+        from_parameters(cls, parameters: tuple[float, ...]) -> NoiseFunction:
+            Create a NoiseFunction instance without post update methods from the values of its settings.
         weigh(cls, x: float, y: float, functions: list[NoiseFunction], weights: list[float] = None) -> float:
             Calculate the weighted average of noise values generated by multiple NoiseFunction instances.
-
-    Raises:
-        ValueError: If the noise value is not within the range [0, 1].
+        weigh_array(cls, xs: np.ndarray, ys: np.ndarray, functions: list[NoiseFunction], weights: list[float] = None) -> np.ndarray:
+            Calculate the weighted average noise field generated by multiple NoiseFunction instances.
+        weigh_array_parallel(cls, xs: np.ndarray, ys: np.ndarray, functions: list[NoiseFunction], weights: list[float] = None, processes: int = None) -> np.ndarray:
+            Calculate the same field as weigh_array by splitting the rows into bands that are evaluated by a process pool.
 
     Note:
         This class is designed to work with Perlin noise functions and provides settings for transformation and normalization of noise values.
@@ -59,6 +77,8 @@ class NoiseFunction:
     FUDGE_MAX = 1.5
     FUNCTION_ID = 0
     DEFAULT_WEIGHT = 1
+    _process_pool: ProcessPoolExecutor | None = None
+    _process_pool_lock: threading.Lock = threading.Lock()
 
     def __init__(
         self,
@@ -171,6 +191,7 @@ class NoiseFunction:
         self.settings.append(self.fudge)
 
         self.menu: pygame_menu.Menu = None
+        self._kernel: NoiseKernel | None = None
 
     def function(self, x: float, y: float) -> tuple[float, float]:
         """
@@ -183,26 +204,8 @@ class NoiseFunction:
         Returns:
         tuple[float, float]: A tuple containing the transformed x and y coordinates.
         """
-        _x = x * self.factor_x._value
-        _y = y * self.factor_y._value
-
-        try:
-            _x = math.pow(
-                _x, self.pow_x._value
-            )  # TODO figure cause of ValueError "math domain error" in math.pow
-        except ValueError:
-            print("math domain error!")
-        try:
-            _y = math.pow(
-                _y, self.pow_y._value
-            )  # TODO figure cause of ValueError "math domain error" in math.pow
-        except ValueError:
-            print("math domain error!")
-
-        _x += self.offset_x._value
-        _y += self.offset_y._value
-
-        return _x, _y
+        _xs, _ys = self.function_array(np.array([x]), np.array([y]))
+        return float(_xs[0]), float(_ys[0])
 
     def noise(self, x: float, y: float) -> float:
         """
@@ -213,26 +216,59 @@ class NoiseFunction:
         y (float): The y-coordinate value.
 
         Returns:
-        float: The noise value at the specified coordinates, normalized to the range [0, 1].
-        Raises:
-        ValueError: If the noise value is not within the range [0, 1].
-        """
-        _x, _y = self.function(x, y)
-        _noise = opensimplex.noise2(_x, _y)
-        _noise = NoiseFunction._normalise(_noise)
-        _noise *= self.fudge._value
-        try:
-            value = math.pow(
-                _noise, self.pow._value
-            )  # TODO figure cause of ValueError "math domain error" in math.pow
-        except ValueError:
-            print("math domain error!")
-            value = _noise
-
-        value = pygame.math.clamp(value, 0, 1)
-        if not (0 <= value <= 1):
-            raise ValueError(f"noise value not in range [0, 1] {value}")
-        return value
+        float: The noise value at the specified coordinates, clamped to the range [0, 1].
+        """
+        return float(self.noise_array(np.array([x]), np.array([y]))[0, 0])
+
+    def function_array(
+        self, xs: np.ndarray, ys: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate the transformed coordinates for arrays of x and y values.
+
+        The transformation of the x and y coordinates is independent of each other, so the coordinates of a whole grid can be transformed by only transforming its columns and rows.
+        Coordinates for which a power is not defined are left unchanged by it.
+
+        Parameters:
+        xs (np.ndarray): The x-coordinate values.
+        ys (np.ndarray): The y-coordinate values.
+
+        Returns:
+        tuple[np.ndarray, np.ndarray]: A tuple containing the transformed x and y coordinates.
+        """
+        return self.get_kernel().transform(xs, ys)
+
+    def noise_array(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """
+        Calculate the noise values for every combination of the given x and y coordinates in one batched call.
+
+        This is the array equivalent of NoiseFunction.noise, value [row, col] of the result corresponds to noise(xs[col], ys[row]).
+
+        Parameters:
+        xs (np.ndarray): The x-coordinate values.
+        ys (np.ndarray): The y-coordinate values.
+
+        Returns:
+        np.ndarray: A 2D array of shape (len(ys), len(xs)) with noise values clamped to the range [0, 1].
+        """
+        return self.get_kernel().evaluate(xs, ys)
+
+    def get_kernel(self) -> NoiseKernel:
+        """
+        Return the kernel compiled from the current values of the settings.
+
+        The kernel is compiled again whenever the value of any setting differs from the values it was compiled from, which also covers values restored by NoiseFunction.set_parameters.
+
+        Parameters:
+        None
+
+        Returns:
+        NoiseKernel: The compiled kernel.
+        """
+        parameters = self.get_parameters()
+        if self._kernel is None or self._kernel.parameters != parameters:
+            self._kernel = NoiseKernel(parameters)
+        return self._kernel
 
     def add_submenu(
         self, menu: pygame_menu.Menu, add_randomiser=False
@@ -278,36 +314,80 @@ class NoiseFunction:
         """
         Randomise the values of all settings in the NoiseFunction instance using a Gaussian distribution.
 
+        The settings are changed in a single batch, so their post update methods are only called once.
+
         Parameters:
         None
 
         Returns:
         None
         """
-        for setting in self.settings:
-            setting.randomise_value(type="gauss")
+        with Setting.batch():
+            for setting in self.settings:
+                setting.randomise_value(type="gauss")
 
-    @classmethod
-    def _normalise(cls, value) -> float:
+    def get_parameters(self) -> tuple[float, ...]:
+        """
+        Return the current values of all settings of the NoiseFunction instance.
+
+        Two NoiseFunction instances with equal parameters generate the same noise.
+
+        Parameters:
+        None
+
+        Returns:
+        tuple[float, ...]: The values of the settings in the order of NoiseFunction.settings.
+        """
+        return tuple(setting._value for setting in self.settings)
+
+    def set_parameters(self, parameters: tuple[float, ...]) -> None:
         """
-        Normalize the input value to the range [0, 1] using a linear transformation.
+        Restore the values of all settings of the NoiseFunction instance.
 
-        This should only be used together with opensimplex.snoise2(x, y) as this method returns values between -1 and 1 and we only want values between 0 and 1
+        The post update methods of the settings are not called, the caller is responsible for updating whatever depends on the noise.
 
         Parameters:
-        value: The input value to be normalized.
+        parameters (tuple[float, ...]): The values of the settings as returned by NoiseFunction.get_parameters.
 
         Returns:
-        float: The normalized value within the range [0, 1].
+        None
 
         Raises:
-        ValueError: If the normalized value is not within the range [0, 1].
+        ValueError: If the number of parameters does not match the number of settings.
         """
-        value += 1
-        value /= 2
-        if not (0 <= value <= 1):
-            raise ValueError(f"noise value not in range [0, 1] {value}")
-        return value
+        if len(parameters) != len(self.settings):
+            raise ValueError(
+                f"Expected {len(self.settings)} parameters but got {len(parameters)}."
+            )
+        for setting, value in zip(self.settings, parameters):
+            setting._value = value
+            if setting.widget:
+                setting.widget.set_value(value)
+
+    @classmethod
+    def from_parameters(cls, parameters: tuple[float, ...]) -> NoiseFunction:
+        """
+        Create a NoiseFunction instance from the values of its settings.
+
+        The created instance has no post update methods, which makes it safe to send to other processes.
+
+        Parameters:
+        parameters (tuple[float, ...]): The values of the settings as returned by NoiseFunction.get_parameters.
+
+        Returns:
+        NoiseFunction: A NoiseFunction instance generating the same noise.
+        """
+        factor_x, factor_y, offset_x, offset_y, pow_x, pow_y, pow, fudge = parameters
+        return cls(
+            factor_x=factor_x,
+            factor_y=factor_y,
+            offset_x=offset_x,
+            offset_y=offset_y,
+            pow_x=pow_x,
+            pow_y=pow_y,
+            pow=pow,
+            fudge=fudge,
+        )
 
     @classmethod
     def weigh(
@@ -351,3 +431,147 @@ class NoiseFunction:
             raise ValueError(f"noise value not in range [0, 1] {value}")
 
         return value
+
+    @classmethod
+    def weigh_array(
+        cls,
+        xs: np.ndarray,
+        ys: np.ndarray,
+        functions: list[NoiseFunction],
+        weights: list[float] = None,
+    ) -> np.ndarray:
+        """
+        Calculate the weighted average of the noise fields generated by multiple NoiseFunction instances for every combination of the given x and y coordinates.
+
+        This is the array equivalent of NoiseFunction.weigh.
+
+        Parameters:
+        xs (np.ndarray): The x-coordinate values.
+        ys (np.ndarray): The y-coordinate values.
+        functions (list[NoiseFunction]): A list of NoiseFunction instances to calculate noise values from.
+        weights (list[float], optional): A list of weights corresponding to each NoiseFunction instance. If not provided, defaults to "NoiseFunction.DEFAULT_WEIGHT" for all functions missing weights.
+
+        Returns:
+        np.ndarray: A 2D array of shape (len(ys), len(xs)) with the weighted average noise values, normalized to the range [0, 1].
+
+        Raises:
+        ValueError: If the list of functions is empty.
+        """
+        if not functions:
+            raise ValueError("The list of functions cannot be empty.")
+
+        weights = list(weights) if weights else []
+        while len(weights) < len(functions):
+            weights.append(cls.DEFAULT_WEIGHT)
+
+        total_noise = np.zeros((len(ys), len(xs)))
+        weight_sum = 0
+        for function, weight in zip(functions, weights):
+            total_noise += function.noise_array(xs, ys) * weight
+            weight_sum += weight
+
+        return total_noise / weight_sum
+
+    @classmethod
+    def weigh_array_parallel(
+        cls,
+        xs: np.ndarray,
+        ys: np.ndarray,
+        functions: list[NoiseFunction],
+        weights: list[float] = None,
+        processes: int = None,
+    ) -> np.ndarray:
+        """
+        Calculate the weighted average noise field like NoiseFunction.weigh_array, evaluating bands of rows in a process pool.
+
+        Every value only depends on its own coordinates, so the assembled field is bit-identical to the one of NoiseFunction.weigh_array.
+
+        Parameters:
+        xs (np.ndarray): The x-coordinate values.
+        ys (np.ndarray): The y-coordinate values.
+        functions (list[NoiseFunction]): A list of NoiseFunction instances to calculate noise values from.
+        weights (list[float], optional): A list of weights corresponding to each NoiseFunction instance. If not provided, defaults to "NoiseFunction.DEFAULT_WEIGHT" for all functions missing weights.
+        processes (int, optional): The number of row bands to split the field into. Defaults to the number of CPUs.
+
+        Returns:
+        np.ndarray: A 2D array of shape (len(ys), len(xs)) with the weighted average noise values.
+
+        Raises:
+        ValueError: If the list of functions is empty.
+        """
+        if not functions:
+            raise ValueError("The list of functions cannot be empty.")
+
+        if processes is None:
+            processes = os.cpu_count() or 1
+
+        pool = cls._get_process_pool()
+        parameters = [function.get_parameters() for function in functions]
+        weights = list(weights) if weights else None
+        bands = np.array_split(np.asarray(ys), max(1, min(processes, len(ys))))
+        futures = [
+            pool.submit(
+                _weigh_band, opensimplex.get_seed(), parameters, weights, xs, band
+            )
+            for band in bands
+        ]
+        return np.vstack([future.result() for future in futures])
+
+    @classmethod
+    def _get_process_pool(cls) -> ProcessPoolExecutor:
+        """
+        Get the process pool shared by all parallel noise evaluations, creating it on first use.
+
+        The pool can be created from the background generation thread, so its workers are spawned instead of forked from the multithreaded process.
+        It is shut down when the interpreter exits, so no worker processes outlive the simulation.
+
+        Returns:
+        ProcessPoolExecutor: The process pool.
+        """
+        with cls._process_pool_lock:
+            if cls._process_pool is None:
+                cls._process_pool = ProcessPoolExecutor(
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+                atexit.register(cls.shutdown_process_pool)
+            return cls._process_pool
+
+    @classmethod
+    def shutdown_process_pool(cls) -> None:
+        """
+        Shut down the process pool shared by all parallel noise evaluations, it is created again on the next use.
+
+        Returns:
+        None
+        """
+        with cls._process_pool_lock:
+            if cls._process_pool is not None:
+                cls._process_pool.shutdown()
+                cls._process_pool = None
+                atexit.unregister(cls.shutdown_process_pool)
+
+
+def _weigh_band(
+    seed: int,
+    parameters: list[tuple[float, ...]],
+    weights: list[float] | None,
+    xs: np.ndarray,
+    ys: np.ndarray,
+) -> np.ndarray:
+    """
+    Calculate the weighted average noise field of a band of rows inside a worker process.
+
+    Parameters:
+    seed (int): The opensimplex seed of the calling process.
+    parameters (list[tuple[float, ...]]): The parameters of the NoiseFunction instances.
+    weights (list[float] | None): The weights of the NoiseFunction instances.
+    xs (np.ndarray): The x-coordinate values.
+    ys (np.ndarray): The y-coordinate values of the band.
+
+    Returns:
+    np.ndarray: A 2D array of shape (len(ys), len(xs)) with the weighted average noise values.
+    """
+    if opensimplex.get_seed() != seed:
+        opensimplex.seed(seed)
+    functions = [NoiseFunction.from_parameters(p) for p in parameters]
+    return NoiseFunction.weigh_array(xs, ys, functions, weights)
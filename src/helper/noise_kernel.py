@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+import opensimplex
+
+
+class NoiseKernel:
+    """
+    Class representing the compiled evaluation of a NoiseFunction for one configuration of its settings.
+
+    Everything that only depends on the settings is resolved when the kernel is created: the power of every axis and of the noise is reduced to the cheapest equivalent array operation, the domain of fractional powers is handled by masking instead of catching errors and normalization and fudge are folded into a single scale.
+    Evaluating the kernel only consists of whole array operations.
+
+    Attributes:
+        parameters (tuple[float, ...]): The values of the settings the kernel was compiled from, in the order of NoiseFunction.get_parameters.
+
+    Methods:
+        transform(xs, ys) -> tuple[np.ndarray, np.ndarray]: Transform arrays of x and y coordinates.
+        evaluate(xs, ys) -> np.ndarray: Calculate the noise values for every combination of the given x and y coordinates.
+    """
+
+    def __init__(self, parameters: tuple[float, ...]) -> None:
+        """
+        Compile a NoiseKernel from the values of the settings of a NoiseFunction.
+
+        Parameters:
+            parameters (tuple[float, ...]): The values of the settings as returned by NoiseFunction.get_parameters.
+
+        Returns:
+            None
+        """
+        factor_x, factor_y, offset_x, offset_y, pow_x, pow_y, pow, fudge = parameters
+        self.parameters: tuple[float, ...] = tuple(parameters)
+
+        self._factor_x: float = factor_x
+        self._factor_y: float = factor_y
+        self._offset_x: float = offset_x
+        self._offset_y: float = offset_y
+        self._power_x: Callable[[np.ndarray], np.ndarray] = NoiseKernel._compile_power(
+            pow_x
+        )
+        self._power_y: Callable[[np.ndarray], np.ndarray] = NoiseKernel._compile_power(
+            pow_y
+        )
+        self._power: Callable[[np.ndarray], np.ndarray] = NoiseKernel._compile_power(
+            pow
+        )
+        # Normalising from [-1, 1] to [0, 1] and applying the fudge in one multiplication
+        self._scale: float = fudge / 2
+
+    def transform(
+        self, xs: np.ndarray, ys: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Transform arrays of x and y coordinates by the factors, powers and offsets of the kernel.
+
+        Coordinates for which a power is not defined are left unchanged by it.
+
+        Parameters:
+            xs (np.ndarray): The x-coordinate values.
+            ys (np.ndarray): The y-coordinate values.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: A tuple containing the transformed x and y coordinates.
+        """
+        _xs = self._power_x(np.asarray(xs, dtype=np.float64) * self._factor_x)
+        _ys = self._power_y(np.asarray(ys, dtype=np.float64) * self._factor_y)
+
+        _xs += self._offset_x
+        _ys += self._offset_y
+
+        return _xs, _ys
+
+    def evaluate(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """
+        Calculate the noise values for every combination of the given x and y coordinates.
+
+        Parameters:
+            xs (np.ndarray): The x-coordinate values.
+            ys (np.ndarray): The y-coordinate values.
+
+        Returns:
+            np.ndarray: A 2D array of shape (len(ys), len(xs)) with noise values clamped to the range [0, 1].
+        """
+        _xs, _ys = self.transform(xs, ys)
+        values = opensimplex.noise2array(_xs, _ys)
+        values += 1
+        values *= self._scale
+        # The scaled noise is never negative, so the power is always defined
+        values = self._power(values)
+        return np.clip(values, 0, 1, out=values)
+
+    @staticmethod
+    def _compile_power(exponent: float) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        Get the cheapest array operation raising every value to the given exponent.
+
+        Negative values are left unchanged for fractional exponents, for which their power is not defined.
+
+        Parameters:
+            exponent (float): The exponent.
+
+        Returns:
+            Callable[[np.ndarray], np.ndarray]: The operation, it may return its argument.
+        """
+        if exponent == 0:
+            return np.ones_like
+        if exponent == 1:
+            return lambda values: values
+        if exponent == 2:
+            return np.square
+        if float(exponent).is_integer():
+            return lambda values: np.power(values, exponent)
+        return lambda values: np.where(
+            values < 0, values, np.power(np.abs(values), exponent)
+        )
@@ -1,5 +1,7 @@
 import random
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Callable, Iterator
 
 import pygame_menu
 
@@ -15,14 +17,20 @@ class Setting(ABC):
         _onreturn (bool): Flag indicating if the setting updates on return.
         _onchange (bool): Flag indicating if the setting updates on change.
         post_update_methods (list): List of methods to call after updating the setting.
+        _batch_depth (int): The number of currently open batches of all settings.
+        _pending_updates (dict): The post update methods suspended by the open batches, in the order they were first requested.
 
     Methods:
-        post_update(self) -> None: Calls all post update methods.
+        post_update(self) -> None: Calls all post update methods, or suspends them while a batch is open.
+        batch(cls) -> Iterator[None]: Context manager suspending post update methods of all settings and calling each of them once when it is closed.
         set_value(self, new_value: float) -> None: Abstract method to set the value of the setting.
         randomise_value(self, type: str = "uniform") -> None: Abstract method to randomize the value of the setting.
         add_controller_to_menu(self, menu: pygame_menu.Menu, randomiser: bool = False) -> None: Abstract method to add the setting controller to a menu.
     """
 
+    _batch_depth: int = 0
+    _pending_updates: dict[Callable, None] = {}
+
     # TODO think of making value an optional argument and if _mid existst then setting value equal to it else it being 0
     def __init__(
         self, *args, value: float = 0, name: str = "None", type: str = "onreturn"
@@ -65,6 +73,8 @@ class Setting(ABC):
         """
         Calls all post update methods.
 
+        While a batch is open the methods are not called but remembered, so they are called once when the batch is closed.
+
         Parameters:
             None
 
@@ -73,7 +83,38 @@ class Setting(ABC):
         """
         if self.post_update_methods:
             for method in self.post_update_methods:
-                method()
+                if Setting._batch_depth > 0:
+                    Setting._pending_updates[method] = None
+                else:
+                    method()
+
+    @classmethod
+    @contextmanager
+    def batch(cls) -> Iterator[None]:
+        """
+        Context manager changing any number of settings as a single transaction.
+
+        Post update methods requested by any setting inside the batch are suspended and coalesced, every distinct method is called exactly once when the outermost batch is closed, in the order it was first requested.
+        The methods are called even if the batch is left by an exception, as the changed values have already been applied.
+
+        Example:
+            with Setting.batch():
+                for setting in settings:
+                    setting.randomise_value()
+
+        Yields:
+            None
+        """
+        Setting._batch_depth += 1
+        try:
+            yield
+        finally:
+            Setting._batch_depth -= 1
+            if Setting._batch_depth == 0:
+                pending = list(Setting._pending_updates)
+                Setting._pending_updates.clear()
+                for method in pending:
+                    method()
 
     @abstractmethod
     def set_value(self, new_value: float) -> None:
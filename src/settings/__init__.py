@@ -1 +1 @@
-__all__ = ["database", "screen", "simulation"]
+__all__ = ["database", "screen", "simulation", "terrain"]
@@ -1,13 +1,21 @@
 import pygame
 
+from ..entities.organism_store import OrganismStore
+
 # TODO think of a way to have these variables in the world class
 
 organisms = pygame.sprite.Group()
 animals = pygame.sprite.Group()
 plants = pygame.sprite.Group()
+store = OrganismStore()
 
 
 def reset_organisms():
+    # Free the tiles of all living organisms, also of the ones not added to a group
+    for organism in store.handles:
+        if organism is not None:
+            organism.leave_tile()
+    store.clear()
     organisms.empty()
     animals.empty()
     plants.empty()
@@ -0,0 +1,12 @@
+import datetime
+
+terrain_snapshot_filename: str = ""
+
+
+def update_terrain_snapshot_filename(value: str):
+    global terrain_snapshot_filename
+    terrain_snapshot_filename = value
+
+
+def get_new_terrain_snapshot_filename() -> str:
+    return f'data/terrain_{datetime.datetime.now().strftime("%Y%m%d%H%M%S")}.npz'
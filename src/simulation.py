@@ -5,7 +5,7 @@ from .entities.animal import Animal
 from .entities.plant import Plant
 from .entities.properties.dna import DNA
 from .entities.properties.gene import ColorComponentGene, Gene
-from .settings import database, screen, simulation
+from .settings import database, screen, simulation, terrain
 from .terrain.tile import Tile
 from .terrain.world import World
 
@@ -43,6 +43,7 @@ class Simulation:
         set_running: Sets the running state of the simulation.
         clear_organisms: Clears all organisms from the simulation.
         reset_stats: Resets the statistics of the simulation.
+        save_terrain: Saves the terrain of the world to a snapshot file.
         animal_spawning_tool: Tool for spawning animals.
         choose_animal_spawning_tool: Chooses the animal spawning tool.
         plant_spawning_tool: Tool for spawning plants.
@@ -108,7 +109,11 @@ class Simulation:
         world_rect: pygame.Rect = self._surface.get_rect()
         world_rect.width *= 0.6
         tile_size: int = world_rect.width // 50
-        self.world: World = World(world_rect, tile_size)
+        self.world: World = World(
+            world_rect,
+            tile_size,
+            terrain_filename=terrain.terrain_snapshot_filename or None,
+        )
         # Runtime variables
         self.selected_org = None
         self.paused = True
@@ -341,6 +346,7 @@ class Simulation:
         self._world_settings_menu.add.button(
             "Randomise Everything", self.world.randomise_freqs
         )
+        self._world_settings_menu.add.button("Save Terrain", self.save_terrain)
 
         self._world_settings_menu.add.button(
             "Back", pygame_menu.pygame_menu.events.BACK
@@ -760,6 +766,18 @@ class Simulation:
         """
         simulation.reset_organisms()
 
+    def save_terrain(self) -> None:
+        """
+        Saves the terrain of the world to a new snapshot file in the data folder.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        self.world.save_terrain(terrain.get_new_terrain_snapshot_filename())
+
     def reset_stats(self) -> None:
         """
         Resets the statistics of the simulation.
@@ -818,9 +836,9 @@ class Simulation:
         # TODO improve visual of info tool
         tile = tiles.pop(0)
         if tile.has_animal():
-            self.selected_org = tile.animal.sprite
+            self.selected_org = tile.animal
         elif tile.has_plant():
-            self.selected_org = tile.plant.sprite
+            self.selected_org = tile.plant
         else:
             self.selected_org = None
 
@@ -829,7 +847,7 @@ class Simulation:
 
     def animal_kill_tool(self, tiles: list[Tile]) -> None:
         """
-        Kills animals on the specified list of tiles by setting their health to 0 and calling the die method on their sprite.
+        Kills animals on the specified list of tiles by setting their health to 0 and calling their die method.
 
         Parameters:
             tiles (list[Tile]): A list of Tile objects representing the tiles where animals should be killed.
@@ -839,15 +857,16 @@ class Simulation:
         """
         for tile in tiles:
             if tile.has_animal():
-                tile.animal.sprite.health = 0
-                tile.animal.sprite.die()
+                animal = tile.animal
+                animal.health = 0
+                animal.die()
 
     def choose_animal_kill_tool(self) -> None:
         self.tool = self.animal_kill_tool
 
     def plant_kill_tool(self, tiles: list[Tile]) -> None:
         """
-        Kills the plants on the specified list of tiles by setting their health to 0 and calling the die method on their sprite.
+        Kills the plants on the specified list of tiles by setting their health to 0 and calling their die method.
 
         Parameters:
             tiles (list[Tile]): A list of Tile objects on which plants will be killed.
@@ -857,8 +876,9 @@ class Simulation:
         """
         for tile in tiles:
             if tile.has_plant():
-                tile.plant.sprite.health = 0
-                tile.plant.sprite.die()
+                plant = tile.plant
+                plant.health = 0
+                plant.die()
 
     def choose_plant_kill_tool(self) -> None:
         self.tool = self.plant_kill_tool
@@ -950,6 +970,9 @@ class Simulation:
                 if event.type == pygame.MOUSEBUTTONUP:
                     drawing = False
 
+            # Swap in terrain generated in the background
+            self.world.poll_generation()
+
             if not self.paused:
                 self.world.update()
 
@@ -1 +1,10 @@
-__all__ = ["tile", "world"]
+__all__ = [
+    "biome_table",
+    "chunk_manager",
+    "grid",
+    "spatial_hash",
+    "spawn_index",
+    "terrain_cache",
+    "tile",
+    "world",
+]
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import bisect
+import math
+
+import numpy as np
+import pygame
+
+
+class BiomeTable:
+    """
+    Class representing a lookup table from quantized height and moisture values to biomes.
+
+    The height axis is quantized by the upper height level of every zone and the moisture axis by all moisture thresholds used in any zone.
+    Every cell of the resulting (height x moisture) table holds the id of the biome found in it, so looking up the biomes of a whole grid is a single array indexing operation.
+
+    Attributes:
+        names (list[str]): The name of every biome, indexed by biome id.
+        colors (list[pygame.Color]): The color of every biome, indexed by biome id.
+        color_array (np.ndarray): The RGB color of every biome as an array of shape (biomes, 3), indexed by biome id.
+        plant_growth (np.ndarray): The plant growth potential of every biome, indexed by biome id.
+        has_water (np.ndarray): Flag of every biome indicating if it is water, indexed by biome id.
+        height_levels (list[float]): The upper height level (inclusive) of every zone.
+        moisture_levels (list[float]): The sorted moisture thresholds (exclusive) of all zones.
+        biome_ids (np.ndarray): The table of shape (zones, moisture bands) holding the biome id of every cell.
+
+    Methods:
+        lookup(heights, moistures) -> np.ndarray: Look up the biome ids of arrays of height and moisture values.
+        get_biome(height, moisture) -> int: Look up the biome id of a single height and moisture value.
+    """
+
+    def __init__(
+        self,
+        biomes: dict[str, tuple[pygame.Color, float, bool]],
+        zones: list[tuple[float, list[tuple[float, str]]]],
+    ) -> None:
+        """
+        Initialize a BiomeTable from a description of the biomes and the height zones they appear in.
+
+        Parameters:
+            biomes (dict[str, tuple[pygame.Color, float, bool]]): The color, plant growth potential and water flag of every biome by name.
+            zones (list[tuple[float, list[tuple[float, str]]]]): The height zones ordered by their upper height level (inclusive).
+                Every zone lists its biomes ordered by their upper moisture threshold (exclusive), the threshold of the last biome should be math.inf.
+
+        Raises:
+            ValueError: If the zones are not ordered by height, a zone is empty or references an unknown biome.
+
+        Returns:
+            None
+        """
+        self.names: list[str] = list(biomes.keys())
+        self.colors: list[pygame.Color] = [biomes[name][0] for name in self.names]
+        self.color_array: np.ndarray = np.array(
+            [(color.r, color.g, color.b) for color in self.colors], dtype=np.uint8
+        )
+        self.plant_growth: np.ndarray = np.array(
+            [biomes[name][1] for name in self.names], dtype=np.float64
+        )
+        self.has_water: np.ndarray = np.array(
+            [biomes[name][2] for name in self.names], dtype=bool
+        )
+
+        self.height_levels: list[float] = [level for level, _ in zones]
+        if self.height_levels != sorted(self.height_levels):
+            raise ValueError(f"Height levels {self.height_levels} are not ordered.")
+        self.moisture_levels: list[float] = sorted(
+            {
+                threshold
+                for _, zone in zones
+                for threshold, _ in zone
+                if not math.isinf(threshold)
+            }
+        )
+
+        self.biome_ids: np.ndarray = np.empty(
+            (len(zones), len(self.moisture_levels) + 1), dtype=np.intp
+        )
+        for zone_index, (_, zone) in enumerate(zones):
+            if not zone:
+                raise ValueError(f"Zone {zone_index} does not contain any biomes.")
+            for band in range(len(self.moisture_levels) + 1):
+                # Lowest moisture of the band, all moistures in a band lie on the same side of every threshold
+                moisture = self.moisture_levels[band - 1] if band > 0 else -math.inf
+                name = next(
+                    (name for threshold, name in zone if moisture < threshold),
+                    zone[-1][1],
+                )
+                if name not in biomes:
+                    raise ValueError(f"Unknown biome {name}.")
+                self.biome_ids[zone_index, band] = self.names.index(name)
+
+        self._height_level_array: np.ndarray = np.array(self.height_levels)
+        self._moisture_level_array: np.ndarray = np.array(self.moisture_levels)
+
+    def lookup(self, heights: np.ndarray, moistures: np.ndarray) -> np.ndarray:
+        """
+        Look up the biome ids for arrays of height and moisture values.
+
+        Parameters:
+            heights (np.ndarray): The height values.
+            moistures (np.ndarray): The moisture values, of the same shape as heights.
+
+        Returns:
+            np.ndarray: The biome id of every value pair.
+        """
+        zone = np.searchsorted(self._height_level_array, heights, side="left")
+        np.minimum(zone, len(self.height_levels) - 1, out=zone)
+        band = np.searchsorted(self._moisture_level_array, moistures, side="right")
+        return self.biome_ids[zone, band]
+
+    def get_biome(self, height: float, moisture: float) -> int:
+        """
+        Look up the biome id of a single height and moisture value.
+
+        Parameters:
+            height (float): The height value.
+            moisture (float): The moisture value.
+
+        Returns:
+            int: The biome id.
+        """
+        zone = min(
+            bisect.bisect_left(self.height_levels, height), len(self.height_levels) - 1
+        )
+        band = bisect.bisect_right(self.moisture_levels, moisture)
+        return int(self.biome_ids[zone, band])
@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+from ..helper.noise_function import NoiseFunction
+from ..helper.setting import BoundedSetting
+
+
+class Chunk:
+    """
+    Class representing a square chunk of terrain.
+
+    Attributes:
+        coords (tuple[int, int]): The chunk coordinates (chunk column, chunk row).
+        height (np.ndarray): The weighted height noise of the tiles in the chunk, of shape (size, size).
+        moisture (np.ndarray): The weighted moisture noise of the tiles in the chunk, of shape (size, size).
+        nbytes (int): The number of bytes used by the fields of the chunk.
+    """
+
+    def __init__(
+        self, coords: tuple[int, int], height: np.ndarray, moisture: np.ndarray
+    ) -> None:
+        """
+        Initialize a Chunk with its generated noise fields.
+
+        Parameters:
+            coords (tuple[int, int]): The chunk coordinates (chunk column, chunk row).
+            height (np.ndarray): The weighted height noise of the tiles in the chunk.
+            moisture (np.ndarray): The weighted moisture noise of the tiles in the chunk.
+
+        Returns:
+            None
+        """
+        self.coords: tuple[int, int] = coords
+        self.height: np.ndarray = height
+        self.moisture: np.ndarray = moisture
+
+    @property
+    def nbytes(self) -> int:
+        return self.height.nbytes + self.moisture.nbytes
+
+
+class ChunkManager:
+    """
+    Class managing the terrain of an unbounded world as chunks that are generated on demand.
+
+    Chunks are generated lazily when they are requested, for example because they become visible or an organism approaches them.
+    Only a bounded number of chunks is kept in memory, chunks that are neither visible nor hold organisms are evicted in least recently used order and optionally spilled to disk, so memory use scales with the active area instead of the world extent.
+    The noise of a tile only depends on its coordinates, so a chunk is identical to the same area of a World generated with the same noise functions.
+
+    Attributes:
+        DEFAULT_CHUNK_SIZE (int): The default number of tiles along each side of a chunk.
+        DEFAULT_MAX_ACTIVE_CHUNKS (int): The default maximum number of chunks kept in memory.
+        chunk_size (int): The number of tiles along each side of a chunk.
+        tile_size (int): The size of a tile in pixels.
+        max_active_chunks (int): The number of chunks kept in memory before evicting.
+        spill_directory (str | None): The directory evicted chunks are written to, if None evicted chunks are discarded and regenerated when needed.
+        memory_usage (int): The number of bytes used by the chunks in memory.
+
+    Methods:
+        get_chunk(coords) -> Chunk: Get a chunk, generating or loading it if needed.
+        get_chunk_coords(col, row) -> tuple[int, int]: Get the coordinates of the chunk containing a tile.
+        get_chunks_in_area(col, row, cols, rows) -> set[tuple[int, int]]: Get the coordinates of all chunks overlapping an area of tiles.
+        update(visible, occupied) -> None: Generate the needed chunks and evict the ones that are not needed.
+        invalidate() -> None: Discard all chunks, for example after a noise function changed.
+    """
+
+    DEFAULT_CHUNK_SIZE: int = 32
+    DEFAULT_MAX_ACTIVE_CHUNKS: int = 64
+
+    def __init__(
+        self,
+        height_functions: list[NoiseFunction],
+        height_functions_weights: list[float],
+        moisture_functions: list[NoiseFunction],
+        moisture_functions_weights: list[float],
+        scale_setting: BoundedSetting,
+        tile_size: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_active_chunks: int = DEFAULT_MAX_ACTIVE_CHUNKS,
+        spill_directory: str | None = None,
+    ) -> None:
+        """
+        Initialize a ChunkManager without any chunks.
+
+        Parameters:
+            height_functions (list[NoiseFunction]): The noise functions generating the height.
+            height_functions_weights (list[float]): The weights of the height noise functions.
+            moisture_functions (list[NoiseFunction]): The noise functions generating the moisture.
+            moisture_functions_weights (list[float]): The weights of the moisture noise functions.
+            scale_setting (BoundedSetting): The setting scaling the coordinates of the tiles.
+            tile_size (int): The size of a tile in pixels.
+            chunk_size (int): The number of tiles along each side of a chunk. Default is ChunkManager.DEFAULT_CHUNK_SIZE.
+            max_active_chunks (int): The number of chunks kept in memory before evicting. Default is ChunkManager.DEFAULT_MAX_ACTIVE_CHUNKS.
+            spill_directory (str | None): The directory evicted chunks are written to. Default is None.
+
+        Raises:
+            ValueError: If the chunk size or the maximum number of active chunks is smaller than 1.
+
+        Returns:
+            None
+        """
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size {chunk_size} has to be at least 1.")
+        if max_active_chunks < 1:
+            raise ValueError(
+                f"Max active chunks {max_active_chunks} has to be at least 1."
+            )
+
+        self.height_functions: list[NoiseFunction] = height_functions
+        self.height_functions_weights: list[float] = height_functions_weights
+        self.moisture_functions: list[NoiseFunction] = moisture_functions
+        self.moisture_functions_weights: list[float] = moisture_functions_weights
+        self.scale_setting: BoundedSetting = scale_setting
+        self.tile_size: int = tile_size
+        self.chunk_size: int = chunk_size
+        self.max_active_chunks: int = max_active_chunks
+        self.spill_directory: str | None = spill_directory
+
+        self._chunks: OrderedDict[tuple[int, int], Chunk] = OrderedDict()
+        self._spilled: set[tuple[int, int]] = set()
+        self._pinned: set[tuple[int, int]] = set()
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    def __contains__(self, coords: tuple[int, int]) -> bool:
+        return coords in self._chunks
+
+    @property
+    def memory_usage(self) -> int:
+        return sum(chunk.nbytes for chunk in self._chunks.values())
+
+    # region chunks
+    def get_chunk(self, coords: tuple[int, int]) -> Chunk:
+        """
+        Get the chunk at the given chunk coordinates and mark it as the most recently used one.
+
+        The chunk is loaded from the spill directory if it has been evicted before, otherwise it is generated.
+
+        Parameters:
+            coords (tuple[int, int]): The chunk coordinates (chunk column, chunk row).
+
+        Returns:
+            Chunk: The chunk.
+        """
+        chunk = self._chunks.get(coords)
+        if chunk is not None:
+            self._chunks.move_to_end(coords)
+            return chunk
+
+        if coords in self._spilled:
+            chunk = self._load_chunk(coords)
+        else:
+            chunk = self._generate_chunk(coords)
+        self._chunks[coords] = chunk
+        self._evict()
+        return chunk
+
+    def get_chunk_coords(self, col: int, row: int) -> tuple[int, int]:
+        """
+        Get the coordinates of the chunk containing the tile at the given column and row.
+
+        Parameters:
+            col (int): The column of the tile, can be negative.
+            row (int): The row of the tile, can be negative.
+
+        Returns:
+            tuple[int, int]: The chunk coordinates (chunk column, chunk row).
+        """
+        return col // self.chunk_size, row // self.chunk_size
+
+    def get_chunks_in_area(
+        self, col: int, row: int, cols: int, rows: int
+    ) -> set[tuple[int, int]]:
+        """
+        Get the coordinates of all chunks overlapping an area of tiles.
+
+        Parameters:
+            col (int): The column of the top left tile of the area.
+            row (int): The row of the top left tile of the area.
+            cols (int): The number of columns of the area.
+            rows (int): The number of rows of the area.
+
+        Returns:
+            set[tuple[int, int]]: The coordinates of the overlapping chunks.
+        """
+        if cols <= 0 or rows <= 0:
+            return set()
+        left, top = self.get_chunk_coords(col, row)
+        right, bottom = self.get_chunk_coords(col + cols - 1, row + rows - 1)
+        return {
+            (chunk_col, chunk_row)
+            for chunk_col in range(left, right + 1)
+            for chunk_row in range(top, bottom + 1)
+        }
+
+    def update(
+        self,
+        visible: set[tuple[int, int]],
+        occupied: set[tuple[int, int]] = frozenset(),
+    ) -> None:
+        """
+        Make sure all needed chunks are in memory and evict the chunks that are not needed anymore.
+
+        Chunks that are visible or hold organisms are never evicted, all other chunks are evicted in least recently used order once more than max_active_chunks are in memory.
+
+        Parameters:
+            visible (set[tuple[int, int]]): The coordinates of the visible chunks.
+            occupied (set[tuple[int, int]]): The coordinates of the chunks holding organisms. Default is an empty set.
+
+        Returns:
+            None
+        """
+        self._pinned = set(visible) | set(occupied)
+        for coords in self._pinned:
+            self.get_chunk(coords)
+        self._evict()
+
+    def invalidate(self) -> None:
+        """
+        Discard all chunks in memory and on disk, so they are generated again with the current noise functions.
+
+        Returns:
+            None
+        """
+        self._chunks.clear()
+        for coords in self._spilled:
+            filename = self._get_spill_filename(coords)
+            if os.path.exists(filename):
+                os.remove(filename)
+        self._spilled.clear()
+
+    # endregion
+
+    # region helpers
+    def _generate_chunk(self, coords: tuple[int, int]) -> Chunk:
+        """
+        Generate the noise fields of the chunk at the given chunk coordinates.
+
+        Parameters:
+            coords (tuple[int, int]): The chunk coordinates (chunk column, chunk row).
+
+        Returns:
+            Chunk: The generated chunk.
+        """
+        offsets = np.arange(self.chunk_size)
+        cols = coords[0] * self.chunk_size + offsets
+        rows = coords[1] * self.chunk_size + offsets
+        xs = cols * self.tile_size * self.scale_setting._value
+        ys = rows * self.tile_size * self.scale_setting._value
+
+        return Chunk(
+            coords,
+            NoiseFunction.weigh_array(
+                xs, ys, self.height_functions, self.height_functions_weights
+            ),
+            NoiseFunction.weigh_array(
+                xs, ys, self.moisture_functions, self.moisture_functions_weights
+            ),
+        )
+
+    def _evict(self) -> None:
+        """
+        Evict the least recently used chunks that are neither visible nor occupied until at most max_active_chunks are in memory.
+
+        Returns:
+            None
+        """
+        evictable = [coords for coords in self._chunks if coords not in self._pinned]
+        for coords in evictable[: max(0, len(self._chunks) - self.max_active_chunks)]:
+            chunk = self._chunks.pop(coords)
+            if self.spill_directory is not None:
+                self._spill_chunk(chunk)
+
+    def _spill_chunk(self, chunk: Chunk) -> None:
+        """
+        Write a chunk to the spill directory.
+
+        Parameters:
+            chunk (Chunk): The chunk to write.
+
+        Returns:
+            None
+        """
+        os.makedirs(self.spill_directory, exist_ok=True)
+        np.savez(
+            self._get_spill_filename(chunk.coords),
+            height=chunk.height,
+            moisture=chunk.moisture,
+        )
+        self._spilled.add(chunk.coords)
+
+    def _load_chunk(self, coords: tuple[int, int]) -> Chunk:
+        """
+        Read a chunk from the spill directory.
+
+        Parameters:
+            coords (tuple[int, int]): The chunk coordinates (chunk column, chunk row).
+
+        Returns:
+            Chunk: The loaded chunk.
+        """
+        with np.load(self._get_spill_filename(coords)) as data:
+            return Chunk(coords, data["height"], data["moisture"])
+
+    def _get_spill_filename(self, coords: tuple[int, int]) -> str:
+        return os.path.join(self.spill_directory, f"chunk_{coords[0]}_{coords[1]}.npz")
+
+    # endregion
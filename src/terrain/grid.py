@@ -0,0 +1,920 @@
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .direction import Direction
+from .spatial_hash import SpatialHash
+from .spawn_index import SpawnIndex
+from .tile import Tile
+
+if TYPE_CHECKING:
+    from ..entities.organism import Organism
+
+
+class Grid:
+    """
+    Class storing the state of all tiles of a world as NumPy arrays of shape (rows, cols).
+
+    Every attribute of a tile is a cell of one of the arrays, a Tile only holds its row and column and reads and writes through to them.
+    This keeps the memory per tile small and allows querying the whole grid with single array operations.
+    Tiles are also addressed by their flat index row * cols + col, which is used by the neighbor tables.
+    Which organisms occupy a tile is stored as organism ids in the occupancy arrays, EMPTY marks a free tile and the organisms themselves are looked up by their id.
+    For sampling random neighbors every tile also has bitmasks of its 4 connected neighbors, bit d is set if the neighbor in the d-th direction of DIRECTION_OFFSETS exists and is land, free of animals or free of plants.
+    They are updated incrementally whenever an organism is placed or removed and whenever the terrain changes.
+    The food field, the distance of every tile to the nearest plant and the next step towards it, is recomputed for the whole grid at once by update_food_field.
+    The same holds for the spawn indices, the sets of free land tiles an animal or a plant can be spawned on, and for the spatial hashes of the animals and plants used for radius and nearest neighbor queries.
+
+    Attributes:
+        DIRECTION_OFFSETS (dict[Direction, tuple[int, int]]): The (row, column) offset of the neighbor in every direction.
+        EMPTY (int): The id in the occupancy arrays of a tile without an organism.
+        UNREACHABLE (int): The distance in a distance field of a tile from which no source can be reached.
+        NEIGHBOR_BIT_COUNTS (list[int]): The number of set bits of every neighbor bitmask.
+        NEIGHBOR_BIT_DIRECTIONS (list[list[int]]): The direction indices of the set bits of every neighbor bitmask.
+        rows (int): The number of rows of the grid.
+        cols (int): The number of columns of the grid.
+        tile_size (int): The size of a tile in pixels.
+        height (np.ndarray): The height of every tile.
+        moisture (np.ndarray): The moisture of every tile.
+        biome_id (np.ndarray): The biome id of every tile.
+        plant_growth (np.ndarray): The plant growth potential of every tile.
+        has_water (np.ndarray): Mask of the tiles that are water.
+        is_coast (np.ndarray): Mask of the water tiles that border on water.
+        is_border (np.ndarray): Mask of the tiles at the edge of the grid.
+        times_visited (np.ndarray): The number of times an animal entered every tile.
+        animal_id (np.ndarray): The id of the animal on every tile, EMPTY if there is none.
+        plant_id (np.ndarray): The id of the plant on every tile, EMPTY if there is none.
+        organisms (dict[int, Organism]): The organisms on the grid by their id.
+        neighbor_bits (np.ndarray): The bitmask of the existing neighbors of every tile, indexed by flat index.
+        land_neighbor_bits (np.ndarray): The bitmask of the neighbors that are not water of every tile, indexed by flat index.
+        free_animal_neighbor_bits (np.ndarray): The bitmask of the neighbors without an animal of every tile, indexed by flat index.
+        free_plant_neighbor_bits (np.ndarray): The bitmask of the neighbors without a plant of every tile, indexed by flat index.
+        free_animal_tiles (SpawnIndex): The flat indices of the land tiles without an animal.
+        free_plant_tiles (SpawnIndex): The flat indices of the land tiles without a plant.
+        food_distance (np.ndarray): The number of steps over land from every tile to the nearest plant, UNREACHABLE if there is none.
+        food_step (np.ndarray): The flat index of the neighbor one step closer to the nearest plant of every tile, indexed by flat index, EMPTY if there is none.
+        animal_hash (SpatialHash): The spatial index of the animals on the grid.
+        plant_hash (SpatialHash): The spatial index of the plants on the grid.
+        tiles (list[Tile]): The tiles viewing the cells of the grid, indexed by flat index.
+
+    Methods:
+        get_tile(row, col) -> Tile | None: Get the tile at a row and column.
+        get_offsets(connectivity=4, radius=1) -> np.ndarray: Get the (row, column) offsets of a neighborhood.
+        get_neighbor_table(connectivity=4, radius=1) -> tuple[np.ndarray, np.ndarray]: Get the neighbor indices and their border mask of all tiles.
+        get_neighbor_indices(index, connectivity=4, radius=1) -> np.ndarray: Get the flat indices of the neighbors of a tile.
+        count_neighbors(mask, connectivity=4, radius=1) -> np.ndarray: Count the neighbors of every tile for which a mask is set.
+        get_organism(organism_id) -> Organism | None: Get an organism on the grid by its id.
+        place_animal(row, col, animal) -> None: Mark a tile as occupied by an animal.
+        place_plant(row, col, plant) -> None: Mark a tile as occupied by a plant.
+        remove_animal(row, col) -> None: Mark a tile as free of animals.
+        remove_plant(row, col) -> None: Mark a tile as free of plants.
+        get_free_mask(needs_no_animal=False, needs_no_plant=False, needs_no_water=False) -> np.ndarray: Get the mask of the tiles meeting the given criteria.
+        get_adjacent_indices(mask, candidates, connectivity=4, radius=1) -> np.ndarray: Get the flat indices of the candidate tiles adjacent to a tile of a mask.
+        sample_neighbor(index, **needs) -> int | None: Get the flat index of a random neighbor of a tile meeting the given criteria.
+        sample_neighbors(indices, **needs) -> np.ndarray: Get the flat indices of a random neighbor meeting the given criteria for many tiles at once.
+        get_distance_field(sources, passable=None) -> np.ndarray: Get the number of steps from every tile to the nearest source tile.
+        get_descent_steps(field) -> np.ndarray: Get the neighbor with the smallest value of a field below the value of the tile of every tile.
+        update_food_field() -> None: Recompute the distance and next step to the nearest plant of every tile.
+        get_organisms_in_radius(row, col, radius, animals=True, plants=True) -> list[Organism]: Get the organisms within a radius of a tile.
+        get_nearest_organisms(row, col, k, animals=True, plants=True, max_radius=None) -> list[Organism]: Get the k organisms nearest to a tile.
+        set_terrain(heights, moistures, biome_ids=None) -> None: Set the height and moisture of all tiles at once.
+        set_tile_terrain(row, col, height, moisture, biome_id=None) -> None: Set the height and moisture of a single tile.
+    """
+
+    DIRECTION_OFFSETS: dict[Direction, tuple[int, int]] = {
+        Direction.NORTH: (-1, 0),
+        Direction.EAST: (0, 1),
+        Direction.SOUTH: (1, 0),
+        Direction.WEST: (0, -1),
+    }
+    EMPTY: int = -1
+    UNREACHABLE: int = np.iinfo(np.int32).max
+    NEIGHBOR_BIT_DIRECTIONS: list[list[int]] = [
+        [direction for direction in range(4) if bits >> direction & 1]
+        for bits in range(16)
+    ]
+    NEIGHBOR_BIT_COUNTS: list[int] = [
+        len(directions) for directions in NEIGHBOR_BIT_DIRECTIONS
+    ]
+    _OPPOSITE_DIRECTIONS: list[int] = [2, 3, 0, 1]
+
+    def __init__(self, rows: int, cols: int, tile_size: int) -> None:
+        """
+        Initialize a Grid of the given dimensions with all tiles at height and moisture 0.
+
+        Parameters:
+            rows (int): The number of rows of the grid.
+            cols (int): The number of columns of the grid.
+            tile_size (int): The size of a tile in pixels.
+
+        Returns:
+            None
+        """
+        self.rows: int = rows
+        self.cols: int = cols
+        self.tile_size: int = tile_size
+
+        shape = (rows, cols)
+        self.height: np.ndarray = np.zeros(shape, dtype=np.float64)
+        self.moisture: np.ndarray = np.zeros(shape, dtype=np.float64)
+        self.biome_id: np.ndarray = np.zeros(shape, dtype=np.intp)
+        self.plant_growth: np.ndarray = np.zeros(shape, dtype=np.float64)
+        self.has_water: np.ndarray = np.zeros(shape, dtype=bool)
+        self.is_coast: np.ndarray = np.zeros(shape, dtype=bool)
+        self.is_border: np.ndarray = np.zeros(shape, dtype=bool)
+        self.is_border[[0, -1], :] = True
+        self.is_border[:, [0, -1]] = True
+        self.times_visited: np.ndarray = np.zeros(shape, dtype=np.int64)
+        self.animal_id: np.ndarray = np.full(shape, Grid.EMPTY, dtype=np.int64)
+        self.plant_id: np.ndarray = np.full(shape, Grid.EMPTY, dtype=np.int64)
+        self.organisms: dict[int, Organism] = {}
+
+        self._neighbor_tables: dict[tuple[int, int], tuple[np.ndarray, np.ndarray]] = {}
+        self._direction_steps: list[int] = [
+            row * cols + col for row, col in Grid.DIRECTION_OFFSETS.values()
+        ]
+        _, valid = self.get_neighbor_table()
+        self.neighbor_bits: np.ndarray = Grid._pack_neighbor_bits(valid)
+        self.land_neighbor_bits: np.ndarray = self.neighbor_bits.copy()
+        self.free_animal_neighbor_bits: np.ndarray = self.neighbor_bits.copy()
+        self.free_plant_neighbor_bits: np.ndarray = self.neighbor_bits.copy()
+        self.free_animal_tiles: SpawnIndex = SpawnIndex(rows * cols)
+        self.free_plant_tiles: SpawnIndex = SpawnIndex(rows * cols)
+        self.food_distance: np.ndarray = np.full(
+            shape, Grid.UNREACHABLE, dtype=np.int32
+        )
+        self.food_step: np.ndarray = np.full(rows * cols, Grid.EMPTY, dtype=np.int64)
+        self.animal_hash: SpatialHash = SpatialHash()
+        self.plant_hash: SpatialHash = SpatialHash()
+        self._sample_directions: np.ndarray = np.array(
+            [
+                directions + [0] * (4 - len(directions))
+                for directions in Grid.NEIGHBOR_BIT_DIRECTIONS
+            ],
+            dtype=np.intp,
+        )
+
+        self.tiles: list[Tile] = [
+            Tile(self, row, col) for row in range(rows) for col in range(cols)
+        ]
+
+        self.set_terrain(self.height, self.moisture)
+
+    # region tiles
+    def get_tile(self, row: int, col: int) -> Tile | None:
+        """
+        Get the tile at the given row and column.
+
+        Parameters:
+            row (int): The row of the tile.
+            col (int): The column of the tile.
+
+        Returns:
+            Tile | None: The tile, None if the row or column is outside of the grid.
+        """
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return self.tiles[row * self.cols + col]
+        return None
+
+    # endregion
+
+    # region neighbors
+    @staticmethod
+    def get_offsets(connectivity: int = 4, radius: int = 1) -> np.ndarray:
+        """
+        Get the (row, column) offsets of all tiles in the neighborhood of a tile.
+
+        With a radius of 1 the offsets of a 4 connected neighborhood are ordered like Direction, the ones of an 8 connected neighborhood clockwise starting north.
+        Larger radii are ordered by row and column.
+
+        Parameters:
+            connectivity (int): 4 for a neighborhood within the given manhattan distance, 8 for one within the given chebyshev distance. Default is 4.
+            radius (int): The maximum distance of a neighbor. Default is 1.
+
+        Raises:
+            ValueError: If the connectivity is not 4 or 8 or the radius is smaller than 1.
+
+        Returns:
+            np.ndarray: The offsets as an array of shape (neighbors, 2).
+        """
+        if connectivity not in (4, 8):
+            raise ValueError(f"Connectivity {connectivity} has to be 4 or 8.")
+        if radius < 1:
+            raise ValueError(f"Radius {radius} has to be at least 1.")
+
+        if radius == 1 and connectivity == 4:
+            offsets = list(Grid.DIRECTION_OFFSETS.values())
+        elif radius == 1:
+            offsets = [
+                (-1, 0),
+                (-1, 1),
+                (0, 1),
+                (1, 1),
+                (1, 0),
+                (1, -1),
+                (0, -1),
+                (-1, -1),
+            ]
+        else:
+            offsets = [
+                (row, col)
+                for row in range(-radius, radius + 1)
+                for col in range(-radius, radius + 1)
+                if (row, col) != (0, 0)
+                and (connectivity == 8 or abs(row) + abs(col) <= radius)
+            ]
+        return np.array(offsets, dtype=np.intp)
+
+    def get_neighbor_table(
+        self, connectivity: int = 4, radius: int = 1
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the flat indices of the neighbors of all tiles, computed once per neighborhood.
+
+        Entries of neighbors outside of the grid hold the index of the tile itself and are cleared in the mask, so the table can always be used for indexing.
+
+        Parameters:
+            connectivity (int): The connectivity of the neighborhood, see Grid.get_offsets. Default is 4.
+            radius (int): The radius of the neighborhood, see Grid.get_offsets. Default is 1.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The neighbor indices and the mask of the neighbors inside the grid, both of shape (rows * cols, neighbors).
+        """
+        key = (connectivity, radius)
+        table = self._neighbor_tables.get(key)
+        if table is None:
+            offsets = Grid.get_offsets(connectivity, radius)
+            rows = np.repeat(np.arange(self.rows), self.cols)[:, np.newaxis]
+            cols = np.tile(np.arange(self.cols), self.rows)[:, np.newaxis]
+            neighbor_rows = rows + offsets[:, 0]
+            neighbor_cols = cols + offsets[:, 1]
+
+            valid = (
+                (0 <= neighbor_rows)
+                & (neighbor_rows < self.rows)
+                & (0 <= neighbor_cols)
+                & (neighbor_cols < self.cols)
+            )
+            dtype = np.int32 if self.rows * self.cols < 2**31 else np.int64
+            indices = np.where(
+                valid,
+                neighbor_rows * self.cols + neighbor_cols,
+                rows * self.cols + cols,
+            ).astype(dtype)
+
+            table = (indices, valid)
+            self._neighbor_tables[key] = table
+        return table
+
+    def get_neighbor_indices(
+        self, index: int, connectivity: int = 4, radius: int = 1
+    ) -> np.ndarray:
+        """
+        Get the flat indices of the neighbors of a single tile inside the grid.
+
+        Parameters:
+            index (int): The flat index of the tile.
+            connectivity (int): The connectivity of the neighborhood, see Grid.get_offsets. Default is 4.
+            radius (int): The radius of the neighborhood, see Grid.get_offsets. Default is 1.
+
+        Returns:
+            np.ndarray: The flat indices of the neighbors.
+        """
+        indices, valid = self.get_neighbor_table(connectivity, radius)
+        return indices[index][valid[index]]
+
+    def count_neighbors(
+        self, mask: np.ndarray, connectivity: int = 4, radius: int = 1
+    ) -> np.ndarray:
+        """
+        Count for every tile the number of its neighbors for which the mask is set.
+
+        Parameters:
+            mask (np.ndarray): A boolean array of shape (rows, cols).
+            connectivity (int): The connectivity of the neighborhood, see Grid.get_offsets. Default is 4.
+            radius (int): The radius of the neighborhood, see Grid.get_offsets. Default is 1.
+
+        Returns:
+            np.ndarray: The number of neighbors of every tile as an array of shape (rows, cols).
+        """
+        indices, valid = self.get_neighbor_table(connectivity, radius)
+        counts = (mask.ravel()[indices] & valid).sum(axis=1)
+        return counts.reshape(self.rows, self.cols)
+
+    # endregion
+
+    # region occupancy
+    def get_organism(self, organism_id: int) -> Organism | None:
+        """
+        Get an organism on the grid by its id.
+
+        Parameters:
+            organism_id (int): The id of the organism, EMPTY for none.
+
+        Returns:
+            Organism | None: The organism, None if no organism with this id is on the grid.
+        """
+        return self.organisms.get(organism_id)
+
+    def place_animal(self, row: int, col: int, animal: Organism) -> None:
+        """
+        Mark the tile at the given row and column as occupied by an animal.
+
+        Parameters:
+            row (int): The row of the tile.
+            col (int): The column of the tile.
+            animal (Organism): The animal occupying the tile.
+
+        Raises:
+            ValueError: If the tile is already occupied by an animal.
+
+        Returns:
+            None
+        """
+        self._place(
+            self.animal_id,
+            self.free_animal_neighbor_bits,
+            self.free_animal_tiles,
+            self.animal_hash,
+            row,
+            col,
+            animal,
+        )
+
+    def place_plant(self, row: int, col: int, plant: Organism) -> None:
+        """
+        Mark the tile at the given row and column as occupied by a plant.
+
+        Parameters:
+            row (int): The row of the tile.
+            col (int): The column of the tile.
+            plant (Organism): The plant occupying the tile.
+
+        Raises:
+            ValueError: If the tile is already occupied by a plant.
+
+        Returns:
+            None
+        """
+        self._place(
+            self.plant_id,
+            self.free_plant_neighbor_bits,
+            self.free_plant_tiles,
+            self.plant_hash,
+            row,
+            col,
+            plant,
+        )
+
+    def remove_animal(self, row: int, col: int) -> None:
+        """
+        Mark the tile at the given row and column as free of animals.
+
+        Parameters:
+            row (int): The row of the tile.
+            col (int): The column of the tile.
+
+        Returns:
+            None
+        """
+        self._remove(
+            self.animal_id,
+            self.free_animal_neighbor_bits,
+            self.free_animal_tiles,
+            self.animal_hash,
+            row,
+            col,
+        )
+
+    def remove_plant(self, row: int, col: int) -> None:
+        """
+        Mark the tile at the given row and column as free of plants.
+
+        Parameters:
+            row (int): The row of the tile.
+            col (int): The column of the tile.
+
+        Returns:
+            None
+        """
+        self._remove(
+            self.plant_id,
+            self.free_plant_neighbor_bits,
+            self.free_plant_tiles,
+            self.plant_hash,
+            row,
+            col,
+        )
+
+    def get_free_mask(
+        self,
+        needs_no_animal: bool = False,
+        needs_no_plant: bool = False,
+        needs_no_water: bool = False,
+    ) -> np.ndarray:
+        """
+        Get the mask of the tiles meeting all of the given criteria.
+
+        Parameters:
+            needs_no_animal (bool): If True, the tiles must not hold an animal. Default is False.
+            needs_no_plant (bool): If True, the tiles must not hold a plant. Default is False.
+            needs_no_water (bool): If True, the tiles must not be water. Default is False.
+
+        Returns:
+            np.ndarray: A boolean array of shape (rows, cols).
+        """
+        mask = np.ones((self.rows, self.cols), dtype=bool)
+        if needs_no_animal:
+            mask &= self.animal_id == Grid.EMPTY
+        if needs_no_plant:
+            mask &= self.plant_id == Grid.EMPTY
+        if needs_no_water:
+            mask &= ~self.has_water
+        return mask
+
+    def get_adjacent_indices(
+        self,
+        mask: np.ndarray,
+        candidates: np.ndarray,
+        connectivity: int = 4,
+        radius: int = 1,
+    ) -> np.ndarray:
+        """
+        Get the flat indices of all candidate tiles with at least one neighbor for which the mask is set.
+
+        For example all free land tiles next to a plant are get_adjacent_indices(plant_id != EMPTY, get_free_mask(needs_no_plant=True, needs_no_water=True)).
+
+        Parameters:
+            mask (np.ndarray): A boolean array of shape (rows, cols) of the tiles to be adjacent to.
+            candidates (np.ndarray): A boolean array of shape (rows, cols) of the tiles that can be returned.
+            connectivity (int): The connectivity of the neighborhood, see Grid.get_offsets. Default is 4.
+            radius (int): The radius of the neighborhood, see Grid.get_offsets. Default is 1.
+
+        Returns:
+            np.ndarray: The flat indices of the tiles in ascending order.
+        """
+        adjacent = self.count_neighbors(mask, connectivity, radius) > 0
+        return np.flatnonzero(adjacent & candidates)
+
+    def _place(
+        self,
+        occupancy: np.ndarray,
+        free_bits: np.ndarray,
+        free_tiles: SpawnIndex,
+        spatial_hash: SpatialHash,
+        row: int,
+        col: int,
+        organism: Organism,
+    ) -> None:
+        if occupancy[row, col] != Grid.EMPTY:
+            raise ValueError(f"Tile at ({row}, {col}) is already occupied.")
+        occupancy[row, col] = organism.id
+        self.organisms[organism.id] = organism
+        spatial_hash.insert(organism, row, col)
+
+        index = row * self.cols + col
+        self._set_free_bit(free_bits, index, False)
+        free_tiles.remove(index)
+
+    def _remove(
+        self,
+        occupancy: np.ndarray,
+        free_bits: np.ndarray,
+        free_tiles: SpawnIndex,
+        spatial_hash: SpatialHash,
+        row: int,
+        col: int,
+    ) -> None:
+        organism_id = int(occupancy[row, col])
+        if organism_id == Grid.EMPTY:
+            return
+        # Every organism occupies a single tile, so it leaves the grid with it
+        spatial_hash.remove(self.organisms.pop(organism_id, None))
+        occupancy[row, col] = Grid.EMPTY
+
+        index = row * self.cols + col
+        self._set_free_bit(free_bits, index, True)
+        if not self.has_water[row, col]:
+            free_tiles.add(index)
+
+    def _set_free_bit(self, free_bits: np.ndarray, index: int, free: bool) -> None:
+        """
+        Set or clear the bit of a tile in the bitmasks of all of its neighbors.
+
+        Parameters:
+            free_bits (np.ndarray): The bitmasks to update.
+            index (int): The flat index of the tile.
+            free (bool): If True the bits are set, otherwise they are cleared.
+
+        Returns:
+            None
+        """
+        for direction in Grid.NEIGHBOR_BIT_DIRECTIONS[self.neighbor_bits.item(index)]:
+            neighbor = index + self._direction_steps[direction]
+            # The tile is in the opposite direction as seen from its neighbor
+            bit = 1 << Grid._OPPOSITE_DIRECTIONS[direction]
+            if free:
+                free_bits[neighbor] |= bit
+            else:
+                free_bits[neighbor] &= ~bit & 0xF
+
+    # endregion
+
+    # region sampling
+    def sample_neighbor(
+        self,
+        index: int,
+        needs_plant: bool = False,
+        needs_no_plant: bool = False,
+        needs_animal: bool = False,
+        needs_no_animal: bool = False,
+        needs_water: bool = False,
+        needs_no_water: bool = False,
+    ) -> int | None:
+        """
+        Get the flat index of a random 4 connected neighbor of a tile meeting all of the given criteria.
+
+        The neighbor is picked from the combined bitmask of the tile through precomputed tables, without building a list of the options.
+
+        Parameters:
+            index (int): The flat index of the tile.
+            needs_plant (bool): If True, the neighbor must have a plant. Default is False.
+            needs_no_plant (bool): If True, the neighbor must not have a plant. Default is False.
+            needs_animal (bool): If True, the neighbor must have an animal. Default is False.
+            needs_no_animal (bool): If True, the neighbor must not have an animal. Default is False.
+            needs_water (bool): If True, the neighbor must be water. Default is False.
+            needs_no_water (bool): If True, the neighbor must not be water. Default is False.
+
+        Returns:
+            int | None: The flat index of the neighbor, None if no neighbor meets the criteria.
+        """
+        bits = self.neighbor_bits.item(index)
+        if needs_plant:
+            bits &= ~self.free_plant_neighbor_bits.item(index)
+        if needs_no_plant:
+            bits &= self.free_plant_neighbor_bits.item(index)
+        if needs_animal:
+            bits &= ~self.free_animal_neighbor_bits.item(index)
+        if needs_no_animal:
+            bits &= self.free_animal_neighbor_bits.item(index)
+        if needs_water:
+            bits &= ~self.land_neighbor_bits.item(index)
+        if needs_no_water:
+            bits &= self.land_neighbor_bits.item(index)
+
+        count = Grid.NEIGHBOR_BIT_COUNTS[bits]
+        if not count:
+            return None
+        direction = Grid.NEIGHBOR_BIT_DIRECTIONS[bits][int(random.random() * count)]
+        return index + self._direction_steps[direction]
+
+    def sample_neighbors(
+        self,
+        indices: np.ndarray,
+        needs_plant: bool = False,
+        needs_no_plant: bool = False,
+        needs_animal: bool = False,
+        needs_no_animal: bool = False,
+        needs_water: bool = False,
+        needs_no_water: bool = False,
+    ) -> np.ndarray:
+        """
+        Get the flat index of a random 4 connected neighbor meeting all of the given criteria for many tiles at once.
+
+        Parameters:
+            indices (np.ndarray): The flat indices of the tiles.
+            needs_plant (bool): If True, the neighbors must have a plant. Default is False.
+            needs_no_plant (bool): If True, the neighbors must not have a plant. Default is False.
+            needs_animal (bool): If True, the neighbors must have an animal. Default is False.
+            needs_no_animal (bool): If True, the neighbors must not have an animal. Default is False.
+            needs_water (bool): If True, the neighbors must be water. Default is False.
+            needs_no_water (bool): If True, the neighbors must not be water. Default is False.
+
+        Returns:
+            np.ndarray: The flat index of the neighbor of every tile, EMPTY for the tiles without a neighbor meeting the criteria.
+        """
+        indices = np.asarray(indices, dtype=np.intp)
+        bits = self.neighbor_bits[indices]
+        for needed, needed_not, free_bits in [
+            (needs_plant, needs_no_plant, self.free_plant_neighbor_bits),
+            (needs_animal, needs_no_animal, self.free_animal_neighbor_bits),
+            (needs_water, needs_no_water, self.land_neighbor_bits),
+        ]:
+            if needed:
+                bits &= ~free_bits[indices]
+            if needed_not:
+                bits &= free_bits[indices]
+
+        counts = np.array(Grid.NEIGHBOR_BIT_COUNTS, dtype=np.intp)[bits]
+        picks = (np.random.random(len(indices)) * counts).astype(np.intp)
+        directions = self._sample_directions[bits, picks]
+        steps = np.array(self._direction_steps, dtype=np.intp)[directions]
+        return np.where(counts > 0, indices + steps, Grid.EMPTY)
+
+    # endregion
+
+    # region fields
+    def get_distance_field(
+        self, sources: np.ndarray, passable: np.ndarray | None = None
+    ) -> np.ndarray:
+        """
+        Get the number of 4 connected steps from every tile to the nearest source tile.
+
+        The distances are computed by a breadth first search starting from all sources at once, every step expands the whole frontier with array operations on the neighbor table.
+
+        Parameters:
+            sources (np.ndarray): A boolean array of shape (rows, cols) of the source tiles.
+            passable (np.ndarray | None): A boolean array of shape (rows, cols) of the tiles that can be stepped on, if None all tiles can. Default is None.
+
+        Returns:
+            np.ndarray: The distance of every tile as an array of shape (rows, cols), UNREACHABLE for tiles without a path to a source.
+        """
+        indices, _ = self.get_neighbor_table()
+        # Invalid neighbors point to the tile itself, which is always visited before it is expanded
+        distance = np.full(self.rows * self.cols, Grid.UNREACHABLE, dtype=np.int32)
+        unvisited = (
+            np.ones(self.rows * self.cols, dtype=bool)
+            if passable is None
+            else passable.ravel().copy()
+        )
+
+        # The last write of a duplicated index wins, which removes duplicates without sorting
+        slots = np.zeros(self.rows * self.cols, dtype=np.intp)
+        frontier = np.flatnonzero(sources)
+        distance[frontier] = 0
+        unvisited[frontier] = False
+        step = 0
+        while len(frontier):
+            step += 1
+            neighbors = indices[frontier].ravel()
+            neighbors = neighbors[unvisited[neighbors]]
+            order = np.arange(len(neighbors))
+            slots[neighbors] = order
+            frontier = neighbors[slots[neighbors] == order]
+            distance[frontier] = step
+            unvisited[frontier] = False
+        return distance.reshape(self.rows, self.cols)
+
+    def get_descent_steps(self, field: np.ndarray) -> np.ndarray:
+        """
+        Get for every tile the 4 connected neighbor with the smallest value of a field, if it is smaller than the value of the tile itself.
+
+        Following the steps from any tile descends the field, for a distance field they lead along a shortest path to the nearest source.
+
+        Parameters:
+            field (np.ndarray): The value of every tile as an array of shape (rows, cols).
+
+        Returns:
+            np.ndarray: The flat index of the neighbor of every tile, EMPTY if no neighbor is smaller.
+        """
+        indices, _ = self.get_neighbor_table()
+        values = field.ravel()
+        neighbor_values = values[indices]
+        # Invalid neighbors hold the value of the tile itself and are never smaller
+        best = neighbor_values.argmin(axis=1)
+        tiles = np.arange(len(values))
+        return np.where(
+            neighbor_values[tiles, best] < values,
+            indices[tiles, best],
+            Grid.EMPTY,
+        )
+
+    def update_food_field(self) -> None:
+        """
+        Recompute the distance over land to the nearest plant and the next step towards it for every tile.
+
+        Returns:
+            None
+        """
+        self.food_distance[...] = self.get_distance_field(
+            self.plant_id != Grid.EMPTY, ~self.has_water
+        )
+        self.food_step[...] = self.get_descent_steps(self.food_distance)
+
+    # endregion
+
+    # region spatial queries
+    def get_organisms_in_radius(
+        self,
+        row: int,
+        col: int,
+        radius: float,
+        animals: bool = True,
+        plants: bool = True,
+    ) -> list[Organism]:
+        """
+        Get the organisms within a radius of the tile at the given row and column.
+
+        Parameters:
+            row (int): The row of the tile.
+            col (int): The column of the tile.
+            radius (float): The maximum euclidean distance in tiles.
+            animals (bool): If True, animals are included. Default is True.
+            plants (bool): If True, plants are included. Default is True.
+
+        Returns:
+            list[Organism]: The organisms in no particular order.
+        """
+        organisms = []
+        if animals:
+            organisms += self.animal_hash.query_radius(row, col, radius)
+        if plants:
+            organisms += self.plant_hash.query_radius(row, col, radius)
+        return organisms
+
+    def get_nearest_organisms(
+        self,
+        row: int,
+        col: int,
+        k: int,
+        animals: bool = True,
+        plants: bool = True,
+        max_radius: float | None = None,
+    ) -> list[Organism]:
+        """
+        Get the k organisms nearest to the tile at the given row and column.
+
+        Parameters:
+            row (int): The row of the tile.
+            col (int): The column of the tile.
+            k (int): The maximum number of organisms.
+            animals (bool): If True, animals are included. Default is True.
+            plants (bool): If True, plants are included. Default is True.
+            max_radius (float | None): The maximum euclidean distance in tiles, if None the distance is not limited. Default is None.
+
+        Returns:
+            list[Organism]: The organisms ordered by their distance.
+        """
+        hashes = [
+            spatial_hash
+            for spatial_hash, included in [
+                (self.animal_hash, animals),
+                (self.plant_hash, plants),
+            ]
+            if included
+        ]
+        if len(hashes) == 1:
+            return hashes[0].query_nearest(row, col, k, max_radius)
+
+        candidates = []
+        for spatial_hash in hashes:
+            for organism in spatial_hash.query_nearest(row, col, k, max_radius):
+                organism_row, organism_col = spatial_hash.get_position(organism)
+                distance = (organism_row - row) ** 2 + (organism_col - col) ** 2
+                candidates.append((distance, len(candidates), organism))
+        return [organism for _, _, organism in sorted(candidates)[:k]]
+
+    # endregion
+
+    def set_terrain(
+        self,
+        heights: np.ndarray,
+        moistures: np.ndarray,
+        biome_ids: np.ndarray | None = None,
+    ) -> None:
+        """
+        Set the height and moisture of all tiles at once and update the attributes depending on them.
+
+        Parameters:
+            heights (np.ndarray): The height of every tile, between 0 and 1.
+            moistures (np.ndarray): The moisture of every tile, between 0 and 1.
+            biome_ids (np.ndarray | None): The biome id of every tile if it has already been looked up, otherwise it is looked up in the biome table. Default is None.
+
+        Raises:
+            ValueError: If the shape of the arrays does not match the grid or a value is not in the range [0, 1].
+
+        Returns:
+            None
+        """
+        heights = np.asarray(heights)
+        moistures = np.asarray(moistures)
+        if heights.shape != self.height.shape or moistures.shape != self.height.shape:
+            raise ValueError(
+                f"Terrain of shape {heights.shape} and {moistures.shape} does not match grid of shape {self.height.shape}."
+            )
+        if heights.size and not (0 <= heights.min() and heights.max() <= 1):
+            raise ValueError("Height values not in range [0, 1]")
+        if moistures.size and not (0 <= moistures.min() and moistures.max() <= 1):
+            raise ValueError("Moisture values not in range [0, 1]")
+
+        biome_table = Tile.get_biome_table()
+        if biome_ids is None:
+            biome_ids = biome_table.lookup(heights, moistures)
+
+        self.height[...] = heights
+        self.moisture[...] = moistures
+        self.biome_id[...] = biome_ids
+        np.take(biome_table.plant_growth, self.biome_id, out=self.plant_growth)
+        np.take(biome_table.has_water, self.biome_id, out=self.has_water)
+        self._update_coast()
+        self._update_land_neighbor_bits()
+
+        land = ~self.has_water.ravel()
+        self.free_animal_tiles.reset(land & (self.animal_id.ravel() == Grid.EMPTY))
+        self.free_plant_tiles.reset(land & (self.plant_id.ravel() == Grid.EMPTY))
+
+    def set_tile_terrain(
+        self,
+        row: int,
+        col: int,
+        height: float,
+        moisture: float,
+        biome_id: int | None = None,
+    ) -> None:
+        """
+        Set the height and moisture of a single tile and update the attributes depending on them.
+
+        Parameters:
+            row (int): The row of the tile.
+            col (int): The column of the tile.
+            height (float): The height of the tile, between 0 and 1.
+            moisture (float): The moisture of the tile, between 0 and 1.
+            biome_id (int | None): The biome id of the tile if it is already known, otherwise it is looked up in the biome table. Default is None.
+
+        Raises:
+            ValueError: If the height or moisture is not in the range [0, 1].
+
+        Returns:
+            None
+        """
+        if not (0 <= height <= 1):
+            raise ValueError(f"Height value {height} not in range [0, 1]")
+        if not (0 <= moisture <= 1):
+            raise ValueError(f"Moisture value {moisture} not in range [0, 1]")
+
+        biome_table = Tile.get_biome_table()
+        if biome_id is None:
+            biome_id = biome_table.get_biome(height, moisture)
+
+        self.height[row, col] = height
+        self.moisture[row, col] = moisture
+        self.biome_id[row, col] = biome_id
+        self.plant_growth[row, col] = biome_table.plant_growth[biome_id]
+        self.has_water[row, col] = biome_table.has_water[biome_id]
+
+        index = row * self.cols + col
+        self._update_tile_coast(index)
+        self._set_free_bit(self.land_neighbor_bits, index, not self.has_water[row, col])
+
+        for occupancy, free_tiles in [
+            (self.animal_id, self.free_animal_tiles),
+            (self.plant_id, self.free_plant_tiles),
+        ]:
+            if self.has_water[row, col] or occupancy[row, col] != Grid.EMPTY:
+                free_tiles.remove(index)
+            else:
+                free_tiles.add(index)
+
+    def _update_coast(self) -> None:
+        """
+        Update the mask of the coast tiles, which are water tiles with water on at least one side.
+
+        Returns:
+            None
+        """
+        # TODO improve this so it is in relation to distance to water
+        water_nearby = self.count_neighbors(self.has_water) > 0
+        np.logical_and(self.has_water, water_nearby, out=self.is_coast)
+
+    def _update_tile_coast(self, index: int) -> None:
+        """
+        Update the coast mask of a tile and its neighbors after the water of the tile changed.
+
+        Parameters:
+            index (int): The flat index of the tile.
+
+        Returns:
+            None
+        """
+        indices, valid = self.get_neighbor_table()
+        tiles = np.append(indices[index][valid[index]], index)
+        water = self.has_water.ravel()
+        water_nearby = (water[indices[tiles]] & valid[tiles]).any(axis=1)
+        self.is_coast.ravel()[tiles] = water[tiles] & water_nearby
+
+    def _update_land_neighbor_bits(self) -> None:
+        """
+        Update the bitmasks of the neighbors that are not water.
+
+        Returns:
+            None
+        """
+        indices, valid = self.get_neighbor_table()
+        land = ~self.has_water.ravel()[indices] & valid
+        self.land_neighbor_bits[...] = Grid._pack_neighbor_bits(land)
+
+    @staticmethod
+    def _pack_neighbor_bits(flags: np.ndarray) -> np.ndarray:
+        """
+        Pack flags of the 4 connected neighbors into one bitmask per tile.
+
+        Parameters:
+            flags (np.ndarray): A boolean array of shape (tiles, 4) ordered like the neighbor table.
+
+        Returns:
+            np.ndarray: The bitmasks, bit d is set if the flag of the d-th neighbor is set.
+        """
+        shifted = flags.astype(np.uint8) << np.arange(4, dtype=np.uint8)
+        return shifted.sum(axis=1, dtype=np.uint8)
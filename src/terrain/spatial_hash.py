@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import heapq
+from collections.abc import Hashable
+
+
+class SpatialHash:
+    """
+    Class representing a spatial index of items on tiles, bucketed by a uniform grid of square buckets.
+
+    Every item is stored in the bucket containing its tile, so a query only looks at the buckets overlapping the queried area.
+    A radius query takes time proportional to the number of buckets overlapping the circle and the items in them, a nearest neighbor query searches rings of buckets outwards until no closer item can be found.
+    Distances are euclidean distances between tile coordinates.
+
+    Attributes:
+        DEFAULT_BUCKET_SIZE (int): The default number of tiles along each side of a bucket.
+        bucket_size (int): The number of tiles along each side of a bucket.
+
+    Methods:
+        insert(item, row, col) -> None: Insert an item at a tile or move it there if it is already in the index.
+        remove(item) -> None: Remove an item from the index.
+        get_position(item) -> tuple[int, int] | None: Get the tile of an item.
+        query_radius(row, col, radius) -> list: Get all items within a radius of a tile.
+        query_nearest(row, col, k, max_radius=None) -> list: Get the k items nearest to a tile.
+    """
+
+    DEFAULT_BUCKET_SIZE: int = 8
+
+    def __init__(self, bucket_size: int = DEFAULT_BUCKET_SIZE) -> None:
+        """
+        Initialize an empty SpatialHash.
+
+        Parameters:
+            bucket_size (int): The number of tiles along each side of a bucket. Default is SpatialHash.DEFAULT_BUCKET_SIZE.
+
+        Raises:
+            ValueError: If the bucket size is smaller than 1.
+
+        Returns:
+            None
+        """
+        if bucket_size < 1:
+            raise ValueError(f"Bucket size {bucket_size} has to be at least 1.")
+
+        self.bucket_size: int = bucket_size
+        self._buckets: dict[tuple[int, int], dict[Hashable, tuple[int, int]]] = {}
+        self._positions: dict[Hashable, tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._positions
+
+    # region updates
+    def insert(self, item: Hashable, row: int, col: int) -> None:
+        """
+        Insert an item at the tile at the given row and column, an item already in the index is moved there.
+
+        Parameters:
+            item (Hashable): The item.
+            row (int): The row of the tile.
+            col (int): The column of the tile.
+
+        Returns:
+            None
+        """
+        if item in self._positions:
+            self.remove(item)
+        key = (row // self.bucket_size, col // self.bucket_size)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = {}
+        bucket[item] = (row, col)
+        self._positions[item] = (row, col)
+
+    def remove(self, item: Hashable) -> None:
+        """
+        Remove an item from the index, nothing happens if it is not in it.
+
+        Parameters:
+            item (Hashable): The item.
+
+        Returns:
+            None
+        """
+        position = self._positions.pop(item, None)
+        if position is None:
+            return
+        key = (position[0] // self.bucket_size, position[1] // self.bucket_size)
+        bucket = self._buckets[key]
+        del bucket[item]
+        if not bucket:
+            del self._buckets[key]
+
+    def get_position(self, item: Hashable) -> tuple[int, int] | None:
+        """
+        Get the tile of an item.
+
+        Parameters:
+            item (Hashable): The item.
+
+        Returns:
+            tuple[int, int] | None: The row and column of the tile, None if the item is not in the index.
+        """
+        return self._positions.get(item)
+
+    # endregion
+
+    # region queries
+    def query_radius(self, row: int, col: int, radius: float) -> list[Hashable]:
+        """
+        Get all items within a radius of the tile at the given row and column.
+
+        Parameters:
+            row (int): The row of the tile.
+            col (int): The column of the tile.
+            radius (float): The maximum distance of an item in tiles.
+
+        Returns:
+            list[Hashable]: The items in no particular order.
+        """
+        if radius < 0:
+            return []
+        size = self.bucket_size
+        reach = int(radius)
+        squared_radius = radius * radius
+
+        items = []
+        for bucket_row in range((row - reach) // size, (row + reach) // size + 1):
+            for bucket_col in range((col - reach) // size, (col + reach) // size + 1):
+                bucket = self._buckets.get((bucket_row, bucket_col))
+                if bucket is None:
+                    continue
+                for item, (item_row, item_col) in bucket.items():
+                    d_row = item_row - row
+                    d_col = item_col - col
+                    if d_row * d_row + d_col * d_col <= squared_radius:
+                        items.append(item)
+        return items
+
+    def query_nearest(
+        self, row: int, col: int, k: int, max_radius: float | None = None
+    ) -> list[Hashable]:
+        """
+        Get the k items nearest to the tile at the given row and column.
+
+        The rings of buckets around the bucket of the tile are searched outwards until k items have been found and no unsearched bucket can hold a closer one.
+
+        Parameters:
+            row (int): The row of the tile.
+            col (int): The column of the tile.
+            k (int): The maximum number of items.
+            max_radius (float | None): The maximum distance of an item in tiles, if None the distance is not limited. Default is None.
+
+        Returns:
+            list[Hashable]: The items ordered by their distance, ties in no particular order.
+        """
+        if k <= 0 or not self._positions:
+            return []
+        size = self.bucket_size
+        center_row, center_col = row // size, col // size
+        squared_max = None if max_radius is None else max_radius * max_radius
+
+        # Entries are (squared distance, insertion order, item) so items are never compared
+        candidates: list[tuple[int, int, Hashable]] = []
+        visited = 0
+        ring = 0
+        while True:
+            for key in SpatialHash._get_ring(center_row, center_col, ring):
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    continue
+                visited += len(bucket)
+                for item, (item_row, item_col) in bucket.items():
+                    d_row = item_row - row
+                    d_col = item_col - col
+                    distance = d_row * d_row + d_col * d_col
+                    if squared_max is None or distance <= squared_max:
+                        candidates.append((distance, len(candidates), item))
+
+            # The closest any item outside of the searched square of buckets can be
+            bound = min(
+                row - (center_row - ring) * size + 1,
+                (center_row + ring + 1) * size - row,
+                col - (center_col - ring) * size + 1,
+                (center_col + ring + 1) * size - col,
+            )
+            if visited == len(self._positions):
+                break
+            if squared_max is not None and bound * bound > squared_max:
+                break
+            if len(candidates) >= k:
+                kth = heapq.nsmallest(k, candidates)[-1][0]
+                if kth <= bound * bound:
+                    break
+            ring += 1
+
+        return [item for _, _, item in heapq.nsmallest(k, candidates)]
+
+    @staticmethod
+    def _get_ring(center_row: int, center_col: int, ring: int) -> list[tuple[int, int]]:
+        """
+        Get the keys of the buckets at the given chebyshev distance from a bucket.
+
+        Parameters:
+            center_row (int): The bucket row of the center.
+            center_col (int): The bucket column of the center.
+            ring (int): The chebyshev distance in buckets.
+
+        Returns:
+            list[tuple[int, int]]: The keys of the buckets.
+        """
+        if ring == 0:
+            return [(center_row, center_col)]
+        top, bottom = center_row - ring, center_row + ring
+        left, right = center_col - ring, center_col + ring
+        keys = [(top, col) for col in range(left, right + 1)]
+        keys += [(bottom, col) for col in range(left, right + 1)]
+        keys += [(row, left) for row in range(top + 1, bottom)]
+        keys += [(row, right) for row in range(top + 1, bottom)]
+        return keys
+
+    # endregion
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import random
+
+import numpy as np
+
+
+class SpawnIndex:
+    """
+    Class representing a set of flat tile indices supporting constant time insertion, removal and random sampling.
+
+    The indices are stored densely in an array together with the position of every index in it, removing an index moves the last index into its place.
+    This allows sampling without replacement in time proportional to the number of samples instead of the number of tiles.
+
+    Attributes:
+        capacity (int): The number of tiles, every index has to be smaller than it.
+
+    Methods:
+        add(index) -> None: Add an index to the set.
+        remove(index) -> None: Remove an index from the set.
+        reset(mask) -> None: Replace the content of the set by the indices for which a mask is set.
+        get_indices() -> np.ndarray: Get all indices of the set.
+        sample(amount, weights=None, max_weight=None) -> np.ndarray: Get distinct random indices of the set.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initialize an empty SpawnIndex.
+
+        Parameters:
+            capacity (int): The number of tiles, every index has to be smaller than it.
+
+        Returns:
+            None
+        """
+        self.capacity: int = capacity
+        self._indices: np.ndarray = np.zeros(capacity, dtype=np.int64)
+        self._positions: np.ndarray = np.full(capacity, -1, dtype=np.int64)
+        self._size: int = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, index: int) -> bool:
+        return self._positions.item(index) >= 0
+
+    def add(self, index: int) -> None:
+        """
+        Add an index to the set, nothing happens if it is already in it.
+
+        Parameters:
+            index (int): The flat index of the tile.
+
+        Returns:
+            None
+        """
+        if self._positions.item(index) >= 0:
+            return
+        self._indices[self._size] = index
+        self._positions[index] = self._size
+        self._size += 1
+
+    def remove(self, index: int) -> None:
+        """
+        Remove an index from the set, nothing happens if it is not in it.
+
+        Parameters:
+            index (int): The flat index of the tile.
+
+        Returns:
+            None
+        """
+        position = self._positions.item(index)
+        if position < 0:
+            return
+        self._size -= 1
+        last = self._indices.item(self._size)
+        self._indices[position] = last
+        self._positions[last] = position
+        self._positions[index] = -1
+
+    def reset(self, mask: np.ndarray) -> None:
+        """
+        Replace the content of the set by the indices for which the mask is set.
+
+        Parameters:
+            mask (np.ndarray): A boolean array with one value per tile.
+
+        Returns:
+            None
+        """
+        indices = np.flatnonzero(mask)
+        self._size = len(indices)
+        self._indices[: self._size] = indices
+        self._positions.fill(-1)
+        self._positions[indices] = np.arange(self._size)
+
+    def get_indices(self) -> np.ndarray:
+        """
+        Get all indices of the set in no particular order.
+
+        Returns:
+            np.ndarray: A copy of the indices.
+        """
+        return self._indices[: self._size].copy()
+
+    def sample(
+        self,
+        amount: int,
+        weights: np.ndarray | None = None,
+        max_weight: float | None = None,
+    ) -> np.ndarray:
+        """
+        Get distinct random indices of the set, optionally with a probability proportional to a weight per tile.
+
+        Uniform samples are drawn directly from the dense array.
+        Weighted samples are drawn by rejection, which takes time proportional to the amount as long as the weights of the indices are not far below the maximum weight.
+        If the rejection takes too long, for example because most of the set is sampled, the samples are drawn from all indices at once instead.
+
+        Parameters:
+            amount (int): The number of indices, at most the size of the set are returned.
+            weights (np.ndarray | None): The non negative weight of every tile, if None all indices are equally likely. Default is None.
+            max_weight (float | None): An upper bound of the weights, if None it is computed from the weights. Default is None.
+
+        Returns:
+            np.ndarray: The sampled indices.
+        """
+        amount = max(0, min(int(amount), self._size))
+        if weights is None:
+            positions = random.sample(range(self._size), amount)
+            return self._indices[positions]
+
+        if max_weight is None:
+            max_weight = float(weights.max()) if len(weights) else 0
+        if amount == 0 or max_weight <= 0:
+            return np.zeros(0, dtype=np.int64)
+
+        sampled: dict[int, None] = {}
+        for _ in range(4 * amount + 64):
+            if len(sampled) == amount:
+                return np.fromiter(sampled, dtype=np.int64, count=amount)
+            index = self._indices.item(int(random.random() * self._size))
+            if index not in sampled and random.random() * max_weight < weights[index]:
+                sampled[index] = None
+
+        # Rejection did not finish in time, sample from all weights instead
+        indices = self._indices[: self._size]
+        probabilities = weights[indices].astype(np.float64)
+        amount = min(amount, np.count_nonzero(probabilities))
+        if amount == 0:
+            return np.zeros(0, dtype=np.int64)
+        probabilities /= probabilities.sum()
+        return np.random.choice(indices, size=amount, replace=False, p=probabilities)
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable
+
+import numpy as np
+
+
+class TerrainCache:
+    """
+    Class representing a cache of generated terrain fields with a memory budget and least recently used eviction.
+
+    The fields are stored under a key describing all parameters they were generated with, so switching back to a previously generated configuration does not require any noise to be sampled again.
+
+    Attributes:
+        DEFAULT_MEMORY_BUDGET (int): The default memory budget in bytes.
+        memory_budget (int): The maximum number of bytes the cached fields may use.
+        memory_usage (int): The number of bytes the cached fields currently use.
+
+    Methods:
+        get(key) -> np.ndarray | None: Get the field stored under a key and mark it as recently used.
+        put(key, field) -> None: Store a field under a key, evicting the least recently used fields if needed.
+        set_memory_budget(value) -> None: Set the memory budget, evicting fields if needed.
+        clear() -> None: Remove all fields from the cache.
+    """
+
+    DEFAULT_MEMORY_BUDGET: int = 64 * 1024 * 1024
+
+    def __init__(self, memory_budget: int = DEFAULT_MEMORY_BUDGET) -> None:
+        """
+        Initialize an empty TerrainCache.
+
+        Parameters:
+            memory_budget (int): The maximum number of bytes the cached fields may use. Default is TerrainCache.DEFAULT_MEMORY_BUDGET.
+
+        Raises:
+            ValueError: If the memory budget is negative.
+
+        Returns:
+            None
+        """
+        if memory_budget < 0:
+            raise ValueError(f"Memory budget {memory_budget} can not be negative.")
+
+        self.memory_budget: int = memory_budget
+        self.memory_usage: int = 0
+        self._fields: OrderedDict[Hashable, np.ndarray] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._fields
+
+    def get(self, key: Hashable) -> np.ndarray | None:
+        """
+        Get the field stored under the given key and mark it as the most recently used one.
+
+        Parameters:
+            key (Hashable): The key describing the parameters the field was generated with.
+
+        Returns:
+            np.ndarray | None: The read only field or None if no field is stored under the key.
+        """
+        field = self._fields.get(key)
+        if field is not None:
+            self._fields.move_to_end(key)
+        return field
+
+    def put(self, key: Hashable, field: np.ndarray) -> None:
+        """
+        Store a field under the given key.
+
+        The least recently used fields are evicted until the field fits into the memory budget.
+        Fields that are bigger than the whole memory budget are not stored.
+        The field is made read only so it can be shared safely, also if it is too big to be stored.
+
+        Parameters:
+            key (Hashable): The key describing the parameters the field was generated with.
+            field (np.ndarray): The generated field.
+
+        Returns:
+            None
+        """
+        field.flags.writeable = False
+        if key in self._fields:
+            self.memory_usage -= self._fields.pop(key).nbytes
+
+        if field.nbytes > self.memory_budget:
+            return
+
+        self._fields[key] = field
+        self.memory_usage += field.nbytes
+        self._evict()
+
+    def set_memory_budget(self, value: int) -> None:
+        """
+        Set the memory budget of the cache, evicting the least recently used fields if they do not fit anymore.
+
+        Parameters:
+            value (int): The maximum number of bytes the cached fields may use.
+
+        Raises:
+            ValueError: If the memory budget is negative.
+
+        Returns:
+            None
+        """
+        if value < 0:
+            raise ValueError(f"Memory budget {value} can not be negative.")
+        self.memory_budget = value
+        self._evict()
+
+    def clear(self) -> None:
+        """
+        Remove all fields from the cache.
+
+        Returns:
+            None
+        """
+        self._fields.clear()
+        self.memory_usage = 0
+
+    def _evict(self) -> None:
+        """
+        Evict the least recently used fields until the memory usage is within the memory budget.
+
+        Returns:
+            None
+        """
+        while self.memory_usage > self.memory_budget:
+            _, field = self._fields.popitem(last=False)
+            self.memory_usage -= field.nbytes
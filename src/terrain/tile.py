@@ -1,16 +1,24 @@
 from __future__ import annotations
 
-import random
+import math
+from typing import TYPE_CHECKING
 
 import pygame
 
+from .biome_table import BiomeTable
 from .direction import Direction
 
+if TYPE_CHECKING:
+    from .grid import Grid
 
-class Tile(pygame.sprite.Sprite):
+
+class Tile:
     """
     Class representing a tile in a game world.
 
+    A tile is a view of one cell of a Grid, all of its terrain attributes and the organisms on it are read from and written to the arrays of the grid.
+    The color and plant growth of the biomes are shared by all tiles through the biome table and the tile only stores its grid, row and column in slots, so a tile takes a constant and small amount of memory.
+
     Attributes:
         WATER_COLOR: pygame.Color - Color representing water tiles.
         SAND_COLOR: pygame.Color - Color representing sand tiles.
@@ -43,21 +51,35 @@ class Tile(pygame.sprite.Sprite):
         VERY_FAVORABLE_GROWTH: float - Very favorable growth value.
         OPTIMAL_GROWTH: float - Optimal growth value.
 
+    Class Methods:
+        get_biomes(cls) -> dict[str, tuple[pygame.Color, float, bool]]:
+            Get the color, plant growth potential and water flag of every biome.
+        get_biome_zones(cls) -> list[tuple[float, list[tuple[float, str]]]]:
+            Get the height zones and the moisture thresholds of their biomes.
+        get_biome_table(cls) -> BiomeTable:
+            Get the lookup table from height and moisture to biome.
+        rebuild_biome_table(cls) -> None:
+            Rebuild the biome lookup table from the current class constants.
+
     Methods:
-        __init__(self, rect: pygame.Rect, height: float = 0, moisture: float = 0, is_border: bool = False) -> None:
-            Initialize a Tile object.
+        __init__(self, grid: Grid, row: int, col: int) -> None:
+            Initialize a Tile object viewing a cell of a grid.
+        set_terrain(self, height: float, moisture: float, biome_id: int | None = None) -> None:
+            Set the height and moisture of the tile at once.
         draw(self, screen: pygame.Surface) -> None:
             Draw the tile on the screen.
         add_animal(self, animal) -> None:
             Add an animal to the tile.
         add_plant(self, plant) -> None:
             Add a plant to the tile.
+        remove_animal(self, animal) -> None:
+            Remove an animal from the tile.
+        remove_plant(self, plant) -> None:
+            Remove a plant from the tile.
         has_animal(self) -> bool:
             Check if the tile has an animal.
         has_plant(self) -> bool:
             Check if the tile has a plant.
-        add_neighbor(self, direction: Direction, tile: Tile) -> None:
-            Add a neighboring tile in a specific direction.
         get_possible_directions(self) -> list[Direction]:
             Get a list of directions representing neighboring tiles.
         get_neighboring_tiles(self) -> list[Tile]:
@@ -66,10 +88,14 @@ class Tile(pygame.sprite.Sprite):
             Get the neighboring tile in a specified direction.
         get_random_neigbor(self, needs_plant=False, needs_no_plant=False, needs_animal=False, needs_no_animal=False, needs_water=False, needs_no_water=False) -> Tile | None:
             Get a random neighboring tile based on specified criteria.
+        get_food_tile(self) -> Tile | None:
+            Get the neighboring tile one step closer to the nearest plant.
         is_neighboring_tile(self, tile: Tile) -> bool:
             Check if a given tile is a neighbor of the current tile.
     """
 
+    __slots__ = ("grid", "row", "col")
+
     # region colors
     WATER_COLOR: pygame.Color = pygame.Color(26, 136, 157)
     SAND_COLOR: pygame.Color = pygame.Color(228, 232, 202)
@@ -126,52 +152,197 @@ class Tile(pygame.sprite.Sprite):
     # endregion
     # endregion
 
-    def __init__(
-        self,
-        rect: pygame.Rect,
-        height: float = 0,
-        moisture: float = 0,
-        is_border: bool = False,
-    ) -> None:
+    # region biomes
+    _biome_table: BiomeTable | None = None
+
+    @classmethod
+    def get_biomes(cls) -> dict[str, tuple[pygame.Color, float, bool]]:
         """
-        Initialize a Tile object.
+        Get the color, plant growth potential and water flag of every biome from the current class constants.
 
-        Parameters:
-        - rect (pygame.Rect): The rectangle representing the tile.
-        - height (float): The height level of the tile, ranging from 0 to 1. Default is 0.
-        - moisture (float): The moisture level of the tile, ranging from 0 to 1. Default is 0.
-        - is_border (bool): Flag indicating if the tile is a border tile. Default is False.
+        Returns:
+            dict[str, tuple[pygame.Color, float, bool]]: The attributes of every biome by name.
+        """
+        return {
+            "Water": (cls.WATER_COLOR, cls.WATER_PLANT_GROWTH, True),
+            "Beach": (cls.SAND_COLOR, cls.BEACH_PLANT_GROWTH, False),
+            "Subtropical Desert": (
+                cls.SUBTROPICAL_DESERT_COLOR,
+                cls.SUBTROPICAL_DESERT_PLANT_GROWTH,
+                False,
+            ),
+            "Grassland": (cls.GRASSLAND_COLOR, cls.GRASSLAND_PLANT_GROWTH, False),
+            "Tropical Seasonal Forest": (
+                cls.TROPICAL_SEASONAL_FOREST_COLOR,
+                cls.TROPICAL_SEASON_FOREST_PLANT_GROWTH,
+                False,
+            ),
+            "Tropical Rain Forest": (
+                cls.TROPICAL_RAIN_FOREST_COLOR,
+                cls.TROPICAL_RAIN_FOREST_PLANT_GROWTH,
+                False,
+            ),
+            "Temperate Desert": (
+                cls.TEMPERATE_DESERT_COLOR,
+                cls.TEMPERATE_DESERT_PLANT_GROWTH,
+                False,
+            ),
+            "Temperate Deciduous Forest": (
+                cls.TEMPERATE_DECIDUOUS_FOREST_COLOR,
+                cls.TEMPERATER_DECIDOUS_FOREST_PLANT_GROWTH,
+                False,
+            ),
+            "Temperate Rain Forest": (
+                cls.TEMPERATE_RAIN_FOREST_COLOR,
+                cls.TEMPERATE_RAIN_FOREST_PLANT_GROWTH,
+                False,
+            ),
+            "Shrubland": (cls.SHRUBLAND_COLOR, cls.SHRUBLAND_PLANT_GROWTH, False),
+            "Taiga": (cls.TAIGA_COLOR, cls.TAIGA_PLANT_GROWTH, False),
+            "Scorched": (cls.SCORCHED_COLOR, cls.SCORCHED_PLANT_GROWTH, False),
+            "Bare": (cls.BARE_COLOR, cls.BARE_PLANT_GROWTH, False),
+            "Tundra": (cls.TUNDRA_COLOR, cls.TUNDRA_PLANT_GROWTH, False),
+            "Snow": (cls.SNOW_COLOR, cls.SNOW_PLANT_GROWTH, False),
+        }
+
+    @classmethod
+    def get_biome_zones(cls) -> list[tuple[float, list[tuple[float, str]]]]:
+        """
+        Get the height zones from the current class constants.
+
+        Every zone is described by its upper height level (inclusive) and its biomes ordered by their upper moisture threshold (exclusive).
 
         Returns:
-        - None
+            list[tuple[float, list[tuple[float, str]]]]: The height zones ordered by height.
+        """
+        # TODO add all these as settings
+        # TODO update this so not every tile close to water is sand but it depends on moisture
+        return [
+            (cls.WATER_HEIGHT_LEVEL, [(math.inf, "Water")]),
+            (cls.BEACH_HEIGHT_LEVEL, [(math.inf, "Beach")]),
+            (
+                cls.TROPICAL_HEIGHT_LEVEL,
+                [
+                    (0.16, "Subtropical Desert"),
+                    (0.33, "Grassland"),
+                    (0.66, "Tropical Seasonal Forest"),
+                    (math.inf, "Tropical Rain Forest"),
+                ],
+            ),
+            (
+                cls.TEMPERATE_HEIGHT_LEVEL,
+                [
+                    (0.16, "Temperate Desert"),
+                    (0.50, "Grassland"),
+                    (0.83, "Temperate Deciduous Forest"),
+                    (math.inf, "Temperate Rain Forest"),
+                ],
+            ),
+            (
+                cls.TRANSITION_HEIGHT_LEVEL,
+                [
+                    (0.33, "Temperate Desert"),
+                    (0.66, "Shrubland"),
+                    (math.inf, "Taiga"),
+                ],
+            ),
+            (
+                cls.MOUNTAIN_HEIGHT_LEVEL,
+                [
+                    (0.1, "Scorched"),
+                    (0.2, "Bare"),
+                    (0.5, "Tundra"),
+                    (math.inf, "Snow"),
+                ],
+            ),
+        ]
+
+    @classmethod
+    def get_biome_table(cls) -> BiomeTable:
+        """
+        Get the lookup table from height and moisture to biome, building it if it does not exist yet.
+
+        Returns:
+            BiomeTable: The biome lookup table.
         """
-        pygame.sprite.Sprite.__init__(self)
+        if Tile._biome_table is None:
+            cls.rebuild_biome_table()
+        return Tile._biome_table
 
-        self.rect: pygame.Rect = rect
-        self.image: pygame.Surface = pygame.Surface(self.rect.size)
-        self.neighbors: dict[Direction, Tile] = {}
-        self._height: float = height
-        self._moisture: float = moisture
+    @classmethod
+    def rebuild_biome_table(cls) -> None:
+        """
+        Rebuild the biome lookup table from the current class constants.
+
+        This has to be called after a threshold, color or growth value has been changed, the setters of the height levels do so automatically.
+        Existing tiles keep their attributes until their height or moisture is set again.
+
+        Returns:
+            None
+        """
+        Tile._biome_table = BiomeTable(cls.get_biomes(), cls.get_biome_zones())
+
+    @classmethod
+    def set_water_height_level(cls, value: float) -> None:
+        cls.WATER_HEIGHT_LEVEL = value
+        cls.rebuild_biome_table()
+
+    @classmethod
+    def set_beach_height_level(cls, value: float) -> None:
+        cls.BEACH_HEIGHT_LEVEL = value
+        cls.rebuild_biome_table()
+
+    @classmethod
+    def set_tropical_height_level(cls, value: float) -> None:
+        cls.TROPICAL_HEIGHT_LEVEL = value
+        cls.rebuild_biome_table()
+
+    @classmethod
+    def set_temperate_height_level(cls, value: float) -> None:
+        cls.TEMPERATE_HEIGHT_LEVEL = value
+        cls.rebuild_biome_table()
+
+    @classmethod
+    def set_transition_height_level(cls, value: float) -> None:
+        cls.TRANSITION_HEIGHT_LEVEL = value
+        cls.rebuild_biome_table()
+
+    @classmethod
+    def set_mountain_height_level(cls, value: float) -> None:
+        cls.MOUNTAIN_HEIGHT_LEVEL = value
+        cls.rebuild_biome_table()
 
-        self.plant_growth_potential: float
-        self.color: pygame.Color
-        self.has_water: bool
-        self._set_height_moisture_dependent_attributes()
+    # endregion
 
-        self.animal: pygame.sprite.GroupSingle = pygame.sprite.GroupSingle()
-        self.plant: pygame.sprite.GroupSingle = pygame.sprite.GroupSingle()
+    def __init__(self, grid: Grid, row: int, col: int) -> None:
+        """
+        Initialize a Tile object viewing a cell of a grid.
 
-        self.is_border: bool = is_border
-        self.is_coast: bool = False
+        Parameters:
+        - grid (Grid): The grid storing the attributes of the tile.
+        - row (int): The row of the tile in the grid.
+        - col (int): The column of the tile in the grid.
 
-        # region stats
-        self.times_visted: int = 0
-        # endregion
+        Returns:
+        - None
+        """
+        self.grid: Grid = grid
+        self.row: int = row
+        self.col: int = col
 
     # region properties
+    @property
+    def index(self) -> int:
+        return self.row * self.grid.cols + self.col
+
+    @property
+    def rect(self) -> pygame.Rect:
+        size = self.grid.tile_size
+        return pygame.Rect(self.col * size, self.row * size, size, size)
+
     @property
     def moisture(self) -> float:
-        return self._moisture
+        return float(self.grid.moisture[self.row, self.col])
 
     @moisture.setter
     def moisture(self, value: float) -> None:
@@ -191,13 +362,11 @@ class Tile(pygame.sprite.Sprite):
             raise ValueError("Moisture value is smaller than 0")
         elif value > 1:
             raise ValueError("Moisture value is bigger than 1")
-        else:
-            self._moisture = value
-        self._set_height_moisture_dependent_attributes()
+        self.grid.set_tile_terrain(self.row, self.col, self.height, value)
 
     @property
     def height(self) -> float:
-        return self._height
+        return float(self.grid.height[self.row, self.col])
 
     @height.setter
     def height(self, value: float) -> None:
@@ -217,113 +386,75 @@ class Tile(pygame.sprite.Sprite):
             raise ValueError("Height value is smaller than 0")
         elif value > 1:
             raise ValueError("Height value is bigger than 1")
-        else:
-            self._height = value
-        self._set_height_moisture_dependent_attributes()
+        self.grid.set_tile_terrain(self.row, self.col, value, self.moisture)
+
+    @property
+    def biome_id(self) -> int:
+        return int(self.grid.biome_id[self.row, self.col])
+
+    @property
+    def plant_growth_potential(self) -> float:
+        return float(self.grid.plant_growth[self.row, self.col])
+
+    @property
+    def color(self) -> pygame.Color:
+        return Tile.get_biome_table().colors[self.biome_id]
+
+    @property
+    def has_water(self) -> bool:
+        return bool(self.grid.has_water[self.row, self.col])
+
+    @property
+    def is_border(self) -> bool:
+        return bool(self.grid.is_border[self.row, self.col])
+
+    @property
+    def is_coast(self) -> bool:
+        return bool(self.grid.is_coast[self.row, self.col])
+
+    @property
+    def animal(self):
+        return self.grid.get_organism(int(self.grid.animal_id[self.row, self.col]))
+
+    @property
+    def plant(self):
+        return self.grid.get_organism(int(self.grid.plant_id[self.row, self.col]))
+
+    @property
+    def times_visted(self) -> int:
+        return int(self.grid.times_visited[self.row, self.col])
+
+    @times_visted.setter
+    def times_visted(self, value: int) -> None:
+        self.grid.times_visited[self.row, self.col] = value
 
     # endregion
 
     # region setup
-    def _set_height_moisture_dependent_attributes(self) -> None:
+    def set_terrain(
+        self, height: float, moisture: float, biome_id: int | None = None
+    ) -> None:
         """
-        Set the color and plant growth potential attributes of a Tile object based on its height and moisture levels.
+        Set the height and moisture level of the Tile object at once.
+
+        Parameters:
+        - height (float): The height value to be set. Should be between 0 and 1.
+        - moisture (float): The moisture level to be set. Should be between 0 and 1.
+        - biome_id (int | None): The id of the biome at this height and moisture if it is already known. Default is None.
+
+        Raises:
+        - ValueError: If the provided height or moisture value is smaller than 0 or bigger than 1.
+
+        Returns:
+        - None
         """
-        # TODO add all these as settings
-        self.has_water = False
-
-        if self.height <= Tile.WATER_HEIGHT_LEVEL:
-            # Waterlogged, no growth
-            self.plant_growth_potential = Tile.WATER_PLANT_GROWTH
-            self.color = Tile.WATER_COLOR
-            self.has_water = True
-        elif (
-            self.height <= Tile.BEACH_HEIGHT_LEVEL
-        ):  # TODO update this so not every tile close to water is sand but it depends on moisture
-            # Sandy areas have limited growth
-            self.plant_growth_potential = Tile.BEACH_PLANT_GROWTH
-            self.color = Tile.SAND_COLOR
-        elif self.height <= Tile.TROPICAL_HEIGHT_LEVEL:
-            if self.moisture < 0.16:
-                # Subtropical desert, low growth
-                self.plant_growth_potential = Tile.SUBTROPICAL_DESERT_PLANT_GROWTH
-                self.color = Tile.SUBTROPICAL_DESERT_COLOR
-            elif self.moisture < 0.33:
-                # Grassland, favorable
-                self.plant_growth_potential = Tile.GRASSLAND_PLANT_GROWTH
-                self.color = Tile.GRASSLAND_COLOR
-            elif self.moisture < 0.66:
-                # Tropical seasonal forest, favorable
-                self.plant_growth_potential = Tile.TROPICAL_SEASON_FOREST_PLANT_GROWTH
-                self.color = Tile.TROPICAL_SEASONAL_FOREST_COLOR
-            else:
-                # Tropical rain forest, very favorable
-                self.plant_growth_potential = Tile.TROPICAL_RAIN_FOREST_PLANT_GROWTH
-                self.color = Tile.TROPICAL_RAIN_FOREST_COLOR
-        elif self.height <= Tile.TEMPERATE_HEIGHT_LEVEL:
-            if self.moisture < 0.16:
-                # Temperate desert, low growth
-                self.plant_growth_potential = Tile.TEMPERATE_DESERT_PLANT_GROWTH
-                self.color = Tile.TEMPERATE_DESERT_COLOR
-            elif self.moisture < 0.50:
-                # Grassland, favorable
-                self.plant_growth_potential = Tile.GRASSLAND_PLANT_GROWTH
-                self.color = Tile.GRASSLAND_COLOR
-            elif self.moisture < 0.83:
-                # Temperate deciduous forest, very favorable
-                self.plant_growth_potential = (
-                    Tile.TEMPERATER_DECIDOUS_FOREST_PLANT_GROWTH
-                )
-                self.color = Tile.TEMPERATE_DECIDUOUS_FOREST_COLOR
-            else:
-                # Temperate rain forest, optimal
-                self.plant_growth_potential = Tile.TEMPERATE_RAIN_FOREST_PLANT_GROWTH
-                self.color = Tile.TEMPERATE_RAIN_FOREST_COLOR
-        elif self.height <= Tile.TRANSITION_HEIGHT_LEVEL:
-            if self.moisture < 0.33:
-                # Temperate desert, low growth
-                self.plant_growth_potential = Tile.TEMPERATE_DESERT_PLANT_GROWTH
-                self.color = Tile.TEMPERATE_DESERT_COLOR
-            elif self.moisture < 0.66:
-                # Shrubland, moderate growth
-                self.plant_growth_potential = Tile.SHRUBLAND_PLANT_GROWTH
-                self.color = Tile.SHRUBLAND_COLOR
-            else:
-                # Taiga, favorable
-                self.plant_growth_potential = Tile.TAIGA_PLANT_GROWTH
-                self.color = Tile.TAIGA_COLOR
-        elif self.height <= Tile.MOUNTAIN_HEIGHT_LEVEL:
-            if self.moisture < 0.1:
-                # Scorched, minimal growth
-                self.plant_growth_potential = Tile.SCORCHED_PLANT_GROWTH
-                self.color = Tile.SCORCHED_COLOR
-            elif self.moisture < 0.2:
-                # Bare, low growth
-                self.plant_growth_potential = Tile.BARE_PLANT_GROWTH
-                self.color = Tile.BARE_COLOR
-            elif self.moisture < 0.5:
-                # Tundra, moderate growth
-                self.plant_growth_potential = Tile.TUNDRA_PLANT_GROWTH
-                self.color = Tile.TUNDRA_COLOR
-            else:
-                # Snow, slightly favorable
-                self.plant_growth_potential = Tile.SNOW_PLANT_GROWTH
-                self.color = Tile.SNOW_COLOR
-
-        if self.color is None:
-            raise ValueError(
-                f"Color has not been set. moisture={self.moisture} height={self.height}"
-            )
-        if self.plant_growth_potential is None:
-            raise ValueError(
-                f"Plant growth has not been set. moisture={self.moisture} height={self.height}"
-            )
-        self.image.fill(self.color)
+        self.grid.set_tile_terrain(self.row, self.col, height, moisture, biome_id)
 
     # endregion
 
     # region main methods
     def draw(self, screen: pygame.Surface) -> None:
-        screen.blit(self.image, self.rect)
+        screen.fill(self.color, self.rect)
 
     # endregion
 
@@ -346,7 +477,7 @@ class Tile(pygame.sprite.Sprite):
         if self.has_animal():
             raise ValueError("Trying to add an animal despite tile already holding one")
 
-        self.animal.add(animal)
+        self.grid.place_animal(self.row, self.col, animal)
         self.times_visted += 1
 
         if animal.tile != self:
@@ -372,38 +503,48 @@ class Tile(pygame.sprite.Sprite):
         if self.has_plant():
             raise ValueError("Trying to add an plant despite tile already holding one")
 
-        self.plant.add(plant)
+        self.grid.place_plant(self.row, self.col, plant)
 
         if plant.tile != self:
             raise ValueError(
                 "Plant's tile reference not matching with tile's plant reference"
             )
 
-    def has_animal(self) -> bool:
-        return self.animal
+    def remove_animal(self, animal) -> None:
+        """
+        Remove an animal from the Tile object, nothing happens if the animal is not on the tile.
 
-    def has_plant(self) -> bool:
-        return self.plant
+        Parameters:
+        - animal: The animal object to be removed from the tile.
 
-    # endregion
+        Returns:
+        - None
+        """
+        if self.animal is animal:
+            self.grid.remove_animal(self.row, self.col)
 
-    # region tiles
-    def add_neighbor(self, direction: Direction, tile: Tile) -> None:
+    def remove_plant(self, plant) -> None:
         """
-        Add a neighboring Tile to the current Tile object in a specific direction.
+        Remove a plant from the Tile object, nothing happens if the plant is not on the tile.
 
         Parameters:
-        - direction (helper.direction.Direction): The direction in which the neighboring Tile is located.
-        - tile (Tile): The neighboring Tile object to be added.
+        - plant: The plant object to be removed from the tile.
 
         Returns:
         - None
         """
-        self.neighbors[direction] = tile
-        self.is_coast = self.is_coast or (
-            tile.has_water and self.has_water
-        )  # TODO improve this so it is in relation to distance to water
+        if self.plant is plant:
+            self.grid.remove_plant(self.row, self.col)
+
+    def has_animal(self) -> bool:
+        return bool(self.grid.animal_id[self.row, self.col] != self.grid.EMPTY)
+
+    def has_plant(self) -> bool:
+        return bool(self.grid.plant_id[self.row, self.col] != self.grid.EMPTY)
+
+    # endregion
 
+    # region tiles
     def get_possible_directions(self) -> list[Direction]:
         """
         Return a list of directions representing neighboring Tiles relative to the current Tile object.
@@ -411,16 +552,24 @@ class Tile(pygame.sprite.Sprite):
         Returns:
             list[helper.direction.Direction]: A list of directions representing neighboring Tiles.
         """
-        return list(self.neighbors.keys())
+        return [
+            direction
+            for direction in self.grid.DIRECTION_OFFSETS
+            if self.get_neighbor_tile(direction) is not None
+        ]
 
     def get_neighboring_tiles(self) -> list[Tile]:
         """
         Return a list of neighboring Tile objects relative to the current Tile object.
 
+        The neighbors are looked up in the precomputed neighbor table of the grid.
+
         Returns:
             list[Tile]: A list of neighboring Tile objects.
         """
-        return list(self.neighbors.values())
+        tiles = self.grid.tiles
+        indices = self.grid.get_neighbor_indices(self.index)
+        return [tiles[index] for index in indices.tolist()]
 
     def get_neighbor_tile(self, direction: Direction) -> Tile | None:
         """
@@ -432,7 +581,8 @@ class Tile(pygame.sprite.Sprite):
         Returns:
         - Tile | None: The neighboring Tile object if it exists in the specified direction, None otherwise.
         """
-        return self.neighbors.get(direction, None)
+        row_offset, col_offset = self.grid.DIRECTION_OFFSETS[direction]
+        return self.grid.get_tile(self.row + row_offset, self.col + col_offset)
 
     def get_random_neigbor(
         self,
@@ -446,6 +596,8 @@ class Tile(pygame.sprite.Sprite):
         """
         Return a random neighboring Tile object based on specified criteria.
 
+        The neighbor is sampled from the neighbor bitmasks of the grid, see Grid.sample_neighbor.
+
         Parameters:
         - needs_plant (bool, optional): If True, the neighboring Tile must have a plant. Defaults to False.
         - needs_no_plant (bool, optional): If True, the neighboring Tile must not have a plant. Defaults to False.
@@ -474,37 +626,48 @@ class Tile(pygame.sprite.Sprite):
                 f"Conflicting needs needs_water={needs_water} and needs_no_water={needs_no_water}"
             )
 
-        options = []
-        for tile in self.neighbors.values():
-            if needs_plant and not tile.has_plant():
-                continue
-            if needs_no_plant and tile.has_plant():
-                continue
-            if needs_animal and not tile.has_animal():
-                continue
-            if needs_no_animal and tile.has_animal():
-                continue
-            if needs_water and tile.has_water:
-                continue
-            if needs_no_water and tile.has_water:
-                continue
-            options.append(tile)
-
-        try:
-            return random.choice(options)
-        except IndexError:  # If no choices
+        index = self.grid.sample_neighbor(
+            self.index,
+            needs_plant,
+            needs_no_plant,
+            needs_animal,
+            needs_no_animal,
+            needs_water,
+            needs_no_water,
+        )
+        if index is None:  # If no choices
             return None
+        return self.grid.tiles[index]
+
+    def get_food_tile(self) -> Tile | None:
+        """
+        Return the neighboring Tile object one step closer to the nearest plant.
+
+        The step is looked up in the food field of the grid, which is as recent as the last call of Grid.update_food_field.
+
+        Returns:
+        - Tile | None: The neighboring Tile object, None if no plant can be reached or the tile is already closest to one.
+        """
+        index = self.grid.food_step.item(self.index)
+        if index == self.grid.EMPTY:
+            return None
+        return self.grid.tiles[index]
 
     def is_neighboring_tile(self, tile: Tile) -> bool:
         """
         Check if a given Tile object is a neighbor of the current Tile object.
 
+        Only the coordinates of the tiles are compared, so the check takes constant time.
+
         Parameters:
         - tile (Tile): The Tile object to check for neighbor relationship.
 
         Returns:
         - bool: True if the provided Tile object is a neighbor of the current Tile object, False otherwise.
         """
-        return tile in self.neighbors.values()
+        return (
+            tile.grid is self.grid
+            and abs(tile.row - self.row) + abs(tile.col - self.col) == 1
+        )
 
     # endregion
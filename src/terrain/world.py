@@ -1,16 +1,22 @@
 from __future__ import annotations
 
-import random
+import threading
+import time
 
+import numpy as np
+import opensimplex
 import pygame
 import pygame_menu
 
 from ..entities.animal import Animal
+from ..entities.organism import Organism
 from ..entities.plant import Plant
 from ..helper.noise_function import NoiseFunction
-from ..helper.setting import BoundedSetting
+from ..helper.setting import BoundedSetting, Setting
 from ..settings import simulation
-from .direction import Direction
+from .grid import Grid
+from .spawn_index import SpawnIndex
+from .terrain_cache import TerrainCache
 from .tile import Tile
 
 
@@ -20,36 +26,59 @@ class World(pygame.sprite.Sprite):
 
     Attributes:
         loading_screen_theme: The theme for the loading screen.
+        PARALLEL_GENERATION_MIN_TILES: The number of tiles from which on the noise fields are generated by a process pool.
+        GENERATION_BANDS: The number of row bands a noise field is generated in by the background generation, progress is reported after every band.
+        PREVIEW_STRIDE: The number of tiles along each side of a cell of the coarse terrain preview.
+        PREVIEW_SETTLE_TIME: The number of seconds a noise function has to stay unchanged before the preview is refined to full resolution.
+        TERRAIN_SNAPSHOT_VERSION: The version of the terrain snapshot file format.
         age: The age of the world.
         rect: The rectangle representing the world.
         image: The surface for the world.
         organism_surface: The surface for organisms.
         ground_surface: The surface for the ground.
         generating: Flag indicating if the world is generating.
-        progress: The progress of the world generation.
+        progress: The progress of the world generation in percent of the rows generated.
         progress_bar: The progress bar for the generation.
+        previewing: Flag indicating if the ground surface shows a coarse preview instead of the tiles.
         tile_size: The size of the tiles in the world.
         cols: The number of columns in the world.
         rows: The number of rows in the world.
-        tiles: The group of tiles in the world.
+        grid: The arrays storing the attributes of all tiles.
+        tiles: The tiles of the world in row major order.
+        tiles_grid: The tiles of the world ordered by row and column.
+        _raw_height_field: The cached weighted height noise before the height setting is applied.
+        _raw_moisture_field: The cached weighted moisture noise before the moisture setting is applied.
+        terrain_cache: The cache of previously generated noise fields keyed by their generation parameters.
+        _generation_thread: The thread generating the noise fields in the background.
+        _generation_token: The token of the latest background generation, results of older generations are discarded.
+        _generation_result: The noise fields generated in the background waiting to be swapped in by the main thread.
+        _preview_time: The time of the last preview waiting to be refined, None if no preview is waiting.
 
     Methods:
         update(): Update the world state.
         draw(screen): Draw the world on the screen.
-        reload(): Reload height and moisture values for tiles.
-        spawn_animals(amount): Spawn animals on unoccupied tiles.
-        spawn_plants(amount): Spawn plants on unoccupied tiles.
+        reload(): Regenerate the noise fields and reload height and moisture values for tiles.
+        reload_offsets(): Reload height and moisture values for tiles from the cached noise fields.
+        preview(): Draw a coarse preview of the terrain and refine it once the noise functions settle.
+        start_generation(): Start generating the noise fields in the background.
+        poll_generation(): Swap in the noise fields generated in the background if they are done.
+        wait_for_generation(): Block until the background generation is done and swap in its noise fields.
+        draw_ground(biome_ids): Draw the ground surface from the biome of every tile.
+        spawn_animals(amount, weighted=False): Spawn exactly an amount of animals on unoccupied tiles.
+        spawn_plants(amount, weighted=False): Spawn exactly an amount of plants on unoccupied tiles.
         spawn_animal(tile): Spawn an animal on a tile.
         spawn_plant(tile): Spawn a plant on a tile.
-        create_tile(row, col): Create a new tile.
-        add_neighbors(tiles): Add neighbors to tiles.
         is_border_tile(row, col): Check if a tile is a border tile.
         get_tiles(rect): Get tiles intersecting with a rectangle.
         get_tile(pos): Get the tile at a position.
         _setup_noise_functions(): Set up noise functions.
-        generate_height_values(x, y): Generate height values.
-        generate_moisture_values(x, y): Generate moisture values.
+        generate_height_values(x, y): Generate height values (per tile reference implementation).
+        generate_moisture_values(x, y): Generate moisture values (per tile reference implementation).
+        generate_height_field(): Generate the height values of all tiles at once.
+        generate_moisture_field(): Generate the moisture values of all tiles at once.
         randomise_freqs(): Randomize frequency values.
+        save_terrain(filename): Save the terrain to a snapshot file.
+        load_terrain(filename): Load the terrain from a snapshot file.
         _setup_progress_bar(): Set up the progress bar.
         copy(): Create a copy of the world.
         adjust_dimensions(rect, tile_size): Adjust dimensions to tile size.
@@ -64,13 +93,30 @@ class World(pygame.sprite.Sprite):
     loading_screen_theme = pygame_menu.pygame_menu.themes.THEME_GREEN.copy()
     loading_screen_theme.title = False  # Loading screen does not need a title
 
-    def __init__(self, rect: pygame.Rect, tile_size: int) -> None:
+    # Number of tiles from which on the noise fields are generated by multiple processes
+    PARALLEL_GENERATION_MIN_TILES: int = 250_000
+    GENERATION_BANDS: int = 20
+    PREVIEW_STRIDE: int = 4
+    PREVIEW_SETTLE_TIME: float = 0.3
+    TERRAIN_SNAPSHOT_VERSION: int = 1
+
+    def __init__(
+        self,
+        rect: pygame.Rect,
+        tile_size: int,
+        terrain_cache_budget: int = TerrainCache.DEFAULT_MEMORY_BUDGET,
+        terrain_filename: str | None = None,
+    ) -> None:
         """
         Initialize the World object with the given rectangle and tile size.
 
+        If a terrain snapshot is given the terrain is loaded from it, otherwise the noise functions are randomised.
+
         Parameters:
             rect (pygame.Rect): The rectangle representing the world.
             tile_size (int): The size of the tiles in the world.
+            terrain_cache_budget (int): The memory budget of the terrain cache in bytes. Default is TerrainCache.DEFAULT_MEMORY_BUDGET.
+            terrain_filename (str | None): The path of a terrain snapshot created by World.save_terrain to load. Default is None.
 
         Returns:
             None
@@ -81,39 +127,56 @@ class World(pygame.sprite.Sprite):
         self.rect: pygame.Rect = rect
         self.image: pygame.Surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
         self.organism_surface: pygame.Surface = self.image.copy()
-        self.ground_surface: pygame.Surface = self.image.copy()
+        self.ground_surface: pygame.Surface = None
         self.generating = False
         self.progress = 0
         self.progress_bar = None
+        self.previewing: bool = False
 
         self.tile_size = tile_size
         self.cols = self.rect.width // tile_size
         self.rows = self.rect.height // tile_size
 
+        self._raw_height_field: np.ndarray | None = None
+        self._raw_moisture_field: np.ndarray | None = None
+        self.terrain_cache: TerrainCache = TerrainCache(terrain_cache_budget)
+        self._generation_thread: threading.Thread | None = None
+        self._generation_token: int = 0
+        self._generation_result: tuple | None = None
+        self._generation_lock: threading.Lock = threading.Lock()
+        self._preview_time: float | None = None
         self._setup_noise_functions()
         self._setup_progress_bar()
+        if terrain_filename:
+            self._apply_terrain_snapshot(terrain_filename)
 
         # region tiles
-        self.tiles = pygame.sprite.Group()
-        tiles_grid = [
-            [None for _ in range(self.cols)] for _ in range(self.rows)
-        ]  # Only used for add_neighbors
-        for row in range(self.rows):
-            for col in range(self.cols):
-                tile = self.create_tile(row, col)
-                tiles_grid[row][col] = tile
-                self.tiles.add(tile)
-        self.add_neighbors(tiles_grid)
-        self.tiles.draw(self.ground_surface)
+        self.grid: Grid = Grid(self.rows, self.cols, self.tile_size)
+        heights = self.generate_height_field()
+        moistures = self.generate_moisture_field()
+        biome_ids = Tile.get_biome_table().lookup(heights, moistures)
+        self.grid.set_terrain(heights, moistures, biome_ids)
+
+        self.tiles: list[Tile] = self.grid.tiles
+        self.tiles_grid: list[list[Tile]] = [
+            self.tiles[row * self.cols : (row + 1) * self.cols]
+            for row in range(self.rows)
+        ]
+        self.draw_ground(biome_ids)
         # endregion
 
-        self.randomise_freqs()
+        if not terrain_filename:
+            self.randomise_freqs()
 
     # region main methods
     def update(self) -> None:
         """
         Update the world state by incrementing the age and updating the organisms in the simulation.
 
+        First all organisms use their maintenance energy, age and drown at once, the organisms dying from it are removed.
+        The food field of the grid is recomputed before the organisms are updated, so animals can follow it towards the nearest plant.
+        Afterwards all plants photosynthesise at once.
+
         Parameters:
             None
 
@@ -121,13 +184,18 @@ class World(pygame.sprite.Sprite):
             None
         """
         self.age += 1
+        Animal.update_population(self.grid)
+        Plant.update_population(self.grid)
+        Organism.remove_dead()
+        self.grid.update_food_field()
         simulation.organisms.update()
+        Plant.photosynthesise(self.grid)
 
     def draw(self, screen: pygame.Surface) -> None:
         """
         Draw the world on the screen surface.
 
-        If the world is currently generating, it will display the loading screen with the progress bar.
+        If the world is currently generating, it will display the loading screen with the progress bar, unless a preview of the terrain is shown.
         Otherwise, it will draw the ground surface (tiles) and then draw the organisms on top of it.
 
         Parameters:
@@ -136,8 +204,9 @@ class World(pygame.sprite.Sprite):
         Returns:
             None
         """
-        if self.generating:
+        if self.generating and not self.previewing:
             if self.progress_bar:
+                self.progress_bar.set_value(self.progress)
                 self.menu.draw(self.image)
         else:
             # Draw the ground / tiles
@@ -154,9 +223,11 @@ class World(pygame.sprite.Sprite):
 
     def reload(self) -> None:
         """
-        Reload the height and moisture values for all tiles in the world.
+        Regenerate the noise fields and reload the height and moisture values for all tiles in the world.
 
-        This method iterates over all tiles in the world, updates their height and moisture values based on the current noise functions and settings, and redraws the tiles on the ground surface.
+        This method starts generating the height and moisture fields of the whole world based on the current noise functions and settings in the background.
+        The tiles keep their current values until the new fields are swapped in by World.poll_generation.
+        It is called whenever a noise function or the scale setting changes.
 
         Parameters:
             None
@@ -164,128 +235,350 @@ class World(pygame.sprite.Sprite):
         Returns:
             None
         """
-        # TODO rethink if noise method should be transfered to tiles
-        tiles: list[Tile] = self.tiles.sprites()
-        for tile in tiles:
-            tile.height = self.generate_height_values(tile.rect.x, tile.rect.y)
-            tile.moisture = self.generate_moisture_values(tile.rect.x, tile.rect.y)
-            tile.draw(self.ground_surface)
+        self._preview_time = None
+        self.start_generation()
 
-    # endregion
+    def reload_offsets(self) -> None:
+        """
+        Reload the height and moisture values for all tiles in the world from the cached noise fields.
 
-    # region spawning
-    def spawn_animals(self, amount: float = 1) -> None:
+        This method applies the current height and moisture settings to the cached noise fields, looks up the biomes of the whole grid at once, writes them into the grid and redraws the ground surface.
+        As no noise has to be sampled it is used when only the height or moisture setting changes.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        heights = self.generate_height_field()
+        moistures = self.generate_moisture_field()
+        biome_ids = Tile.get_biome_table().lookup(heights, moistures)
+        self.grid.set_terrain(heights, moistures, biome_ids)
+        self.draw_ground(biome_ids)
+
+    def preview(self) -> None:
         """
-        Spawn a specified amount of animals on unoccupied tiles in the world.
+        Draw a coarse preview of the terrain right away and refine it to full resolution once the noise functions settle.
 
-        This method randomly selects 'amount' number of tiles from the world's tiles group and attempts to spawn an animal on each selected tile.
-        Animals will only be spawned on tiles that are not already occupied by another animal.
+        The noise is only sampled at every World.PREVIEW_STRIDE-th column and row, which makes the preview cheap enough to be drawn on every change of a slider.
+        The tiles keep their values, World.poll_generation starts a normal reload once no preview has been requested for World.PREVIEW_SETTLE_TIME seconds, so the final terrain is identical to the one of a reload.
+        It is called whenever a noise function changes.
 
         Parameters:
-            amount (float, optional): The number of animals to spawn. Defaults to 1.
+            None
 
         Returns:
             None
         """
-        # TODO this should ignore tiles that are occupied and only try to spawn on unoccupied tiles
-        for tile in random.choices(self.tiles.sprites(), k=amount):
-            self.spawn_animal(tile)
+        stride = World.PREVIEW_STRIDE
+        xs = (
+            np.arange(0, self.cols, stride) * self.tile_size * self.scale_setting._value
+        )
+        ys = (
+            np.arange(0, self.rows, stride) * self.tile_size * self.scale_setting._value
+        )
+        heights = World._apply_setting(
+            NoiseFunction.weigh_array(
+                xs, ys, self.height_functions, self.height_functions_weights
+            ),
+            self.height_setting,
+        )
+        moistures = World._apply_setting(
+            NoiseFunction.weigh_array(
+                xs, ys, self.moisture_functions, self.moisture_functions_weights
+            ),
+            self.moisture_setting,
+        )
+        biome_ids = Tile.get_biome_table().lookup(heights, moistures)
+        biome_ids = biome_ids.repeat(stride, axis=0).repeat(stride, axis=1)
+        self.draw_ground(biome_ids[: self.rows, : self.cols])
+
+        self.previewing = True
+        self._preview_time = time.monotonic()
 
-    def spawn_plants(self, amount: float = 1) -> None:
+    def start_generation(self) -> None:
         """
-        Spawn a specified amount of plants on unoccupied tiles in the world.
+        Start generating the height and moisture fields of the current noise functions in a background thread.
 
-        This method randomly selects 'amount' number of tiles from the world's tiles group and attempts to spawn a plant on each selected tile.
-        Plants will only be spawned on tiles that are not already occupied by another plant or animal.
+        Fields found in the terrain cache are not generated again, if both are cached they are swapped in right away.
+        The noise functions are copied before the thread is started, so they can be changed while the thread is running.
+        Every call supersedes the previous generation, a thread that is not the latest one stops at its next row band and its result is discarded.
+        The main thread has to call World.poll_generation to swap in the generated fields.
 
         Parameters:
-            amount (float, optional): The number of plants to spawn. Defaults to 1.
+            None
 
         Returns:
             None
         """
-        # TODO this should ignore tiles that are occupied and only try to spawn on unoccupied tiles
-        for tile in random.choices(self.tiles.sprites(), k=amount):
-            self.spawn_plant(tile)
+        self._generation_token += 1
+        jobs = []
+        for functions, weights in (
+            (self.height_functions, self.height_functions_weights),
+            (self.moisture_functions, self.moisture_functions_weights),
+        ):
+            key = self._get_terrain_key(functions, weights)
+            jobs.append(
+                (
+                    key,
+                    self.terrain_cache.get(key),
+                    [
+                        NoiseFunction.from_parameters(function.get_parameters())
+                        for function in functions
+                    ],
+                    list(weights),
+                )
+            )
 
-    def spawn_animal(self, tile: Tile) -> None:
+        if all(field is not None for _, field, _, _ in jobs):
+            self._swap_in_fields(jobs[0][1], jobs[1][1])
+            return
+
+        self.generating = True
+        self.progress = 0
+        self._generation_thread = threading.Thread(
+            target=self._generate_in_background,
+            args=(self._generation_token, jobs, self.scale_setting._value),
+            daemon=True,
+        )
+        self._generation_thread.start()
+
+    def poll_generation(self) -> bool:
         """
-        Spawn an animal on a specified tile if the tile is not occupied by water or another animal.
+        Swap in the noise fields generated in the background if the latest generation is done.
+
+        This method has to be called regularly from the main thread, for example once per frame.
+        It also starts the reload refining a preview once the noise functions have settled.
 
         Parameters:
-            tile (Tile): The tile on which the animal will be spawned.
+            None
+
+        Returns:
+            bool: True if new noise fields have been swapped in, False otherwise.
+        """
+        if (
+            self._preview_time is not None
+            and time.monotonic() - self._preview_time >= World.PREVIEW_SETTLE_TIME
+        ):
+            self.reload()
+
+        with self._generation_lock:
+            result, self._generation_result = self._generation_result, None
+        if result is None:
+            return False
+
+        token, fields = result
+        if token != self._generation_token:
+            return False
+        for key, field in fields:
+            self.terrain_cache.put(key, field)
+        self._swap_in_fields(fields[0][1], fields[1][1])
+        return True
+
+    def wait_for_generation(self) -> None:
+        """
+        Block until the background generation is done and swap in its noise fields.
+
+        A preview waiting to be refined is refined right away.
+
+        Parameters:
+            None
 
         Returns:
             None
         """
-        if not (tile.has_water or tile.has_animal()):
-            animal = Animal(tile)
-            simulation.organisms.add(animal)
-            simulation.animals.add(animal)
+        if self._preview_time is not None:
+            self.reload()
+        if self._generation_thread is not None:
+            self._generation_thread.join()
+            self._generation_thread = None
+        self.poll_generation()
+
+    def _generate_in_background(
+        self,
+        token: int,
+        jobs: list[tuple[tuple, np.ndarray | None, list[NoiseFunction], list[float]]],
+        scale: float,
+    ) -> None:
+        """
+        Generate the noise fields of a generation in row bands, run by the background thread.
 
-    def spawn_plant(self, tile: Tile) -> None:
+        The progress is updated after every band and the generation is abandoned as soon as a newer generation has been started.
+
+        Parameters:
+            token (int): The token of the generation.
+            jobs (list[tuple[tuple, np.ndarray | None, list[NoiseFunction], list[float]]]): The cache key, the cached field or None, the noise functions and the weights of every field.
+            scale (float): The scale of the tile coordinates.
+
+        Returns:
+            None
         """
-        Spawn a plant on a specified tile if the tile is not occupied by water or another plant.
+        xs = np.arange(self.cols) * self.tile_size * scale
+        ys = np.arange(self.rows) * self.tile_size * scale
+        weigh = (
+            NoiseFunction.weigh_array_parallel
+            if self.cols * self.rows >= World.PARALLEL_GENERATION_MIN_TILES
+            else NoiseFunction.weigh_array
+        )
+
+        rows_total = max(1, sum(self.rows for _, field, _, _ in jobs if field is None))
+        rows_done = 0
+        fields = []
+        for key, field, functions, weights in jobs:
+            if field is None:
+                bands = []
+                band_count = min(World.GENERATION_BANDS, max(1, self.rows))
+                for band_ys in np.array_split(ys, band_count):
+                    if token != self._generation_token:
+                        return
+                    bands.append(weigh(xs, band_ys, functions, weights))
+                    rows_done += len(band_ys)
+                    self.progress = 100 * rows_done / rows_total
+                field = np.vstack(bands)
+            fields.append((key, field))
+
+        with self._generation_lock:
+            if token == self._generation_token:
+                self._generation_result = (token, fields)
+
+    def _swap_in_fields(self, height: np.ndarray, moisture: np.ndarray) -> None:
+        """
+        Replace the noise fields of the world, update all tiles and finish the generation.
 
         Parameters:
-            tile (Tile): The tile on which the plant will be spawned.
+            height (np.ndarray): The new weighted height noise.
+            moisture (np.ndarray): The new weighted moisture noise.
 
         Returns:
             None
         """
-        if not (tile.has_water or tile.has_plant()):
-            plant = Plant(tile)
-            simulation.organisms.add(plant)
-            simulation.plants.add(plant)
+        self._raw_height_field = height
+        self._raw_moisture_field = moisture
+        self.reload_offsets()
+        self.previewing = False
+        self.generating = False
+        self.progress = 0
+        if self.progress_bar:
+            self.progress_bar.set_value(self.progress)
+
+    def draw_ground(self, biome_ids: np.ndarray) -> None:
+        """
+        Draw the ground surface from the biome of every tile in one go.
+
+        The colors of all biomes are written into a surface with one pixel per tile, which is then scaled up by the tile size.
+
+        Parameters:
+            biome_ids (np.ndarray): A 2D array of shape (rows, cols) with the biome id of every tile.
+
+        Returns:
+            None
+        """
+        colors = Tile.get_biome_table().color_array[biome_ids]
+        # surfarray expects the x axis first
+        ground = pygame.surfarray.make_surface(colors.swapaxes(0, 1))
+        self.ground_surface = pygame.transform.scale(
+            ground, (self.cols * self.tile_size, self.rows * self.tile_size)
+        )
 
     # endregion
 
-    # region tiles
-    def create_tile(self, row: int, col: int) -> Tile:
+    # region spawning
+    def spawn_animals(self, amount: int = 1, weighted: bool = False) -> None:
+        """
+        Spawn exactly the specified amount of animals on distinct unoccupied tiles in the world.
+
+        The tiles are sampled without replacement from the spawn index of the free land tiles of the grid, so this takes time proportional to the amount instead of the number of tiles.
+        Fewer animals are only spawned if there are not enough land tiles without an animal.
+
+        Parameters:
+            amount (int, optional): The number of animals to spawn. Defaults to 1.
+            weighted (bool, optional): If True, tiles are picked with a probability proportional to their plant growth potential. Defaults to False.
+
+        Returns:
+            None
         """
-        Create a new Tile object based on the given row and column coordinates.
+        for index in self._sample_spawn_tiles(
+            self.grid.free_animal_tiles, amount, weighted
+        ).tolist():
+            self.spawn_animal(self.tiles[index])
+
+    def spawn_plants(self, amount: int = 1, weighted: bool = False) -> None:
+        """
+        Spawn exactly the specified amount of plants on distinct unoccupied tiles in the world.
+
+        The tiles are sampled without replacement from the spawn index of the free land tiles of the grid, so this takes time proportional to the amount instead of the number of tiles.
+        Fewer plants are only spawned if there are not enough land tiles without a plant.
 
         Parameters:
-            row (int): The row index of the tile.
-            col (int): The column index of the tile.
+            amount (int, optional): The number of plants to spawn. Defaults to 1.
+            weighted (bool, optional): If True, tiles are picked with a probability proportional to their plant growth potential. Defaults to False.
 
         Returns:
-            Tile: A new Tile object initialized with the specified position, height, moisture, and border status.
+            None
+        """
+        for index in self._sample_spawn_tiles(
+            self.grid.free_plant_tiles, amount, weighted
+        ).tolist():
+            self.spawn_plant(self.tiles[index])
+
+    def _sample_spawn_tiles(
+        self, free_tiles: SpawnIndex, amount: int, weighted: bool
+    ) -> np.ndarray:
         """
-        x = col * self.tile_size
-        y = row * self.tile_size
+        Sample distinct tiles to spawn organisms on from a spawn index.
 
-        return Tile(
-            pygame.Rect(x, y, self.tile_size, self.tile_size),
-            height=self.generate_height_values(x, y),
-            moisture=self.generate_moisture_values(x, y),
-            is_border=self.is_border_tile(row=row, col=col),
+        Weighted samples use the plant growth potential of the tiles, bounded by the highest plant growth potential of all biomes.
+
+        Parameters:
+            free_tiles (SpawnIndex): The spawn index of the free tiles.
+            amount (int): The number of tiles, at most the number of free tiles are returned.
+            weighted (bool): If True, tiles are picked with a probability proportional to their plant growth potential.
+
+        Returns:
+            np.ndarray: The flat indices of the sampled tiles.
+        """
+        if not weighted:
+            return free_tiles.sample(amount)
+        return free_tiles.sample(
+            amount,
+            self.grid.plant_growth.ravel(),
+            float(Tile.get_biome_table().plant_growth.max()),
         )
 
-    def add_neighbors(self, tiles) -> None:
+    def spawn_animal(self, tile: Tile) -> None:
         """
-        Add neighbors to each tile in the world based on the grid of tiles provided.
+        Spawn an animal on a specified tile if the tile is not occupied by water or another animal.
 
-        For each tile in the grid, this method checks the neighboring tiles in the cardinal directions (north, east, south, west) and adds them as neighbors to the current tile. This allows each tile to have references to its adjacent tiles for interaction and calculations.
+        Parameters:
+            tile (Tile): The tile on which the animal will be spawned.
+
+        Returns:
+            None
+        """
+        if not (tile.has_water or tile.has_animal()):
+            animal = Animal(tile)
+            simulation.organisms.add(animal)
+            simulation.animals.add(animal)
+
+    def spawn_plant(self, tile: Tile) -> None:
+        """
+        Spawn a plant on a specified tile if the tile is not occupied by water or another plant.
 
         Parameters:
-            tiles (list[list[Tile]]): A 2D grid of Tile objects representing the world map.
+            tile (Tile): The tile on which the plant will be spawned.
 
         Returns:
             None
         """
-        for row in range(self.rows):
-            for col in range(self.cols):
-                tile: Tile = tiles[row][col]
-                if row > 0:
-                    tile.add_neighbor(Direction.NORTH, tiles[row - 1][col])
-                if col < self.cols - 1:
-                    tile.add_neighbor(Direction.EAST, tiles[row][col + 1])
-                if row < self.rows - 1:
-                    tile.add_neighbor(Direction.SOUTH, tiles[row + 1][col])
-                if col > 0:
-                    tile.add_neighbor(Direction.WEST, tiles[row][col - 1])
+        if not (tile.has_water or tile.has_plant()):
+            plant = Plant(tile)
+            simulation.organisms.add(plant)
+            simulation.plants.add(plant)
+
+    # endregion
 
+    # region tiles
     def is_border_tile(self, row: int, col: int) -> bool:
         """
         Determine if a given tile at the specified row and column coordinates is a border tile.
@@ -305,23 +598,38 @@ class World(pygame.sprite.Sprite):
         """
         Get a list of tiles that intersect with the given rectangle in the world.
 
-        This method takes a pygame Rect object representing a rectangle in global coordinates and transforms it into world coordinates by adjusting its position based on the world's position. It then creates a temporary sprite with the transformed rectangle and checks for collisions with the world's tiles. The method returns a list of Tile objects that intersect with the transformed rectangle.
+        This method transforms the rectangle from global coordinates into world coordinates and computes the range of columns and rows it overlaps from the tile size, so only the tiles in the result are visited.
+        The given rectangle is not modified.
 
         Parameters:
             rect (pygame.Rect): A pygame Rect object representing a rectangle in global coordinates.
 
         Returns:
-            list[Tile]: A list of Tile objects that intersect with the given rectangle.
+            list[Tile]: A list of Tile objects that intersect with the given rectangle, ordered by row and column.
         """
-        # Transform rect global coordinates into world coordinates
-        rect.x -= self.rect.left
-        rect.y -= self.rect.top
-
-        s = pygame.sprite.Sprite()
-        s.rect = rect
-        return pygame.sprite.spritecollide(s, self.tiles, False)
+        if rect.width <= 0 or rect.height <= 0:
+            return []
 
-    def get_tile(self, pos: tuple[int, int]) -> Tile:
+        # Transform rect global coordinates into world coordinates
+        left = rect.left - self.rect.left
+        top = rect.top - self.rect.top
+
+        first_col = max(0, left // self.tile_size)
+        first_row = max(0, top // self.tile_size)
+        # Ceiling division, a tile is only hit if the rectangle reaches into it
+        last_col = min(self.cols, -(-(left + rect.width) // self.tile_size))
+        last_row = min(self.rows, -(-(top + rect.height) // self.tile_size))
+        # Rectangles left of or above the world would wrap around in the slices
+        if last_col <= first_col or last_row <= first_row:
+            return []
+
+        return [
+            tile
+            for tiles in self.tiles_grid[first_row:last_row]
+            for tile in tiles[first_col:last_col]
+        ]
+
+    def get_tile(self, pos: tuple[int, int]) -> Tile | None:
         """
         Get the tile at the specified position in the world.
 
@@ -329,15 +637,17 @@ class World(pygame.sprite.Sprite):
             pos (tuple[int, int]): The position coordinates (x, y) of the tile in global coordinates.
 
         Returns:
-            Tile: The Tile object at the specified position in the world.
+            Tile | None: The Tile object at the specified position in the world, None if the position is outside of the world.
         """
         # Transform global coordinates into world coordinates
         x = pos[0] - self.rect.left
         y = pos[1] - self.rect.top
 
-        s = pygame.sprite.Sprite()
-        s.rect = pygame.Rect(x, y, 1, 1)
-        return pygame.sprite.spritecollideany(s, self.tiles)
+        col = int(x // self.tile_size)
+        row = int(y // self.tile_size)
+        if not (0 <= col < self.cols and 0 <= row < self.rows):
+            return None
+        return self.tiles_grid[row][col]
 
     # endregion
 
@@ -358,10 +668,10 @@ class World(pygame.sprite.Sprite):
         """
         # TODO allow to manually add functions
         self.moisture_setting: BoundedSetting = BoundedSetting(
-            self.reload, value=1, name="Moisture", min=0, max=2, type="onchange"
+            self.reload_offsets, value=1, name="Moisture", min=0, max=2, type="onchange"
         )
         self.height_setting: BoundedSetting = BoundedSetting(
-            self.reload, value=1, name="Height", min=0, max=2, type="onchange"
+            self.reload_offsets, value=1, name="Height", min=0, max=2, type="onchange"
         )
         self.scale_setting: BoundedSetting = BoundedSetting(
             self.reload,
@@ -377,7 +687,7 @@ class World(pygame.sprite.Sprite):
         self.height_functions_weights: list[float] = []
         self.height_functions.append(
             NoiseFunction(
-                self.reload,
+                self.preview,
                 factor_x=1,
                 factor_y=1,
                 offset_x=0,
@@ -387,13 +697,13 @@ class World(pygame.sprite.Sprite):
         self.height_functions_weights.append(1)
         self.height_functions.append(
             NoiseFunction(
-                self.reload, factor_x=2, factor_y=2, offset_x=4.7, offset_y=2.3
+                self.preview, factor_x=2, factor_y=2, offset_x=4.7, offset_y=2.3
             )
         )
         self.height_functions_weights.append(0.2)
         self.height_functions.append(
             NoiseFunction(
-                self.reload, factor_x=4, factor_y=4, offset_x=19.1, offset_y=16.2
+                self.preview, factor_x=4, factor_y=4, offset_x=19.1, offset_y=16.2
             )
         )
         self.height_functions_weights.append(0.1)
@@ -401,7 +711,7 @@ class World(pygame.sprite.Sprite):
         self.moisture_functions: list[NoiseFunction] = []
         self.moisture_functions_weights: list[float] = []
         self.moisture_functions.append(
-            NoiseFunction(self.reload, factor_x=1, factor_y=1, offset_x=0, offset_y=0)
+            NoiseFunction(self.preview, factor_x=1, factor_y=1, offset_x=0, offset_y=0)
         )
         self.moisture_functions_weights.append(1)
 
@@ -409,6 +719,9 @@ class World(pygame.sprite.Sprite):
         """
         Generate the height value for a specific position in the world based on noise functions and settings.
 
+        Note:
+            This is the per tile reference implementation of World.generate_height_field.
+
         Parameters:
             x (int): The x-coordinate of the position for which to generate the height value.
             y (int): The y-coordinate of the position for which to generate the height value.
@@ -433,6 +746,9 @@ class World(pygame.sprite.Sprite):
         Calculates the moisture value at the given (x, y) position by applying noise functions with corresponding weights.
         Adjusts the moisture value based on the current moisture setting and clamps it between 0 and 1.
 
+        Note:
+            This is the per tile reference implementation of World.generate_moisture_field.
+
         Parameters:
             x (int): The x-coordinate of the position.
             y (int): The y-coordinate of the position.
@@ -450,13 +766,113 @@ class World(pygame.sprite.Sprite):
         moisture = pygame.math.clamp(moisture, 0, 1)
         return moisture
 
+    def generate_height_field(self) -> np.ndarray:
+        """
+        Generate the height values of all tiles in the world at once.
+
+        Every noise function is evaluated over the coordinate arrays of the tile columns and rows in one batched call.
+        The weighted noise is cached so only the height setting has to be applied as long as the noise functions and the scale do not change.
+
+        Returns:
+            np.ndarray: A 2D array of shape (rows, cols) with the height value of every tile, clamped between 0 and 1.
+        """
+        if self._raw_height_field is None:
+            self._raw_height_field = self._generate_raw_field(
+                self.height_functions, self.height_functions_weights
+            )
+        return World._apply_setting(self._raw_height_field, self.height_setting)
+
+    def generate_moisture_field(self) -> np.ndarray:
+        """
+        Generate the moisture values of all tiles in the world at once.
+
+        Every noise function is evaluated over the coordinate arrays of the tile columns and rows in one batched call.
+        The weighted noise is cached so only the moisture setting has to be applied as long as the noise functions and the scale do not change.
+
+        Returns:
+            np.ndarray: A 2D array of shape (rows, cols) with the moisture value of every tile, clamped between 0 and 1.
+        """
+        if self._raw_moisture_field is None:
+            self._raw_moisture_field = self._generate_raw_field(
+                self.moisture_functions, self.moisture_functions_weights
+            )
+        return World._apply_setting(self._raw_moisture_field, self.moisture_setting)
+
+    def _generate_raw_field(
+        self, functions: list[NoiseFunction], weights: list[float]
+    ) -> np.ndarray:
+        """
+        Generate the weighted noise of the given noise functions for all tiles in the world.
+
+        The field is taken from the terrain cache if it has been generated with the same parameters before, otherwise it is generated and added to the cache.
+        Worlds with at least World.PARALLEL_GENERATION_MIN_TILES tiles are generated in row bands by a process pool.
+
+        Parameters:
+            functions (list[NoiseFunction]): The noise functions to weigh.
+            weights (list[float]): The weights of the noise functions.
+
+        Returns:
+            np.ndarray: A read only 2D array of shape (rows, cols) with the weighted noise values.
+        """
+        key = self._get_terrain_key(functions, weights)
+        field = self.terrain_cache.get(key)
+        if field is None:
+            xs = np.arange(self.cols) * self.tile_size * self.scale_setting._value
+            ys = np.arange(self.rows) * self.tile_size * self.scale_setting._value
+
+            if self.cols * self.rows >= World.PARALLEL_GENERATION_MIN_TILES:
+                field = NoiseFunction.weigh_array_parallel(xs, ys, functions, weights)
+            else:
+                field = NoiseFunction.weigh_array(xs, ys, functions, weights)
+            self.terrain_cache.put(key, field)
+        return field
+
+    def _get_terrain_key(
+        self, functions: list[NoiseFunction], weights: list[float]
+    ) -> tuple:
+        """
+        Get the key under which a noise field is stored in the terrain cache.
+
+        The key contains everything the field depends on: the parameters and weights of the noise functions, the scale, the grid dimensions and the noise seed.
+
+        Parameters:
+            functions (list[NoiseFunction]): The noise functions to weigh.
+            weights (list[float]): The weights of the noise functions.
+
+        Returns:
+            tuple: The hashable key of the field.
+        """
+        return (
+            tuple(function.get_parameters() for function in functions),
+            tuple(weights),
+            self.scale_setting._value,
+            self.cols,
+            self.rows,
+            self.tile_size,
+            opensimplex.get_seed(),
+        )
+
+    @staticmethod
+    def _apply_setting(raw_field: np.ndarray, setting: BoundedSetting) -> np.ndarray:
+        """
+        Shift a noise field by the offset of a setting from its middle value and clamp it.
+
+        Parameters:
+            raw_field (np.ndarray): The weighted noise field.
+            setting (BoundedSetting): The setting whose offset from its middle value is added to the field.
+
+        Returns:
+            np.ndarray: A new array with values clamped between 0 and 1.
+        """
+        return np.clip(raw_field + (setting._value - setting._mid), 0, 1)
+
     def randomise_freqs(self) -> None:
         """
         Randomize the frequency values for height and moisture noise functions.
 
-        This method initiates the randomization process by setting the generating flag to True and resetting the progress to 0. It then combines the height and moisture noise functions into a single list for iteration.
-        For each noise function, it calls the randomize method to generate new frequency values, updates the progress bar based on the number of functions, and refreshes the display to show the progress.
-        After randomizing all functions, it triggers a reload to update the height and moisture values for all tiles, sets generating back to False, resets the progress to 0, and updates the progress bar accordingly.
+        This method calls the randomize method of every height and moisture noise function to generate new frequency values in a single batch of setting changes, so only one preview is drawn.
+        Afterwards it triggers a reload, which generates the new noise fields in the background while the preview is shown.
+        The main loop is not blocked, the new fields are swapped in by World.poll_generation once they are done.
 
         Parameters:
             None
@@ -467,24 +883,145 @@ class World(pygame.sprite.Sprite):
         if self.progress_bar is None:
             raise ValueError("Progress Bar has not been initiated.")
 
-        self.generating = True
-        self.progress = 0
-
         functions: list[NoiseFunction] = []
         functions.extend(self.height_functions)
         functions.extend(self.moisture_functions)
 
-        for function in functions:
-            function.randomise()
-            self.progress += 100 / len(functions)
-            self.progress_bar.set_value(self.progress)
-            self.menu.draw(pygame.display.get_surface())
-            pygame.display.flip()
+        with Setting.batch():
+            for function in functions:
+                function.randomise()
 
         self.reload()
-        self.generating = False
-        self.progress = 0
-        self.progress_bar.set_value(self.progress)
+
+    def save_terrain(self, filename: str) -> None:
+        """
+        Save the terrain of the world to a compact binary snapshot file.
+
+        The snapshot contains the cached noise fields together with all parameters they were generated with, so loading it does not require any noise to be sampled.
+        A running background generation is waited for, so the saved fields always match the saved parameters.
+
+        Parameters:
+            filename (str): The path of the .npz file to write.
+
+        Returns:
+            None
+        """
+        self.wait_for_generation()
+        self.generate_height_field()
+        self.generate_moisture_field()
+
+        np.savez(
+            filename,
+            version=World.TERRAIN_SNAPSHOT_VERSION,
+            shape=np.array([self.cols, self.rows, self.tile_size]),
+            seed=np.array(opensimplex.get_seed()),
+            height=self._raw_height_field,
+            moisture=self._raw_moisture_field,
+            height_functions=np.array(
+                [function.get_parameters() for function in self.height_functions]
+            ),
+            height_weights=np.array(self.height_functions_weights),
+            moisture_functions=np.array(
+                [function.get_parameters() for function in self.moisture_functions]
+            ),
+            moisture_weights=np.array(self.moisture_functions_weights),
+            settings=np.array(
+                [
+                    self.height_setting._value,
+                    self.moisture_setting._value,
+                    self.scale_setting._value,
+                ]
+            ),
+        )
+
+    def load_terrain(self, filename: str) -> None:
+        """
+        Load the terrain of the world from a snapshot file created by World.save_terrain.
+
+        The noise function parameters and settings are restored and the stored noise fields are used directly instead of sampling noise.
+
+        Parameters:
+            filename (str): The path of the .npz file to read.
+
+        Raises:
+            ValueError: If the snapshot does not match the dimensions or noise functions of the world.
+
+        Returns:
+            None
+        """
+        self._apply_terrain_snapshot(filename)
+        self.reload_offsets()
+
+    def _apply_terrain_snapshot(self, filename: str) -> None:
+        """
+        Restore the noise function parameters, settings and noise fields from a snapshot file without updating the tiles.
+
+        Parameters:
+            filename (str): The path of the .npz file to read.
+
+        Raises:
+            ValueError: If the snapshot does not match the dimensions or noise functions of the world.
+
+        Returns:
+            None
+        """
+        with np.load(filename) as snapshot:
+            if int(snapshot["version"]) != World.TERRAIN_SNAPSHOT_VERSION:
+                raise ValueError(
+                    f"Terrain snapshot version {int(snapshot['version'])} is not supported."
+                )
+            if tuple(snapshot["shape"]) != (self.cols, self.rows, self.tile_size):
+                raise ValueError(
+                    f"Terrain snapshot of shape {tuple(snapshot['shape'])} does not match world of shape {(self.cols, self.rows, self.tile_size)}."
+                )
+            if len(snapshot["height_functions"]) != len(self.height_functions) or len(
+                snapshot["moisture_functions"]
+            ) != len(self.moisture_functions):
+                raise ValueError(
+                    "Terrain snapshot does not match the noise functions of the world."
+                )
+
+            # Supersede a running background generation and a waiting preview
+            self._generation_token += 1
+            self._preview_time = None
+            self.previewing = False
+            self.generating = False
+            self.progress = 0
+
+            seed = int(snapshot["seed"])
+            if opensimplex.get_seed() != seed:
+                opensimplex.seed(seed)
+
+            for function, parameters in zip(
+                self.height_functions, snapshot["height_functions"]
+            ):
+                function.set_parameters(parameters.tolist())
+            for function, parameters in zip(
+                self.moisture_functions, snapshot["moisture_functions"]
+            ):
+                function.set_parameters(parameters.tolist())
+            self.height_functions_weights[:] = snapshot["height_weights"].tolist()
+            self.moisture_functions_weights[:] = snapshot["moisture_weights"].tolist()
+
+            settings = (self.height_setting, self.moisture_setting, self.scale_setting)
+            for setting, value in zip(settings, snapshot["settings"].tolist()):
+                setting._value = value
+                if setting.widget:
+                    setting.widget.set_value(value)
+
+            self._raw_height_field = snapshot["height"]
+            self._raw_moisture_field = snapshot["moisture"]
+
+        self.terrain_cache.put(
+            self._get_terrain_key(self.height_functions, self.height_functions_weights),
+            self._raw_height_field,
+        )
+        self.terrain_cache.put(
+            self._get_terrain_key(
+                self.moisture_functions, self.moisture_functions_weights
+            ),
+            self._raw_moisture_field,
+        )
 
     # endregion
 
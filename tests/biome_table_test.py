@@ -0,0 +1,123 @@
+import unittest
+
+import numpy as np
+
+from src.terrain.tile import Tile
+
+
+def reference_biome(height: float, moisture: float) -> tuple:
+    """
+    The biome selection of Tile before the lookup table was introduced.
+    """
+    if height <= Tile.WATER_HEIGHT_LEVEL:
+        return Tile.WATER_COLOR, Tile.WATER_PLANT_GROWTH, True
+    elif height <= Tile.BEACH_HEIGHT_LEVEL:
+        return Tile.SAND_COLOR, Tile.BEACH_PLANT_GROWTH, False
+    elif height <= Tile.TROPICAL_HEIGHT_LEVEL:
+        if moisture < 0.16:
+            return (
+                Tile.SUBTROPICAL_DESERT_COLOR,
+                Tile.SUBTROPICAL_DESERT_PLANT_GROWTH,
+                False,
+            )
+        elif moisture < 0.33:
+            return Tile.GRASSLAND_COLOR, Tile.GRASSLAND_PLANT_GROWTH, False
+        elif moisture < 0.66:
+            return (
+                Tile.TROPICAL_SEASONAL_FOREST_COLOR,
+                Tile.TROPICAL_SEASON_FOREST_PLANT_GROWTH,
+                False,
+            )
+        else:
+            return (
+                Tile.TROPICAL_RAIN_FOREST_COLOR,
+                Tile.TROPICAL_RAIN_FOREST_PLANT_GROWTH,
+                False,
+            )
+    elif height <= Tile.TEMPERATE_HEIGHT_LEVEL:
+        if moisture < 0.16:
+            return (
+                Tile.TEMPERATE_DESERT_COLOR,
+                Tile.TEMPERATE_DESERT_PLANT_GROWTH,
+                False,
+            )
+        elif moisture < 0.50:
+            return Tile.GRASSLAND_COLOR, Tile.GRASSLAND_PLANT_GROWTH, False
+        elif moisture < 0.83:
+            return (
+                Tile.TEMPERATE_DECIDUOUS_FOREST_COLOR,
+                Tile.TEMPERATER_DECIDOUS_FOREST_PLANT_GROWTH,
+                False,
+            )
+        else:
+            return (
+                Tile.TEMPERATE_RAIN_FOREST_COLOR,
+                Tile.TEMPERATE_RAIN_FOREST_PLANT_GROWTH,
+                False,
+            )
+    elif height <= Tile.TRANSITION_HEIGHT_LEVEL:
+        if moisture < 0.33:
+            return (
+                Tile.TEMPERATE_DESERT_COLOR,
+                Tile.TEMPERATE_DESERT_PLANT_GROWTH,
+                False,
+            )
+        elif moisture < 0.66:
+            return Tile.SHRUBLAND_COLOR, Tile.SHRUBLAND_PLANT_GROWTH, False
+        else:
+            return Tile.TAIGA_COLOR, Tile.TAIGA_PLANT_GROWTH, False
+    else:
+        if moisture < 0.1:
+            return Tile.SCORCHED_COLOR, Tile.SCORCHED_PLANT_GROWTH, False
+        elif moisture < 0.2:
+            return Tile.BARE_COLOR, Tile.BARE_PLANT_GROWTH, False
+        elif moisture < 0.5:
+            return Tile.TUNDRA_COLOR, Tile.TUNDRA_PLANT_GROWTH, False
+        else:
+            return Tile.SNOW_COLOR, Tile.SNOW_PLANT_GROWTH, False
+
+
+class TestBiomeTable(unittest.TestCase):
+    def setUp(self) -> None:
+        # Include every threshold exactly as well as values close to them
+        values = np.linspace(0, 1, 101)
+        self.heights, self.moistures = np.meshgrid(values, values)
+        self.table = Tile.get_biome_table()
+
+    def tearDown(self) -> None:
+        Tile.set_water_height_level(0.1)
+
+
+class TestLookup(TestBiomeTable):
+    def test_lookup_matches_reference(self):
+        biome_ids = self.table.lookup(self.heights, self.moistures)
+
+        for height, moisture, biome_id in zip(
+            self.heights.flat, self.moistures.flat, biome_ids.flat
+        ):
+            color, growth, has_water = reference_biome(height, moisture)
+            self.assertEqual(color, self.table.colors[biome_id])
+            self.assertEqual(growth, self.table.plant_growth[biome_id])
+            self.assertEqual(has_water, self.table.has_water[biome_id])
+
+    def test_get_biome_matches_lookup(self):
+        biome_ids = self.table.lookup(self.heights, self.moistures)
+
+        for height, moisture, biome_id in zip(
+            self.heights.flat, self.moistures.flat, biome_ids.flat
+        ):
+            self.assertEqual(biome_id, self.table.get_biome(height, moisture))
+
+
+class TestRebuild(TestBiomeTable):
+    def test_changing_threshold_rebuilds_table(self):
+        Tile.set_water_height_level(0.11)
+        table = Tile.get_biome_table()
+
+        self.assertIsNot(self.table, table)
+        self.assertTrue(table.has_water[table.get_biome(0.105, 0.5)])
+        self.assertFalse(table.has_water[table.get_biome(0.115, 0.5)])
+
+    def test_unordered_thresholds(self):
+        with self.assertRaises(ValueError):
+            Tile.set_water_height_level(0.2)
@@ -0,0 +1,124 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+pygame.init()
+pygame.display.set_mode((200, 200))
+
+from src.helper.noise_function import NoiseFunction
+from src.terrain.chunk_manager import ChunkManager
+from src.terrain.world import World
+
+
+class TestChunkManager(unittest.TestCase):
+    def setUp(self) -> None:
+        self.world = World(pygame.Rect(0, 0, 100, 80), 10)
+        self.world.wait_for_generation()
+        self.directory = tempfile.TemporaryDirectory()
+        self.manager = self.create_manager()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def create_manager(self, **kwargs) -> ChunkManager:
+        return ChunkManager(
+            self.world.height_functions,
+            self.world.height_functions_weights,
+            self.world.moisture_functions,
+            self.world.moisture_functions_weights,
+            self.world.scale_setting,
+            self.world.tile_size,
+            chunk_size=4,
+            max_active_chunks=2,
+            **kwargs,
+        )
+
+
+class TestInit(TestChunkManager):
+    def test_initialize_with_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            ChunkManager([], [], [], [], self.world.scale_setting, 10, chunk_size=0)
+
+    def test_initialize_with_invalid_max_active_chunks(self):
+        with self.assertRaises(ValueError):
+            ChunkManager(
+                [], [], [], [], self.world.scale_setting, 10, max_active_chunks=0
+            )
+
+
+class TestChunks(TestChunkManager):
+    def test_chunk_matches_world(self):
+        chunk = self.manager.get_chunk((1, 1))
+
+        self.assertTrue(
+            np.array_equal(self.world._raw_height_field[4:8, 4:8], chunk.height)
+        )
+        self.assertTrue(
+            np.array_equal(self.world._raw_moisture_field[4:8, 4:8], chunk.moisture)
+        )
+
+    def test_chunk_beyond_world_bounds(self):
+        chunk = self.manager.get_chunk((-3, 100))
+
+        self.assertEqual((4, 4), chunk.height.shape)
+        self.assertTrue(np.all((chunk.height >= 0) & (chunk.height <= 1)))
+
+    def test_get_chunk_coords(self):
+        self.assertEqual((0, 0), self.manager.get_chunk_coords(3, 0))
+        self.assertEqual((-1, 1), self.manager.get_chunk_coords(-1, 4))
+
+    def test_get_chunks_in_area(self):
+        self.assertEqual(
+            {(0, 0), (1, 0), (0, 1), (1, 1)},
+            self.manager.get_chunks_in_area(2, 3, 4, 2),
+        )
+        self.assertEqual(set(), self.manager.get_chunks_in_area(0, 0, 0, 5))
+
+
+class TestEviction(TestChunkManager):
+    def test_least_recently_used_is_evicted(self):
+        self.manager.get_chunk((0, 0))
+        self.manager.get_chunk((1, 0))
+        self.manager.get_chunk((0, 0))
+        self.manager.get_chunk((2, 0))
+
+        self.assertIn((0, 0), self.manager)
+        self.assertNotIn((1, 0), self.manager)
+        self.assertEqual(2, len(self.manager))
+
+    def test_needed_chunks_are_not_evicted(self):
+        self.manager.update({(0, 0)}, {(5, 5)})
+        self.manager.get_chunk((1, 0))
+        self.manager.get_chunk((2, 0))
+
+        self.assertIn((0, 0), self.manager)
+        self.assertIn((5, 5), self.manager)
+        self.assertNotIn((1, 0), self.manager)
+
+    def test_evicted_chunk_is_spilled_and_loaded(self):
+        manager = self.create_manager(spill_directory=self.directory.name)
+        height = manager.get_chunk((0, 0)).height
+        manager.get_chunk((1, 0))
+        manager.get_chunk((2, 0))
+        self.assertNotIn((0, 0), manager)
+
+        with patch.object(NoiseFunction, "noise_array", side_effect=AssertionError):
+            chunk = manager.get_chunk((0, 0))
+
+        self.assertTrue(np.array_equal(height, chunk.height))
+
+    def test_invalidate_removes_spilled_chunks(self):
+        manager = self.create_manager(spill_directory=self.directory.name)
+        for coords in [(0, 0), (1, 0), (2, 0)]:
+            manager.get_chunk(coords)
+        manager.invalidate()
+
+        self.assertEqual(0, len(manager))
+        self.assertEqual([], os.listdir(self.directory.name))
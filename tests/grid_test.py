@@ -0,0 +1,358 @@
+import itertools
+import unittest
+
+import numpy as np
+
+from src.terrain.grid import Grid
+from src.terrain.tile import Tile
+
+
+class FakeOrganism:
+    def __init__(self, organism_id: int, tile: Tile) -> None:
+        self.id = organism_id
+        self.tile = tile
+
+
+class TestGrid(unittest.TestCase):
+    def setUp(self) -> None:
+        self.grid = Grid(4, 5, 10)
+        self.heights = np.full((4, 5), 0.5)
+        self.heights[0, 0:2] = 0.05
+        self.moistures = np.full((4, 5), 0.4)
+        self.grid.set_terrain(self.heights, self.moistures)
+        self.tile = Tile(self.grid, 2, 3)
+
+    def tearDown(self) -> None:
+        pass
+
+    def create_organism(self, organism_id: int, row: int, col: int):
+        return FakeOrganism(organism_id, self.grid.get_tile(row, col))
+
+
+class TestSetTerrain(TestGrid):
+    def test_derived_attributes(self):
+        table = Tile.get_biome_table()
+        biome_ids = table.lookup(self.heights, self.moistures)
+
+        self.assertTrue(np.array_equal(biome_ids, self.grid.biome_id))
+        self.assertTrue(
+            np.array_equal(table.plant_growth[biome_ids], self.grid.plant_growth)
+        )
+        self.assertTrue(np.array_equal(table.has_water[biome_ids], self.grid.has_water))
+
+    def test_coast_and_border(self):
+        self.assertTrue(self.grid.is_coast[0, 0])
+        self.assertTrue(self.grid.is_coast[0, 1])
+        self.assertFalse(self.grid.is_coast[0, 2])
+        self.assertEqual(4 * 2 + 5 * 2 - 4, self.grid.is_border.sum())
+        self.assertFalse(self.grid.is_border[1, 1])
+
+    def test_set_tile_terrain_updates_coast_locally(self):
+        for row, col, height in [(0, 1, 1), (2, 2, 0), (2, 3, 0), (0, 0, 1)]:
+            self.grid.set_tile_terrain(row, col, height, 0.5)
+            is_coast = self.grid.is_coast.copy()
+            self.grid._update_coast()
+            self.assertTrue(np.array_equal(self.grid.is_coast, is_coast))
+
+    def test_set_tile_terrain_updates_land_neighbor_bits_locally(self):
+        for row, col, height in [(0, 1, 1), (2, 2, 0), (3, 4, 0), (2, 2, 1)]:
+            self.grid.set_tile_terrain(row, col, height, 0.5)
+            bits = self.grid.land_neighbor_bits.copy()
+            self.grid._update_land_neighbor_bits()
+            self.assertTrue(np.array_equal(self.grid.land_neighbor_bits, bits))
+
+    def test_shape_mismatch(self):
+        with self.assertRaises(ValueError):
+            self.grid.set_terrain(np.zeros((5, 4)), np.zeros((5, 4)))
+
+    def test_values_out_of_range(self):
+        with self.assertRaises(ValueError):
+            self.grid.set_terrain(self.heights + 1, self.moistures)
+
+
+class TestTileView(TestGrid):
+    def test_tile_reads_grid(self):
+        self.assertEqual(0.5, self.tile.height)
+        self.assertEqual(0.4, self.tile.moisture)
+        self.assertEqual(self.grid.biome_id[2, 3], self.tile.biome_id)
+        self.assertEqual((30, 20, 10, 10), tuple(self.tile.rect))
+        self.assertTrue(Tile(self.grid, 0, 0).has_water)
+
+    def test_tile_writes_grid(self):
+        self.tile.height = 0.05
+        self.tile.times_visted += 1
+
+        self.assertEqual(0.05, self.grid.height[2, 3])
+        self.assertTrue(self.grid.has_water[2, 3])
+        self.assertEqual(1, self.grid.times_visited[2, 3])
+
+    def test_tile_rejects_invalid_values(self):
+        with self.assertRaises(ValueError):
+            self.tile.moisture = 1.5
+        with self.assertRaises(ValueError):
+            self.tile.set_terrain(-0.1, 0.5)
+
+    def test_tile_only_stores_its_position(self):
+        self.assertFalse(hasattr(self.tile, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.tile.image = None
+
+
+class TestNeighbors(TestGrid):
+    def test_offsets(self):
+        self.assertEqual(4, len(Grid.get_offsets(4)))
+        self.assertEqual(8, len(Grid.get_offsets(8)))
+        self.assertEqual(12, len(Grid.get_offsets(4, radius=2)))
+        self.assertEqual(24, len(Grid.get_offsets(8, radius=2)))
+        with self.assertRaises(ValueError):
+            Grid.get_offsets(6)
+
+    def test_neighbor_table_matches_coordinates(self):
+        for connectivity in (4, 8):
+            for radius in (1, 2):
+                offsets = Grid.get_offsets(connectivity, radius).tolist()
+                indices, valid = self.grid.get_neighbor_table(connectivity, radius)
+                for tile in self.grid.tiles:
+                    expected = {
+                        (tile.row + row, tile.col + col)
+                        for row, col in offsets
+                        if 0 <= tile.row + row < 4 and 0 <= tile.col + col < 5
+                    }
+                    found = {
+                        divmod(int(index), 5)
+                        for index in indices[tile.index][valid[tile.index]]
+                    }
+                    self.assertEqual(expected, found)
+
+    def test_tile_neighbors(self):
+        corner = self.grid.get_tile(0, 0)
+
+        self.assertEqual(
+            [self.grid.get_tile(0, 1), self.grid.get_tile(1, 0)],
+            corner.get_neighboring_tiles(),
+        )
+        self.assertEqual(4, len(self.tile.get_neighboring_tiles()))
+        self.assertTrue(corner.is_neighboring_tile(self.grid.get_tile(1, 0)))
+        self.assertFalse(corner.is_neighboring_tile(self.grid.get_tile(1, 1)))
+        self.assertFalse(corner.is_neighboring_tile(corner))
+
+    def test_count_neighbors(self):
+        counts = self.grid.count_neighbors(self.grid.has_water)
+
+        self.assertEqual(1, counts[0, 0])
+        self.assertEqual(1, counts[1, 0])
+        self.assertEqual(0, counts[2, 2])
+
+
+class TestOccupancy(TestGrid):
+    def test_add_and_remove(self):
+        tile = self.grid.get_tile(2, 3)
+        animal = self.create_organism(7, 2, 3)
+        tile.add_animal(animal)
+
+        self.assertTrue(tile.has_animal())
+        self.assertFalse(tile.has_plant())
+        self.assertIs(animal, tile.animal)
+        self.assertEqual(7, self.grid.animal_id[2, 3])
+        self.assertEqual(1, tile.times_visted)
+
+        tile.remove_animal(animal)
+
+        self.assertFalse(tile.has_animal())
+        self.assertIsNone(tile.animal)
+        self.assertNotIn(7, self.grid.organisms)
+
+    def test_remove_other_organism(self):
+        tile = self.grid.get_tile(2, 3)
+        plant = self.create_organism(3, 2, 3)
+        tile.add_plant(plant)
+        tile.remove_plant(self.create_organism(4, 2, 3))
+
+        self.assertIs(plant, tile.plant)
+
+    def test_add_to_occupied_tile(self):
+        tile = self.grid.get_tile(2, 3)
+        tile.add_plant(self.create_organism(1, 2, 3))
+
+        with self.assertRaises(ValueError):
+            tile.add_plant(self.create_organism(2, 2, 3))
+
+    def test_free_land_adjacent_to_plants(self):
+        self.grid.get_tile(1, 1).add_plant(self.create_organism(1, 1, 1))
+        self.grid.get_tile(1, 2).add_plant(self.create_organism(2, 1, 2))
+
+        free = self.grid.get_free_mask(needs_no_plant=True, needs_no_water=True)
+        indices = self.grid.get_adjacent_indices(self.grid.plant_id != Grid.EMPTY, free)
+
+        # (0, 1) is water, (1, 1) and (1, 2) hold the plants
+        expected = [(0, 2), (1, 0), (1, 3), (2, 1), (2, 2)]
+        self.assertEqual([row * 5 + col for row, col in expected], indices.tolist())
+
+    def test_spawn_index_follows_occupancy_and_terrain(self):
+        animal = self.create_organism(1, 2, 3)
+        animal.tile.add_animal(animal)
+        self.grid.get_tile(3, 0).height = 0.05
+
+        for free_tiles, mask in [
+            (
+                self.grid.free_animal_tiles,
+                self.grid.get_free_mask(needs_no_animal=True, needs_no_water=True),
+            ),
+            (
+                self.grid.free_plant_tiles,
+                self.grid.get_free_mask(needs_no_plant=True, needs_no_water=True),
+            ),
+        ]:
+            self.assertEqual(
+                np.flatnonzero(mask).tolist(), sorted(free_tiles.get_indices().tolist())
+            )
+        self.assertNotIn(13, self.grid.free_animal_tiles)
+        self.assertIn(13, self.grid.free_plant_tiles)
+
+        animal.tile.remove_animal(animal)
+        self.assertIn(13, self.grid.free_animal_tiles)
+
+
+class TestSampling(TestGrid):
+    def setUp(self) -> None:
+        super().setUp()
+        for organism_id, (row, col) in enumerate([(0, 2), (1, 1), (2, 3), (3, 3)]):
+            self.grid.get_tile(row, col).add_plant(
+                self.create_organism(organism_id, row, col)
+            )
+        for organism_id, (row, col) in enumerate([(1, 2), (2, 2)], start=10):
+            self.grid.get_tile(row, col).add_animal(
+                self.create_organism(organism_id, row, col)
+            )
+        self.grid.get_tile(1, 2).remove_animal(self.grid.get_tile(1, 2).animal)
+
+    def get_options(self, tile: Tile, needs: dict[str, bool]) -> set[int]:
+        """
+        The neighbors meeting the needs, checked tile by tile.
+        """
+        options = set()
+        for neighbor in tile.get_neighboring_tiles():
+            if needs["needs_plant"] and not neighbor.has_plant():
+                continue
+            if needs["needs_no_plant"] and neighbor.has_plant():
+                continue
+            if needs["needs_animal"] and not neighbor.has_animal():
+                continue
+            if needs["needs_no_animal"] and neighbor.has_animal():
+                continue
+            if needs["needs_water"] and not neighbor.has_water:
+                continue
+            if needs["needs_no_water"] and neighbor.has_water:
+                continue
+            options.add(neighbor.index)
+        return options
+
+    def all_needs(self):
+        names = [
+            "needs_plant",
+            "needs_no_plant",
+            "needs_animal",
+            "needs_no_animal",
+            "needs_water",
+            "needs_no_water",
+        ]
+        for values in itertools.product([False, True], repeat=len(names)):
+            yield dict(zip(names, values))
+
+    def test_sample_neighbor_matches_options(self):
+        for tile in self.grid.tiles:
+            for needs in self.all_needs():
+                options = self.get_options(tile, needs)
+                samples = {
+                    self.grid.sample_neighbor(tile.index, **needs) for _ in range(200)
+                }
+                if options:
+                    self.assertEqual(options, samples)
+                else:
+                    self.assertEqual({None}, samples)
+
+    def test_sample_neighbors_matches_options(self):
+        indices = np.repeat(np.arange(20), 200)
+        for needs in self.all_needs():
+            samples = self.grid.sample_neighbors(indices, **needs)
+            for tile in self.grid.tiles:
+                options = self.get_options(tile, needs) or {Grid.EMPTY}
+                self.assertEqual(options, set(samples[indices == tile.index].tolist()))
+
+    def test_bits_follow_terrain(self):
+        self.grid.get_tile(0, 3).height = 0.05
+        samples = {self.grid.sample_neighbor(2, needs_water=True) for _ in range(30)}
+
+        self.assertEqual({1, 3}, samples)
+
+
+class TestSpatialQueries(TestGrid):
+    def setUp(self) -> None:
+        super().setUp()
+        self.plant = self.create_organism(1, 0, 4)
+        self.plant.tile.add_plant(self.plant)
+        self.animal = self.create_organism(2, 2, 3)
+        self.animal.tile.add_animal(self.animal)
+
+    def test_organisms_in_radius(self):
+        self.assertEqual([self.animal], self.grid.get_organisms_in_radius(2, 2, 1))
+        self.assertEqual(
+            [self.plant], self.grid.get_organisms_in_radius(2, 2, 3, animals=False)
+        )
+        self.assertEqual(2, len(self.grid.get_organisms_in_radius(2, 2, 3)))
+
+    def test_nearest_organisms(self):
+        self.assertEqual(
+            [self.animal, self.plant], self.grid.get_nearest_organisms(1, 2, 2)
+        )
+        self.assertEqual([self.plant], self.grid.get_nearest_organisms(0, 3, 1))
+
+    def test_hash_follows_occupancy(self):
+        self.animal.tile.remove_animal(self.animal)
+        self.animal.tile = self.grid.get_tile(3, 0)
+        self.animal.tile.add_animal(self.animal)
+
+        self.assertEqual((3, 0), self.grid.animal_hash.get_position(self.animal))
+        self.assertEqual([], self.grid.get_organisms_in_radius(2, 3, 1))
+
+
+class TestFoodField(TestGrid):
+    def test_distance_field(self):
+        sources = np.zeros((4, 5), dtype=bool)
+        sources[3, 4] = True
+        distance = self.grid.get_distance_field(sources)
+
+        for tile in self.grid.tiles:
+            self.assertEqual(3 - tile.row + 4 - tile.col, distance[tile.row, tile.col])
+
+    def test_distance_field_around_obstacles(self):
+        sources = np.zeros((4, 5), dtype=bool)
+        sources[0, 0] = True
+        passable = np.ones((4, 5), dtype=bool)
+        passable[0:3, 1] = False
+        passable[3, 3] = False
+        distance = self.grid.get_distance_field(sources, passable)
+
+        self.assertEqual(4, distance[3, 1])
+        self.assertEqual(8, distance[0, 2])
+        self.assertEqual(Grid.UNREACHABLE, distance[1, 1])
+
+    def test_food_steps_lead_to_plant(self):
+        plant = self.create_organism(1, 3, 1)
+        plant.tile.add_plant(plant)
+        self.grid.update_food_field()
+
+        tile = self.grid.get_tile(0, 4)
+        steps = 0
+        while tile.get_food_tile() is not None:
+            tile = tile.get_food_tile()
+            steps += 1
+        self.assertIs(plant.tile, tile)
+        self.assertEqual(6, steps)
+        self.assertEqual(6, self.grid.food_distance[0, 4])
+
+    def test_food_field_without_plants(self):
+        self.grid.update_food_field()
+
+        self.assertTrue(np.all(self.grid.food_distance == Grid.UNREACHABLE))
+        self.assertIsNone(self.tile.get_food_tile())
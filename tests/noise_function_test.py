@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from src.helper.noise_function import NoiseFunction
 
 
@@ -159,3 +161,135 @@ class TestWeigh(unittest.TestCase):
             NoiseFunction.weigh(x, y, [])
         except ValueError:
             pass
+
+
+class TestNoiseArray(unittest.TestCase):
+    def setUp(self) -> None:
+        self.function = NoiseFunction(
+            factor_x=2,
+            factor_y=3,
+            offset_x=1,
+            offset_y=2,
+            pow_x=1,
+            pow_y=2,
+            pow=1.5,
+            fudge=1.2,
+        )
+        self.xs = np.arange(7) * 0.37
+        self.ys = np.arange(5) * 0.21
+
+    def test_noise_array_matches_noise(self):
+        """
+        Tests if NoiseFunction.noise_array returns the same values as NoiseFunction.noise for every coordinate
+        """
+        result = self.function.noise_array(self.xs, self.ys)
+
+        self.assertEqual((len(self.ys), len(self.xs)), result.shape)
+        for row, y in enumerate(self.ys):
+            for col, x in enumerate(self.xs):
+                self.assertAlmostEqual(self.function.noise(x, y), result[row, col])
+
+    def test_weigh_array_matches_weigh(self):
+        """
+        Tests if NoiseFunction.weigh_array returns the same values as NoiseFunction.weigh for every coordinate
+        """
+        function2 = NoiseFunction(
+            factor_x=1.5,
+            factor_y=2.5,
+            offset_x=-1,
+            offset_y=-2,
+            pow_x=2,
+            pow_y=1,
+            pow=1.2,
+            fudge=1.5,
+        )
+        functions = [self.function, function2]
+        weights = [1, 0.2]
+
+        result = NoiseFunction.weigh_array(self.xs, self.ys, functions, weights)
+
+        for row, y in enumerate(self.ys):
+            for col, x in enumerate(self.xs):
+                self.assertAlmostEqual(
+                    NoiseFunction.weigh(x, y, functions, weights), result[row, col]
+                )
+
+    def test_weigh_array_without_functions(self):
+        """
+        Tests if NoiseFunction.weigh_array raises an error if the list of functions given is empty
+        """
+        with self.assertRaises(ValueError):
+            NoiseFunction.weigh_array(self.xs, self.ys, [])
+
+    def test_weigh_array_parallel_matches_weigh_array(self):
+        """
+        Tests if NoiseFunction.weigh_array_parallel returns exactly the same field as NoiseFunction.weigh_array
+        """
+        function2 = NoiseFunction(
+            factor_x=4,
+            factor_y=4,
+            offset_x=19.1,
+            offset_y=16.2,
+            pow=0.63,
+        )
+        functions = [self.function, function2]
+        weights = [1, 0.2]
+        ys = np.arange(23) * 0.21
+
+        expected = NoiseFunction.weigh_array(self.xs, ys, functions, weights)
+        result = NoiseFunction.weigh_array_parallel(
+            self.xs, ys, functions, weights, processes=3
+        )
+
+        self.assertTrue(np.array_equal(expected, result))
+
+    def test_process_pool_spawns_workers_and_shuts_down(self):
+        """
+        Tests if the process pool spawns its workers instead of forking them and can be shut down
+        """
+        NoiseFunction.weigh_array_parallel(self.xs, self.ys, [self.function])
+        pool = NoiseFunction._process_pool
+
+        self.assertEqual("spawn", pool._mp_context.get_start_method())
+        NoiseFunction.shutdown_process_pool()
+        self.assertIsNone(NoiseFunction._process_pool)
+        with self.assertRaises(RuntimeError):
+            pool.submit(int)
+
+
+class TestKernel(unittest.TestCase):
+    def setUp(self) -> None:
+        self.function = NoiseFunction(pow_x=1.5, pow_y=2, pow=0.5, fudge=1.4)
+
+    def test_kernel_is_reused(self):
+        self.assertIs(self.function.get_kernel(), self.function.get_kernel())
+
+    def test_kernel_is_recompiled_after_setting_changed(self):
+        kernel = self.function.get_kernel()
+        self.function.fudge.set_value(0.8)
+
+        self.assertIsNot(kernel, self.function.get_kernel())
+        self.assertEqual(
+            self.function.get_parameters(), self.function.get_kernel().parameters
+        )
+
+    def test_kernel_is_recompiled_after_set_parameters(self):
+        kernel = self.function.get_kernel()
+        self.function.set_parameters((2, 2, 0, 0, 1, 1, 1, 1))
+
+        self.assertIsNot(kernel, self.function.get_kernel())
+
+    def test_fractional_power_of_negative_coordinate(self):
+        """
+        Tests if coordinates for which the power is not defined are left unchanged
+        """
+        _xs, _ys = self.function.function_array(np.array([-4.0, 4.0]), np.array([-3.0]))
+
+        self.assertEqual(-4.0, _xs[0])
+        self.assertEqual(8.0, _xs[1])
+        self.assertEqual(9.0, _ys[0])
+
+    def test_noise_is_clamped(self):
+        values = self.function.noise_array(np.arange(-50, 50), np.arange(-50, 50))
+
+        self.assertTrue(np.all((values >= 0) & (values <= 1)))
@@ -0,0 +1,223 @@
+import unittest
+
+import numpy as np
+import pygame
+
+from src.entities.animal import Animal
+from src.entities.organism import Organism
+from src.entities.organism_store import OrganismStore
+from src.entities.plant import Plant
+from src.settings import simulation
+from src.terrain.grid import Grid
+
+
+class TestOrganismStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.store = OrganismStore(capacity=2)
+
+    def tearDown(self) -> None:
+        pass
+
+
+class TestInit(TestOrganismStore):
+    def test_initialize_with_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            OrganismStore(capacity=0)
+
+
+class TestSlots(TestOrganismStore):
+    def test_add_and_remove(self):
+        first = self.store.add("a", OrganismStore.ANIMAL)
+        second = self.store.add("b", OrganismStore.PLANT)
+        self.store.health[second] = 3
+
+        self.assertEqual(2, len(self.store))
+        self.assertEqual([second], self.store.get_slots(OrganismStore.PLANT).tolist())
+        self.assertEqual(3, self.store.remove(second)["health"])
+        self.assertEqual([first], self.store.get_slots().tolist())
+        with self.assertRaises(ValueError):
+            self.store.remove(second)
+
+    def test_slots_are_reused_and_reset(self):
+        slot = self.store.add("a", OrganismStore.ANIMAL)
+        self.store.energy[slot] = 5
+        self.store.remove(slot)
+
+        reused = self.store.add("b", OrganismStore.PLANT)
+        self.assertEqual(slot, reused)
+        self.assertEqual(0, self.store.energy[reused])
+        self.assertEqual("b", self.store.handles[reused])
+
+    def test_grow(self):
+        slots = [self.store.add(i, OrganismStore.ANIMAL) for i in range(5)]
+        self.store.tick_age[slots] = np.arange(5)
+
+        self.assertEqual(5, len(set(slots)))
+        self.assertLessEqual(5, self.store.capacity)
+        self.assertEqual(list(range(5)), self.store.tick_age[slots].tolist())
+
+
+class TestHandles(TestOrganismStore):
+    def setUp(self) -> None:
+        super().setUp()
+        simulation.reset_organisms()
+        self.grid = Grid(3, 3, 10)
+        self.grid.set_terrain(np.full((3, 3), 0.5), np.full((3, 3), 0.5))
+        self.plant = Plant(self.grid.get_tile(1, 2), rect=pygame.Rect(10, 20, 10, 10))
+
+    def tearDown(self) -> None:
+        simulation.reset_organisms()
+
+    def test_attributes_are_stored_in_columns(self):
+        store = simulation.store
+        self.plant.tick_age += 2
+        self.plant.energy = self.plant.MAX_ENERGY + 1
+
+        self.assertEqual(2, store.tick_age[self.plant.slot])
+        self.assertEqual(1, store.row[self.plant.slot])
+        self.assertEqual(2, store.col[self.plant.slot])
+        self.assertEqual(self.plant.MAX_ENERGY, store.energy[self.plant.slot])
+        self.assertEqual(
+            self.plant.dna.defense_gene.value, store.defense[self.plant.slot]
+        )
+
+    def test_reset_detaches_organisms(self):
+        self.plant.health = 7
+        simulation.reset_organisms()
+
+        self.assertIsNone(self.plant.slot)
+        self.assertEqual(7, self.plant.health)
+        self.assertFalse(self.grid.get_tile(1, 2).has_plant())
+        self.assertEqual({}, self.grid.organisms)
+        self.assertEqual(0, len(self.grid.plant_hash))
+        self.assertIn(1 * 3 + 2, self.grid.free_plant_tiles)
+
+        plant = Plant(self.grid.get_tile(1, 2), rect=pygame.Rect(10, 20, 10, 10))
+        plant.health = 3
+        self.assertEqual(7, self.plant.health)
+        self.assertEqual([plant.slot], simulation.store.get_slots().tolist())
+
+    def test_dead_organism_keeps_its_values(self):
+        self.plant.tick_age = 4
+        self.plant.health = 0
+        self.plant.die()
+
+        self.assertIsNone(self.plant.slot)
+        self.assertEqual(0, len(simulation.store))
+        self.assertEqual(4, self.plant.tick_age)
+        self.assertFalse(self.grid.get_tile(1, 2).has_plant())
+
+
+class TestEnergy(TestOrganismStore):
+    def test_add_energy_moves_overflow_into_health(self):
+        slots = np.array([self.store.add(i, OrganismStore.PLANT) for i in range(3)])
+        self.store.health[slots] = [5, 5, 9]
+        self.store.energy[slots] = [8, 2, 8]
+
+        self.store.add_energy(slots, np.array([1, -4, 5]), 10, 10)
+
+        self.assertEqual([9, 0, 10], self.store.energy[slots].tolist())
+        self.assertEqual([5, 3, 10], self.store.health[slots].tolist())
+
+
+class TestPhotosynthesis(TestHandles):
+    def test_photosynthesis_matches_formula(self):
+        self.plant.energy = 0
+        self.plant.health = 10
+        self.plant.height_preference = 0.25
+        self.plant.moisture_preference = 0.5
+
+        np.random.seed(0)
+        random_value = np.random.random()
+        np.random.seed(0)
+        Plant.photosynthesise(self.grid)
+
+        expected = (
+            random_value
+            * self.grid.plant_growth[1, 2]
+            * Plant._PHOTOSYNTHESIS_ENERGY_MULTIPLIER
+            * (0.75 + 1)
+            / 2
+        )
+        self.assertAlmostEqual(expected, self.plant.energy)
+        self.assertEqual(10, self.plant.health)
+
+    def test_photosynthesis_overflows_into_health(self):
+        self.plant.health = 10
+        self.plant.height_preference = 0.5
+        self.plant.moisture_preference = 0.5
+
+        Plant.photosynthesise(self.grid)
+
+        self.assertEqual(self.plant.MAX_ENERGY, self.plant.energy)
+        self.assertLessEqual(10, self.plant.health)
+
+
+class TestPopulationPhases(TestHandles):
+    def test_update_population_ages_and_drowns(self):
+        self.grid.set_tile_terrain(1, 2, 0, 1)
+        self.plant.health = 30
+
+        Plant.update_population(self.grid)
+
+        self.assertEqual(1, self.plant.tick_age)
+        self.assertEqual(20, self.plant.health)
+        self.assertEqual(self.plant.MAX_ENERGY, self.plant.energy)
+
+    def test_drowning_uses_occupied_tile(self):
+        self.grid.set_tile_terrain(0, 1, 0, 1)
+        animal = Animal(self.grid.get_tile(0, 0), rect=pygame.Rect(0, 0, 10, 10))
+        swimmer = Animal(self.grid.get_tile(0, 1), rect=pygame.Rect(10, 0, 10, 10))
+        with self.assertRaises(ValueError):
+            animal.enter_tile(self.grid.get_tile(0, 1))
+
+        Animal.update_population(self.grid)
+
+        self.assertEqual(Animal._MAX_HEALTH, animal.health)
+        self.assertEqual(Animal._MAX_HEALTH - 10, swimmer.health)
+
+    def test_maintenance_underflow_is_taken_from_health(self):
+        animal = Animal(self.grid.get_tile(0, 0), rect=pygame.Rect(0, 0, 10, 10))
+        animal.energy = 4
+        animal.health = 20
+
+        Animal.update_population(self.grid)
+
+        self.assertEqual(0, animal.energy)
+        self.assertEqual(20 + 4 - Animal._BASE_ENERGY_MAINTENANCE, animal.health)
+
+    def test_remove_dead(self):
+        simulation.plants.add(self.plant)
+        self.plant.health = 0
+        Organism.remove_dead()
+
+        self.assertIsNone(self.plant.slot)
+        self.assertNotIn(self.plant, simulation.plants)
+        self.assertFalse(self.grid.get_tile(1, 2).has_plant())
+
+
+class TestImage(TestHandles):
+    def test_organisms_share_their_image(self):
+        other = Plant(
+            self.grid.get_tile(0, 1),
+            rect=pygame.Rect(10, 0, 10, 10),
+            dna=self.plant.dna,
+        )
+
+        self.assertNotIn("image", vars(self.plant))
+        self.assertIs(self.plant.image, other.image)
+        self.assertEqual(Plant._MAX_ALPHA, self.plant.image.get_alpha())
+
+
+class TestMovement(TestHandles):
+    def test_blocked_move_keeps_position(self):
+        animal = Animal(self.grid.get_tile(0, 0), rect=pygame.Rect(0, 0, 10, 10))
+        Animal(self.grid.get_tile(0, 1), rect=pygame.Rect(10, 0, 10, 10))
+
+        with self.assertRaises(ValueError):
+            animal.enter_tile(self.grid.get_tile(0, 1))
+
+        self.assertEqual(0, simulation.store.row[animal.slot])
+        self.assertEqual(0, simulation.store.col[animal.slot])
+        self.assertEqual((0, 0), animal.rect.topleft)
+        self.assertEqual(1, animal.tiles_visited)
@@ -0,0 +1,66 @@
+import unittest
+from unittest.mock import Mock
+
+from src.helper.setting import BoundedSetting, Setting
+
+
+class TestSetting(unittest.TestCase):
+    def setUp(self) -> None:
+        self.method = Mock()
+        self.other_method = Mock()
+        self.setting = BoundedSetting(self.method, value=1, min=0, max=2)
+        self.other_setting = BoundedSetting(
+            self.other_method, self.method, value=1, min=0, max=2
+        )
+
+    def tearDown(self) -> None:
+        pass
+
+
+class TestBatch(TestSetting):
+    def test_post_update_without_batch(self):
+        self.setting.set_value(0.5)
+        self.setting.set_value(1.5)
+
+        self.assertEqual(2, self.method.call_count)
+
+    def test_batch_coalesces_post_updates(self):
+        with Setting.batch():
+            self.setting.set_value(0.5)
+            self.other_setting.set_value(0.5)
+            self.setting.randomise_value()
+            self.method.assert_not_called()
+            self.other_method.assert_not_called()
+
+        self.method.assert_called_once()
+        self.other_method.assert_called_once()
+
+    def test_batch_calls_in_order_of_first_request(self):
+        calls = []
+        self.method.side_effect = lambda: calls.append("method")
+        self.other_method.side_effect = lambda: calls.append("other")
+
+        with Setting.batch():
+            self.other_setting.set_value(0.5)
+            self.setting.set_value(0.5)
+
+        self.assertEqual(["other", "method"], calls)
+
+    def test_nested_batches_fire_once_when_outermost_closes(self):
+        with Setting.batch():
+            with Setting.batch():
+                self.setting.set_value(0.5)
+            self.method.assert_not_called()
+            self.setting.set_value(1.5)
+
+        self.method.assert_called_once()
+
+    def test_batch_fires_after_exception(self):
+        with self.assertRaises(RuntimeError):
+            with Setting.batch():
+                self.setting.set_value(0.5)
+                raise RuntimeError()
+
+        self.method.assert_called_once()
+        self.setting.set_value(1.5)
+        self.assertEqual(2, self.method.call_count)
@@ -0,0 +1,71 @@
+import random
+import unittest
+
+from src.terrain.spatial_hash import SpatialHash
+
+
+class TestSpatialHash(unittest.TestCase):
+    def setUp(self) -> None:
+        self.random = random.Random(3)
+        self.hash = SpatialHash(bucket_size=4)
+        self.positions = {}
+        for item in range(200):
+            position = (self.random.randrange(-20, 40), self.random.randrange(0, 50))
+            self.hash.insert(item, *position)
+            self.positions[item] = position
+
+    def tearDown(self) -> None:
+        pass
+
+    def distance(self, item: int, row: int, col: int) -> int:
+        item_row, item_col = self.positions[item]
+        return (item_row - row) ** 2 + (item_col - col) ** 2
+
+
+class TestInit(TestSpatialHash):
+    def test_initialize_with_invalid_bucket_size(self):
+        with self.assertRaises(ValueError):
+            SpatialHash(bucket_size=0)
+
+
+class TestUpdates(TestSpatialHash):
+    def test_insert_moves_item(self):
+        self.hash.insert(5, 100, 100)
+
+        self.assertEqual(200, len(self.hash))
+        self.assertEqual((100, 100), self.hash.get_position(5))
+        self.assertEqual([5], self.hash.query_radius(100, 100, 0))
+
+    def test_remove(self):
+        self.hash.remove(5)
+        self.hash.remove(500)
+
+        self.assertNotIn(5, self.hash)
+        self.assertEqual(199, len(self.hash))
+        self.assertNotIn(5, self.hash.query_radius(*self.positions[5], 0))
+
+
+class TestQueries(TestSpatialHash):
+    def test_query_radius_matches_scan(self):
+        for row, col, radius in [(0, 0, 5), (10, 25, 7.5), (-30, 0, 12), (5, 5, 0)]:
+            expected = {
+                item
+                for item in self.positions
+                if self.distance(item, row, col) <= radius * radius
+            }
+            self.assertEqual(expected, set(self.hash.query_radius(row, col, radius)))
+
+    def test_query_nearest_matches_scan(self):
+        for row, col, k in [(0, 0, 1), (10, 25, 10), (-60, 80, 5), (3, 3, 250)]:
+            expected = sorted(self.distance(item, row, col) for item in self.positions)
+            found = [
+                self.distance(item, row, col)
+                for item in self.hash.query_nearest(row, col, k)
+            ]
+            self.assertEqual(expected[:k], found)
+
+    def test_query_nearest_with_max_radius(self):
+        found = self.hash.query_nearest(10, 25, 50, max_radius=6)
+
+        self.assertTrue(all(self.distance(item, 10, 25) <= 36 for item in found))
+        self.assertEqual(len(self.hash.query_radius(10, 25, 6)), len(found))
@@ -0,0 +1,59 @@
+import unittest
+
+import numpy as np
+
+from src.terrain.spawn_index import SpawnIndex
+
+
+class TestSpawnIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = SpawnIndex(10)
+        for value in [2, 5, 7, 9]:
+            self.index.add(value)
+
+    def tearDown(self) -> None:
+        pass
+
+
+class TestAddRemove(TestSpawnIndex):
+    def test_add_and_remove(self):
+        self.index.add(5)
+        self.index.remove(2)
+        self.index.remove(3)
+
+        self.assertEqual(3, len(self.index))
+        self.assertNotIn(2, self.index)
+        self.assertIn(9, self.index)
+        self.assertEqual([5, 7, 9], sorted(self.index.get_indices().tolist()))
+
+    def test_reset(self):
+        mask = np.zeros(10, dtype=bool)
+        mask[[0, 1, 9]] = True
+        self.index.reset(mask)
+
+        self.assertEqual([0, 1, 9], sorted(self.index.get_indices().tolist()))
+        self.assertNotIn(5, self.index)
+
+
+class TestSample(TestSpawnIndex):
+    def test_sample_is_distinct(self):
+        samples = self.index.sample(3).tolist()
+
+        self.assertEqual(3, len(set(samples)))
+        self.assertTrue(set(samples) <= {2, 5, 7, 9})
+
+    def test_sample_more_than_size(self):
+        self.assertEqual([2, 5, 7, 9], sorted(self.index.sample(100).tolist()))
+
+    def test_weighted_sample_skips_zero_weights(self):
+        weights = np.zeros(10)
+        weights[[5, 9]] = [1, 0.5]
+
+        for amount in [1, 2, 4]:
+            samples = self.index.sample(amount, weights).tolist()
+            self.assertTrue(set(samples) <= {5, 9})
+            self.assertEqual(len(samples), len(set(samples)))
+        self.assertEqual([5, 9], sorted(self.index.sample(4, weights).tolist()))
+
+    def test_weighted_sample_without_weight(self):
+        self.assertEqual(0, len(self.index.sample(2, np.zeros(10))))
@@ -0,0 +1,40 @@
+import unittest
+
+import pygame
+
+from src.entities.surface_cache import SurfaceCache
+
+
+class TestSurfaceCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache = SurfaceCache(max_size=2)
+
+    def tearDown(self) -> None:
+        pass
+
+
+class TestInit(TestSurfaceCache):
+    def test_initialize_with_invalid_max_size(self):
+        with self.assertRaises(ValueError):
+            SurfaceCache(max_size=0)
+
+
+class TestGet(TestSurfaceCache):
+    def test_surfaces_are_shared(self):
+        surface = self.cache.get((4, 3), pygame.Color(10, 20, 30), 100)
+
+        self.assertIs(surface, self.cache.get((4, 3), pygame.Color(10, 20, 30), 100))
+        self.assertIsNot(surface, self.cache.get((4, 3), pygame.Color(10, 20, 30)))
+        self.assertEqual((4, 3), surface.get_size())
+        self.assertEqual((10, 20, 30), tuple(surface.get_at((0, 0)))[:3])
+        self.assertEqual(100, surface.get_alpha())
+
+    def test_least_recently_used_surface_is_dropped(self):
+        red = self.cache.get((1, 1), pygame.Color("red"))
+        green = self.cache.get((1, 1), pygame.Color("green"))
+        self.cache.get((1, 1), pygame.Color("red"))
+        self.cache.get((1, 1), pygame.Color("blue"))
+
+        self.assertEqual(2, len(self.cache))
+        self.assertIs(red, self.cache.get((1, 1), pygame.Color("red")))
+        self.assertIsNot(green, self.cache.get((1, 1), pygame.Color("green")))
@@ -0,0 +1,81 @@
+import unittest
+
+import numpy as np
+
+from src.terrain.terrain_cache import TerrainCache
+
+
+class TestTerrainCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.field_size = np.zeros((4, 4)).nbytes
+        self.cache = TerrainCache(memory_budget=self.field_size * 2)
+
+    def tearDown(self) -> None:
+        pass
+
+
+class TestInit(TestTerrainCache):
+    def test_initialize_with_negative_budget(self):
+        with self.assertRaises(ValueError):
+            TerrainCache(memory_budget=-1)
+
+
+class TestGetPut(TestTerrainCache):
+    def test_get_missing_key(self):
+        self.assertIsNone(self.cache.get("missing"))
+
+    def test_put_and_get(self):
+        field = np.ones((4, 4))
+        self.cache.put("a", field)
+
+        self.assertIs(field, self.cache.get("a"))
+        self.assertEqual(self.field_size, self.cache.memory_usage)
+
+    def test_put_makes_field_read_only(self):
+        field = np.ones((4, 4))
+        self.cache.put("a", field)
+
+        with self.assertRaises(ValueError):
+            field[0, 0] = 2
+
+    def test_put_replaces_existing_key(self):
+        self.cache.put("a", np.ones((4, 4)))
+        self.cache.put("a", np.zeros((4, 4)))
+
+        self.assertEqual(1, len(self.cache))
+        self.assertEqual(self.field_size, self.cache.memory_usage)
+        self.assertEqual(0, self.cache.get("a")[0, 0])
+
+    def test_put_field_bigger_than_budget(self):
+        self.cache.put("big", np.ones((8, 8)))
+
+        self.assertNotIn("big", self.cache)
+        self.assertEqual(0, self.cache.memory_usage)
+
+
+class TestEviction(TestTerrainCache):
+    def test_least_recently_used_is_evicted(self):
+        self.cache.put("a", np.ones((4, 4)))
+        self.cache.put("b", np.ones((4, 4)))
+        self.cache.get("a")
+        self.cache.put("c", np.ones((4, 4)))
+
+        self.assertIn("a", self.cache)
+        self.assertNotIn("b", self.cache)
+        self.assertIn("c", self.cache)
+        self.assertEqual(self.field_size * 2, self.cache.memory_usage)
+
+    def test_reducing_budget_evicts(self):
+        self.cache.put("a", np.ones((4, 4)))
+        self.cache.put("b", np.ones((4, 4)))
+        self.cache.set_memory_budget(self.field_size)
+
+        self.assertNotIn("a", self.cache)
+        self.assertIn("b", self.cache)
+
+    def test_clear(self):
+        self.cache.put("a", np.ones((4, 4)))
+        self.cache.clear()
+
+        self.assertEqual(0, len(self.cache))
+        self.assertEqual(0, self.cache.memory_usage)
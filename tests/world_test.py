@@ -0,0 +1,275 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+pygame.init()
+pygame.display.set_mode((200, 200))
+
+from src.helper.noise_function import NoiseFunction
+from src.settings import simulation
+from src.terrain.tile import Tile
+from src.terrain.world import World
+
+
+class TestWorld(unittest.TestCase):
+    def setUp(self) -> None:
+        self.world = World(pygame.Rect(0, 0, 100, 80), 10)
+        self.world.wait_for_generation()
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, "terrain.npz")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+
+class TestTerrainSnapshot(TestWorld):
+    def test_load_restores_terrain_without_sampling_noise(self):
+        self.world.save_terrain(self.filename)
+
+        with patch.object(NoiseFunction, "noise_array", side_effect=AssertionError):
+            loaded = World(
+                pygame.Rect(0, 0, 100, 80), 10, terrain_filename=self.filename
+            )
+
+        self.assertTrue(
+            np.array_equal(
+                self.world.generate_height_field(), loaded.generate_height_field()
+            )
+        )
+        self.assertTrue(
+            np.array_equal(
+                self.world.generate_moisture_field(), loaded.generate_moisture_field()
+            )
+        )
+        for function, loaded_function in zip(
+            self.world.height_functions, loaded.height_functions
+        ):
+            self.assertEqual(
+                function.get_parameters(), loaded_function.get_parameters()
+            )
+        self.assertEqual(
+            self.world.tiles_grid[3][4].height, loaded.tiles_grid[3][4].height
+        )
+
+    def test_load_snapshot_of_different_shape(self):
+        self.world.save_terrain(self.filename)
+        other = World(pygame.Rect(0, 0, 50, 50), 10)
+
+        with self.assertRaises(ValueError):
+            other.load_terrain(self.filename)
+
+
+class TestOffsets(TestWorld):
+    def test_offset_change_reuses_cached_noise(self):
+        raw_height_field = self.world._raw_height_field
+        previous_heights = self.world.grid.height.copy()
+
+        with patch.object(NoiseFunction, "noise_array", side_effect=AssertionError):
+            self.world.height_setting.set_value(1.2)
+
+        self.assertIs(raw_height_field, self.world._raw_height_field)
+        self.assertFalse(np.array_equal(previous_heights, self.world.grid.height))
+        heights = self.world.grid.height.copy()
+        biome_ids = self.world.grid.biome_id.copy()
+        tile_height = self.world.tiles_grid[3][4].height
+
+        self.world.terrain_cache.clear()
+        self.world.reload()
+        self.world.wait_for_generation()
+
+        self.assertIsNot(raw_height_field, self.world._raw_height_field)
+        self.assertTrue(np.allclose(heights, self.world.grid.height))
+        self.assertTrue(np.array_equal(biome_ids, self.world.grid.biome_id))
+        self.assertAlmostEqual(tile_height, self.world.tiles_grid[3][4].height)
+
+
+class TestBackgroundGeneration(TestWorld):
+    def test_generated_fields_match_synchronous_generation(self):
+        self.world.height_functions[0].randomise()
+        self.world.reload()
+        self.assertTrue(self.world.generating)
+        self.world.wait_for_generation()
+
+        self.assertFalse(self.world.generating)
+        expected = NoiseFunction.weigh_array(
+            np.arange(self.world.cols) * 10 * self.world.scale_setting._value,
+            np.arange(self.world.rows) * 10 * self.world.scale_setting._value,
+            self.world.height_functions,
+            self.world.height_functions_weights,
+        )
+        self.assertTrue(np.array_equal(expected, self.world.generate_height_field()))
+        self.assertEqual(
+            float(self.world.generate_height_field()[3, 4]),
+            self.world.tiles_grid[3][4].height,
+        )
+
+    def test_tiles_keep_terrain_until_swapped_in(self):
+        height = self.world.tiles_grid[3][4].height
+        with patch("threading.Thread.start"):
+            self.world.height_functions[0].randomise()
+            self.world.reload()
+
+        self.assertTrue(self.world.generating)
+        self.assertFalse(self.world.poll_generation())
+        self.assertEqual(height, self.world.tiles_grid[3][4].height)
+
+    def test_superseded_generation_is_discarded(self):
+        self.world.start_generation()
+        token = self.world._generation_token
+        self.world._generation_result = (token - 1, [])
+
+        self.assertFalse(self.world.poll_generation())
+
+
+class TestPreview(TestWorld):
+    def test_preview_is_drawn_without_changing_tiles(self):
+        height = self.world.tiles_grid[3][4].height
+        self.world.height_functions[0].factor_x.set_value(3)
+
+        self.assertTrue(self.world.previewing)
+        self.assertFalse(self.world.generating)
+        self.assertEqual(height, self.world.tiles_grid[3][4].height)
+        self.assertEqual(
+            (self.world.cols * 10, self.world.rows * 10),
+            self.world.ground_surface.get_size(),
+        )
+
+    def test_preview_is_not_refined_before_settling(self):
+        self.world.height_functions[0].factor_x.set_value(3)
+
+        with patch.object(World, "PREVIEW_SETTLE_TIME", 60):
+            self.world.poll_generation()
+
+        self.assertTrue(self.world.previewing)
+        self.assertFalse(self.world.generating)
+
+    def test_refined_preview_matches_reload(self):
+        self.world.height_functions[0].factor_x.set_value(3)
+        with patch.object(World, "PREVIEW_SETTLE_TIME", 0):
+            self.world.poll_generation()
+        self.world.wait_for_generation()
+        refined = self.world.generate_height_field()
+
+        self.world.terrain_cache.clear()
+        self.world.reload()
+        self.world.wait_for_generation()
+
+        self.assertFalse(self.world.previewing)
+        self.assertTrue(np.array_equal(refined, self.world.generate_height_field()))
+        self.assertEqual(float(refined[3, 4]), self.world.tiles_grid[3][4].height)
+
+
+class TestGround(TestWorld):
+    def test_ground_pixels_match_biome_colors(self):
+        self.world.draw_ground(self.world.grid.biome_id)
+
+        colors = Tile.get_biome_table().colors
+        size = self.world.tile_size
+        self.assertEqual(
+            (self.world.cols * size, self.world.rows * size),
+            self.world.ground_surface.get_size(),
+        )
+        for row in range(self.world.rows):
+            for col in range(self.world.cols):
+                color = colors[self.world.grid.biome_id[row, col]]
+                for x, y in [(0, 0), (size // 2, size // 2), (size - 1, size - 1)]:
+                    pixel = self.world.ground_surface.get_at(
+                        (col * size + x, row * size + y)
+                    )
+                    self.assertEqual(
+                        (color.r, color.g, color.b), (pixel.r, pixel.g, pixel.b)
+                    )
+
+
+class TestRandomise(TestWorld):
+    def test_randomise_freqs_regenerates_once(self):
+        with patch.object(World, "start_generation") as start_generation:
+            with patch.object(World, "preview") as preview:
+                world = World(pygame.Rect(0, 0, 100, 80), 10)
+                world.randomise_freqs()
+
+        # Once for the initial randomisation and once for the explicit call
+        self.assertEqual(2, preview.call_count)
+        self.assertEqual(2, start_generation.call_count)
+
+
+class TestTileLookup(unittest.TestCase):
+    def setUp(self) -> None:
+        self.world = World(pygame.Rect(30, 40, 100, 80), 10)
+        self.world.wait_for_generation()
+
+    def tearDown(self) -> None:
+        pass
+
+    def reference_tiles(self, rect: pygame.Rect) -> list:
+        """
+        The tile lookup of World before it was computed from the tile size.
+        """
+        s = pygame.sprite.Sprite()
+        s.rect = rect.move(-self.world.rect.left, -self.world.rect.top)
+        return [tile for tile in self.world.tiles if s.rect.colliderect(tile.rect)]
+
+    def test_get_tiles_matches_collision(self):
+        for rect in [
+            pygame.Rect(30, 40, 20, 20),
+            pygame.Rect(35, 45, 20, 20),
+            pygame.Rect(0, 0, 45, 55),
+            pygame.Rect(120, 110, 50, 50),
+            pygame.Rect(200, 200, 5, 5),
+            pygame.Rect(60, 60, 1, 1),
+            pygame.Rect(0, 0, 5, 5),
+            pygame.Rect(0, 60, 10, 10),
+            pygame.Rect(60, 0, 10, 10),
+            pygame.Rect(60, 60, 0, 5),
+            pygame.Rect(60, 60, 5, 0),
+        ]:
+            self.assertEqual(self.reference_tiles(rect), self.world.get_tiles(rect))
+
+    def test_get_tiles_does_not_modify_rect(self):
+        rect = pygame.Rect(35, 45, 20, 20)
+        self.world.get_tiles(rect)
+
+        self.assertEqual(pygame.Rect(35, 45, 20, 20), rect)
+
+    def test_get_tile(self):
+        self.assertIs(self.world.tiles_grid[0][0], self.world.get_tile((30, 40)))
+        self.assertIs(self.world.tiles_grid[2][1], self.world.get_tile((49, 69)))
+        self.assertIsNone(self.world.get_tile((29, 40)))
+        self.assertIsNone(self.world.get_tile((130, 60)))
+
+
+class TestSpawning(TestWorld):
+    def setUp(self) -> None:
+        super().setUp()
+        simulation.reset_organisms()
+        heights = np.full((self.world.rows, self.world.cols), 0.5)
+        heights[:, :2] = 0.05
+        self.world.grid.set_terrain(heights, np.full_like(heights, 0.5))
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        simulation.reset_organisms()
+
+    def test_spawn_exact_amount(self):
+        self.world.spawn_plants(50)
+        self.world.spawn_animals(30, weighted=True)
+
+        self.assertEqual(50, len(simulation.plants))
+        self.assertEqual(30, len(simulation.animals))
+        self.assertEqual(50, np.count_nonzero(self.world.grid.plant_id >= 0))
+        self.assertFalse(np.any(self.world.grid.plant_id[:, :2] >= 0))
+
+    def test_spawn_more_than_free_tiles(self):
+        land_tiles = self.world.rows * (self.world.cols - 2)
+        self.world.spawn_plants(land_tiles - 5)
+        self.world.spawn_plants(20)
+
+        self.assertEqual(land_tiles, len(simulation.plants))
+        self.assertEqual(0, len(self.world.grid.free_plant_tiles))